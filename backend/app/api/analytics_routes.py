@@ -8,6 +8,7 @@ import logging
 from typing import Annotated, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 
 from app.models.schemas import (
     HazardCoverageResponse,
@@ -19,9 +20,12 @@ from app.services import AnalyticsService
 
 logger = logging.getLogger(__name__)
 
+# Coverage, impact and statistics payloads can be large; orjson encodes
+# them several times faster than the stdlib json encoder
 router = APIRouter(
     prefix="/analytics",
     tags=["Analytics"],
+    default_response_class=ORJSONResponse,
     responses={
         500: {"model": ErrorResponse, "description": "Internal server error"},
         404: {"model": ErrorResponse, "description": "Resource not found"},
@@ -109,6 +113,7 @@ async def get_hazard_coverage(
 
     **Query Parameters:**
     - `asil`: List of ASIL levels to filter (e.g., `?asil=C&asil=D`)
+    - `summary_only`: Return only the summary counters (omits `hazards`)
 
     **Example Response:**
     ```json
@@ -131,12 +136,13 @@ async def get_hazard_coverage(
 )
 async def get_all_hazards_coverage(
     asil: Annotated[Optional[List[str]], Query()] = None,
+    summary_only: Annotated[bool, Query()] = False,
     service: Annotated[AnalyticsService, Depends(get_analytics_service)] = Depends(),
 ) -> HazardCoverageResponse:
     """Get coverage analysis for all hazards."""
     try:
         logger.info(f"Getting coverage for all hazards (ASIL filter: {asil})")
-        result = service.get_all_hazards_coverage(asil_filter=asil)
+        result = service.get_all_hazards_coverage(asil_filter=asil, summary_only=summary_only)
         return result
 
     except Exception as e:
@@ -147,6 +153,59 @@ async def get_all_hazards_coverage(
         )
 
 
+@router.get(
+    "/coverage/hazards/batch",
+    response_model=HazardCoverageResponse,
+    summary="Get coverage for several hazards",
+    description="""
+    Get coverage analysis for several hazards in one database round-trip.
+
+    **Query Parameters:**
+    - `id`: Hazard IDs to analyze (e.g., `?id=H-001&id=H-002`)
+
+    **Example Response:**
+    ```json
+    {
+        "status": "success",
+        "message": "Coverage analysis for 2 hazard(s)",
+        "data": {
+            "coverage": {
+                "H-001": {"hazard": {...}, "complete_chains": 3, "coverage_status": "full", ...},
+                "H-002": {"hazard": {...}, "complete_chains": 0, "coverage_status": "none", ...}
+            },
+            "not_found": []
+        }
+    }
+    ```
+    """,
+)
+async def get_hazard_coverage_batch(
+    id: Annotated[List[str], Query()],
+    service: Annotated[AnalyticsService, Depends(get_analytics_service)],
+) -> HazardCoverageResponse:
+    """Get coverage analysis for several hazards."""
+    try:
+        logger.info(f"Getting coverage for hazards {id}")
+        coverage = service.get_hazard_coverage_batch(id)
+        not_found = [hazard_id for hazard_id in dict.fromkeys(id) if hazard_id not in coverage]
+
+        return HazardCoverageResponse(
+            status="success",
+            message=f"Coverage analysis for {len(coverage)} hazard(s)",
+            data={
+                "coverage": coverage,
+                "not_found": not_found
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to get hazard coverage batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get hazards coverage: {str(e)}",
+        )
+
+
 @router.get(
     "/coverage/statistics",
     summary="Get coverage statistics",
@@ -268,6 +327,8 @@ async def get_component_impact(
     **Query Parameters:**
     - `component_type`: Filter by component type (hardware, software, system)
     - `limit`: Maximum number of components to return (default: 100)
+    - `after_score`, `after_id`: Continue after this component, taken from the
+      previous page's `next_cursor` (ties in score are ordered by component ID)
 
     **Example Response:**
     ```json
@@ -288,7 +349,8 @@ async def get_component_impact(
                 },
                 ...
             ],
-            "total_analyzed": 100
+            "total_analyzed": 100,
+            "next_cursor": {"after_score": 12, "after_id": "C-BMS-004"}
         }
     }
     ```
@@ -297,6 +359,8 @@ async def get_component_impact(
 async def get_all_components_impact(
     component_type: Annotated[Optional[str], Query()] = None,
     limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    after_score: Annotated[Optional[float], Query()] = None,
+    after_id: Annotated[Optional[str], Query()] = None,
     service: Annotated[AnalyticsService, Depends(get_analytics_service)] = Depends(),
 ) -> ImpactAnalysisResponse:
     """Get impact analysis for all components."""
@@ -304,7 +368,9 @@ async def get_all_components_impact(
         logger.info(f"Getting impact for all components (type: {component_type}, limit: {limit})")
         result = service.get_all_components_impact(
             component_type_filter=component_type,
-            limit=limit
+            limit=limit,
+            after_score=after_score,
+            after_id=after_id
         )
         return result
 
@@ -480,6 +546,52 @@ async def get_database_statistics(
         )
 
 
+@router.get(
+    "/dashboard",
+    response_model=StatisticsResponse,
+    summary="Get dashboard statistics",
+    description="""
+    Get node counts, relationship counts and coverage statistics in one call.
+
+    The underlying queries run concurrently.
+
+    **Example Response:**
+    ```json
+    {
+        "status": "success",
+        "message": "Dashboard statistics retrieved",
+        "data": {
+            "node_counts": {"Hazard": 50, "Component": 120, ...},
+            "relationship_counts": {"MITIGATED_BY": 50, ...},
+            "coverage": {
+                "total_hazards": 50,
+                "fully_covered": 35,
+                "partially_covered": 10,
+                "not_covered": 5,
+                "coverage_percentage": 70.0
+            }
+        }
+    }
+    ```
+    """,
+)
+async def get_dashboard(
+    service: Annotated[AnalyticsService, Depends(get_analytics_service)],
+) -> StatisticsResponse:
+    """Get dashboard statistics."""
+    try:
+        logger.info("Getting dashboard statistics")
+        result = await service.aget_dashboard()
+        return result
+
+    except Exception as e:
+        logger.error(f"Failed to get dashboard statistics: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get dashboard statistics: {str(e)}",
+        )
+
+
 # ============================================================================
 # SEARCH AND FILTER
 # ============================================================================
@@ -488,7 +600,7 @@ async def get_database_statistics(
     "/search/hazards",
     summary="Search hazards",
     description="""
-    Search hazards by text (ID or description).
+    Search hazards by text (words in the description, or an ID prefix).
 
     **Query Parameters:**
     - `q`: Search query
@@ -520,7 +632,7 @@ async def search_hazards(
     "/search/components",
     summary="Search components",
     description="""
-    Search components by text (ID, name, or description).
+    Search components by text (words in the name or description, or an ID prefix).
 
     **Query Parameters:**
     - `q`: Search query
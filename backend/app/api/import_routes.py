@@ -5,9 +5,10 @@ Provides endpoints for importing HARA, FMEA, Requirements, Tests, and Defects da
 """
 
 import logging
-from typing import Annotated
+from typing import Annotated, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel
 
 from app.models.schemas import (
     HARAImportRequest,
@@ -21,6 +22,7 @@ from app.models.schemas import (
     DefectsImportRequest,
     DefectsImportResponse,
     ErrorResponse,
+    ImportValidationResponse,
 )
 from app.services import (
     HARAImportService,
@@ -142,7 +144,7 @@ async def import_hara(
     """Import HARA data into the knowledge graph."""
     try:
         logger.info("Received HARA import request")
-        result = service.import_hara(request)
+        result = await service.aimport_hara(request)
         logger.info(f"HARA import successful: {result.data}")
         return result
 
@@ -221,7 +223,7 @@ async def import_fmea(
     """Import FMEA data into the knowledge graph."""
     try:
         logger.info("Received FMEA import request")
-        result = service.import_fmea(request)
+        result = await service.aimport_fmea(request)
         logger.info(f"FMEA import successful: {result.data}")
         return result
 
@@ -291,7 +293,7 @@ async def import_requirements(
     """Import requirements into the knowledge graph."""
     try:
         logger.info("Received requirements import request")
-        result = service.import_requirements(request)
+        result = await service.aimport_requirements(request)
         logger.info(f"Requirements import successful: {result.data}")
         return result
 
@@ -429,3 +431,57 @@ async def import_defects(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to import defects: {str(e)}",
         )
+
+
+# ============================================================================
+# DRY-RUN VALIDATION
+# ============================================================================
+
+def _validation_counts(request: BaseModel) -> Dict[str, int]:
+    """Count entries per list field; relationships count their pairs."""
+    counts = {}
+    for name in type(request).model_fields:
+        value = getattr(request, name)
+        if isinstance(value, dict):
+            counts[name] = sum(len(pairs) for pairs in value.values())
+        else:
+            counts[name] = len(value)
+    return counts
+
+
+@router.post(
+    "/hara/validate",
+    response_model=ImportValidationResponse,
+    summary="Validate HARA data",
+    description="""
+    Validate a HARA import payload without writing anything.
+
+    Accepts the same body as `POST /import/hara`. Invalid payloads are
+    rejected with 422; valid ones return the number of entries per field.
+    """,
+)
+async def validate_hara(request: HARAImportRequest) -> ImportValidationResponse:
+    """Validate HARA data without touching the knowledge graph."""
+    return ImportValidationResponse(
+        message="HARA data is valid",
+        data=_validation_counts(request),
+    )
+
+
+@router.post(
+    "/fmea/validate",
+    response_model=ImportValidationResponse,
+    summary="Validate FMEA data",
+    description="""
+    Validate an FMEA import payload without writing anything.
+
+    Accepts the same body as `POST /import/fmea`. Invalid payloads are
+    rejected with 422; valid ones return the number of entries per field.
+    """,
+)
+async def validate_fmea(request: FMEAImportRequest) -> ImportValidationResponse:
+    """Validate FMEA data without touching the knowledge graph."""
+    return ImportValidationResponse(
+        message="FMEA data is valid",
+        data=_validation_counts(request),
+    )
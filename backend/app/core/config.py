@@ -5,7 +5,7 @@ Uses Pydantic Settings for environment variable parsing and validation.
 """
 
 from functools import lru_cache
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -92,6 +92,25 @@ class Settings(BaseSettings):
         description="Connection timeout in seconds",
         ge=1,
     )
+    neo4j_concurrent_imports: bool = Field(
+        default=False,
+        description="Run bulk imports as CALL { ... } IN CONCURRENT TRANSACTIONS (Neo4j 5.21+)",
+    )
+    neo4j_import_concurrency: Optional[int] = Field(
+        default=None,
+        description="Concurrent transactions per bulk import (unset: chosen by the server)",
+        ge=1,
+    )
+    neo4j_import_batch_size: int = Field(
+        default=1000,
+        description="Rows per inner transaction for concurrent bulk imports",
+        ge=1,
+    )
+    neo4j_import_chunk_size: int = Field(
+        default=5000,
+        description="Nodes dumped and written per bulk import statement",
+        ge=1,
+    )
 
     # CORS configuration
     cors_origins: List[str] = Field(
@@ -6,6 +6,7 @@ from app.db.neo4j_driver import (
     Neo4jDriver,
     get_neo4j_driver,
     close_neo4j_driver,
+    close_neo4j_async_driver,
 )
 
 # Import all query templates
@@ -16,6 +17,7 @@ __all__ = [
     "Neo4jDriver",
     "get_neo4j_driver",
     "close_neo4j_driver",
+    "close_neo4j_async_driver",
     # Queries module
     "queries",
 ]
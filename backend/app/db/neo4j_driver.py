@@ -5,14 +5,27 @@ Provides singleton database driver with connection pooling, health checks,
 and session management utilities.
 """
 
+import asyncio
 import logging
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, List, Optional
-
-from neo4j import Driver, GraphDatabase, ManagedTransaction, Result, Session
+from typing import Any, Dict, Generator, Iterator, List, Optional
+
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    Driver,
+    GraphDatabase,
+    ManagedTransaction,
+    Record,
+    Result,
+    RoutingControl,
+    Session,
+    SummaryCounters,
+)
 from neo4j.exceptions import ServiceUnavailable, AuthError, Neo4jError
 
 from app.core.config import get_settings
+from app.db import queries
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +40,8 @@ class Neo4jDriver:
 
     _instance: Optional["Neo4jDriver"] = None
     _driver: Optional[Driver] = None
+    _async_driver: Optional[AsyncDriver] = None
+    _async_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def __new__(cls) -> "Neo4jDriver":
         """Ensure singleton instance."""
@@ -83,6 +98,15 @@ class Neo4jDriver:
             self._driver = None
             logger.info("✓ Neo4j driver closed")
 
+    async def close_async(self) -> None:
+        """Close the async database driver, if one was created."""
+        if self._async_driver:
+            logger.info("Closing Neo4j async driver")
+            await self._async_driver.close()
+            self._async_driver = None
+            self._async_loop = None
+            logger.info("✓ Neo4j async driver closed")
+
     @property
     def driver(self) -> Driver:
         """
@@ -98,6 +122,44 @@ class Neo4jDriver:
             raise RuntimeError("Neo4j driver not initialized")
         return self._driver
 
+    @property
+    def async_driver(self) -> AsyncDriver:
+        """
+        Get the async Neo4j driver, creating it on first use.
+
+        An async driver's connections belong to the event loop that opened
+        them and can only be closed from that loop, so the driver is bound to
+        the first loop that uses it. Call close_async on that loop before
+        using the driver from another one.
+
+        Returns:
+            Async Neo4j driver
+
+        Raises:
+            RuntimeError: If called outside a running event loop, or from a
+                loop other than the one the open driver belongs to
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._async_driver is not None and self._async_loop is not loop:
+            raise RuntimeError(
+                "Neo4j async driver is bound to another event loop; "
+                "close it with close_async before switching loops"
+            )
+
+        if self._async_driver is None:
+            settings = get_settings()
+            self._async_driver = AsyncGraphDatabase.driver(
+                settings.neo4j_uri,
+                auth=(settings.neo4j_user, settings.neo4j_password),
+                max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+                max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+                connection_timeout=settings.neo4j_connection_timeout,
+            )
+            self._async_loop = loop
+
+        return self._async_driver
+
     @contextmanager
     def get_session(self, database: Optional[str] = None) -> Generator[Session, None, None]:
         """
@@ -130,6 +192,8 @@ class Neo4jDriver:
         query: str,
         parameters: Optional[Dict[str, Any]] = None,
         database: Optional[str] = None,
+        as_dicts: bool = False,
+        routing: RoutingControl = RoutingControl.WRITE,
     ) -> List[Dict[str, Any]]:
         """
         Execute a Cypher query and return results as list of dictionaries.
@@ -138,6 +202,16 @@ class Neo4jDriver:
             query: Cypher query string
             parameters: Query parameters
             database: Database name (default: from settings)
+            as_dicts: Run through the driver's managed execute_query and
+                convert each record with Result.data, so nodes and
+                relationships come back as plain property dictionaries
+                (no Node/Relationship objects). This also changes how the
+                query runs: it becomes a managed transaction routed by
+                `routing` and retried on transient errors, instead of an
+                auto-commit query on a session
+            routing: Cluster member for as_dicts queries; pass
+                RoutingControl.READ for reads so they can go to followers
+                (ignored without as_dicts)
 
         Returns:
             List of result records as dictionaries
@@ -152,10 +226,87 @@ class Neo4jDriver:
         """
         parameters = parameters or {}
 
+        if as_dicts:
+            return self.driver.execute_query(
+                query,
+                parameters,
+                database_=database or get_settings().neo4j_database,
+                routing_=routing,
+                result_transformer_=Result.data,
+            )
+
         with self.get_session(database=database) as session:
             result = session.run(query, parameters)
             return [dict(record) for record in result]
 
+    async def execute_query_async(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a Cypher query on the async driver.
+
+        Independent queries awaited together (e.g. with asyncio.gather) run
+        concurrently on separate sessions.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Database name (default: from settings)
+
+        Returns:
+            List of result records as dictionaries
+
+        Example:
+            ```python
+            hazards, components = await asyncio.gather(
+                driver.execute_query_async("MATCH (h:Hazard) RETURN count(h) AS n"),
+                driver.execute_query_async("MATCH (c:Component) RETURN count(c) AS n"),
+            )
+            ```
+        """
+        parameters = parameters or {}
+        db_name = database or get_settings().neo4j_database
+
+        async with self.async_driver.session(database=db_name) as session:
+            result = await session.run(query, parameters)
+            return [dict(record) async for record in result]
+
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+    ) -> Iterator[Record]:
+        """
+        Execute a Cypher query and yield records as they arrive.
+
+        Unlike execute_query, records are not buffered into a list; the
+        session stays open until the iterator is exhausted or closed.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Database name (default: from settings)
+
+        Yields:
+            Neo4j result records
+
+        Example:
+            ```python
+            ids = [
+                record["id"]
+                for record in driver.stream_query("MATCH (h:Hazard) RETURN h.id AS id")
+            ]
+            ```
+        """
+        parameters = parameters or {}
+
+        with self.get_session(database=database) as session:
+            yield from session.run(query, parameters)
+
     def execute_write_transaction(
         self,
         query: str,
@@ -190,6 +341,34 @@ class Neo4jDriver:
         with self.get_session(database=database) as session:
             return session.execute_write(_write_tx)
 
+    def execute_write_counters(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+    ) -> SummaryCounters:
+        """
+        Execute a write query in a transaction and return its update counters.
+
+        Use this when the caller needs what the server actually changed
+        (e.g. nodes_created for a MERGE) rather than the returned records.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Database name (default: from settings)
+
+        Returns:
+            Server-reported counters (nodes_created, relationships_created, ...)
+        """
+        parameters = parameters or {}
+
+        def _write_tx(tx: ManagedTransaction) -> SummaryCounters:
+            return tx.run(query, parameters).consume().counters
+
+        with self.get_session(database=database) as session:
+            return session.execute_write(_write_tx)
+
     def execute_read_transaction(
         self,
         query: str,
@@ -336,19 +515,7 @@ class Neo4jDriver:
         """
         try:
             # Get all node labels and their counts
-            query = """
-            CALL db.labels() YIELD label
-            CALL {
-                WITH label
-                MATCH (n)
-                WHERE label IN labels(n)
-                RETURN count(n) as count
-            }
-            RETURN label, count
-            ORDER BY count DESC
-            """
-
-            results = self.execute_query(query)
+            results = self.execute_query(queries.GET_NODE_COUNTS)
             return {record["label"]: record["count"] for record in results}
 
         except Exception as e:
@@ -369,19 +536,7 @@ class Neo4jDriver:
             ```
         """
         try:
-            query = """
-            CALL db.relationshipTypes() YIELD relationshipType
-            CALL {
-                WITH relationshipType
-                MATCH ()-[r]->()
-                WHERE type(r) = relationshipType
-                RETURN count(r) as count
-            }
-            RETURN relationshipType, count
-            ORDER BY count DESC
-            """
-
-            results = self.execute_query(query)
+            results = self.execute_query(queries.GET_RELATIONSHIP_COUNTS)
             return {record["relationshipType"]: record["count"] for record in results}
 
         except Exception as e:
@@ -409,6 +564,16 @@ def get_neo4j_driver() -> Neo4jDriver:
     return _neo4j_driver
 
 
+async def close_neo4j_async_driver() -> None:
+    """
+    Close the global Neo4j async driver, if one was created.
+
+    Should be called during application shutdown, before close_neo4j_driver.
+    """
+    if _neo4j_driver is not None:
+        await _neo4j_driver.close_async()
+
+
 def close_neo4j_driver() -> None:
     """
     Close the global Neo4j driver instance.
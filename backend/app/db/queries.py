@@ -8,7 +8,9 @@ This module contains all Cypher query templates used for:
 - Computing statistics and metrics
 """
 
-from typing import Dict, Any, List
+import functools
+import re
+from typing import Dict, Any, List, Optional, Tuple
 
 
 # ==============================================================================
@@ -283,22 +285,11 @@ RETURN n
 # RELATIONSHIP CREATION QUERIES
 # ==============================================================================
 
-CREATE_RELATIONSHIP = """
+# Any relationship type, passed as $rel_type (see create_relationship_query)
+CREATE_RELATIONSHIP_APOC = """
 MATCH (a {id: $source_id})
 MATCH (b {id: $target_id})
-CREATE (a)-[r:$rel_type $properties]->(b)
-RETURN r
-"""
-
-# Parametrized relationship creation with metadata
-CREATE_RELATIONSHIP_WITH_METADATA = """
-MATCH (a {id: $source_id})
-MATCH (b {id: $target_id})
-CREATE (a)-[r:$rel_type {
-    created_at: datetime(),
-    created_by: $created_by,
-    rationale: $rationale
-}]->(b)
+CALL apoc.create.relationship(a, $rel_type, $properties, b) YIELD rel AS r
 RETURN r
 """
 
@@ -313,14 +304,126 @@ CALL apoc.create.node([node.label], node.properties) YIELD node AS n
 RETURN count(n) AS created_count
 """
 
+# Relationship types that may be written literally into Cypher text
+# (see batch_create_relationships_query); anything else goes through APOC
+RELATIONSHIP_TYPES = frozenset({
+    "ALLOCATED_TO",
+    "ANALYZED_IN",
+    "ASSOCIATED_WITH",
+    "CAN_LEAD_TO",
+    "COMPLIES_WITH",
+    "CONNECTED_TO",
+    "CONTRIBUTES_TO",
+    "COVERS_COMPONENT",
+    "COVERS_SIGNAL",
+    "FOR_FUNCTION",
+    "FOUND_IN",
+    "HAS_FAILURE_MODE",
+    "HAS_FUNCTION",
+    "IMPLEMENTS",
+    "INSTANCE_OF",
+    "IN_SCENARIO",
+    "MITIGATED_BY",
+    "OBSERVED_AT",
+    "OCCURS_IN",
+    "REALIZED_BY",
+    "REFINED_INTO",
+    "REFINED_TO",
+    "RELATED_TO",
+    "USES_SIGNAL",
+    "VERIFIED_BY",
+})
+
+# Endpoint labels per relationship type (source labels, target labels), so
+# relationship writes match endpoints through the per-label id indexes in
+# INDEX_DDL instead of scanning all nodes. Types not listed here keep an
+# unlabelled match, since their endpoints vary between datasets.
+RELATIONSHIP_ENDPOINTS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "ALLOCATED_TO": (
+        ("FunctionalSafetyRequirement", "TechnicalSafetyRequirement"),
+        ("Component",),
+    ),
+    "ANALYZED_IN": (("FailureMode",), ("FMEAEntry",)),
+    "CONTRIBUTES_TO": (("Function",), ("SafetyGoal",)),
+    "FOUND_IN": (("DefectInstance",), ("Component",)),
+    "HAS_FAILURE_MODE": (("Component",), ("FailureMode",)),
+    "IMPLEMENTS": (("Component",), ("Function",)),
+    "MITIGATED_BY": (("Hazard",), ("SafetyGoal",)),
+    "OCCURS_IN": (("Hazard",), ("Scenario",)),
+    "REFINED_TO": (
+        ("SafetyGoal", "FunctionalSafetyRequirement"),
+        ("FunctionalSafetyRequirement", "TechnicalSafetyRequirement"),
+    ),
+    "VERIFIED_BY": (
+        ("FunctionalSafetyRequirement", "TechnicalSafetyRequirement", "Component"),
+        ("TestCase",),
+    ),
+}
+
+# Parallel lists from build_batch_relationships, one index per relationship
 BATCH_CREATE_RELATIONSHIPS = """
-UNWIND $relationships AS rel
-MATCH (a {id: rel.source_id})
-MATCH (b {id: rel.target_id})
-CALL apoc.create.relationship(a, rel.type, rel.properties, b) YIELD rel AS r
+UNWIND range(0, size($sources) - 1) AS i
+MATCH (a {id: $sources[i]})
+MATCH (b {id: $targets[i]})
+CALL apoc.create.relationship(a, $rel_types[i], $properties[i], b) YIELD rel AS r
 RETURN count(r) AS created_count
 """
 
+# ==============================================================================
+# BULK NODE CREATION QUERIES
+# ==============================================================================
+# One statement per import list. Plain creates are built per property set by
+# columnar_create_nodes_query; see also concurrent_bulk_create_nodes_query.
+
+# Labels the bulk query builders accept
+BULK_NODE_LABELS = frozenset({
+    "Component",
+    "DefectInstance",
+    "FMEAEntry",
+    "FailureMode",
+    "FunctionalSafetyRequirement",
+    "Hazard",
+    "SafetyGoal",
+    "Scenario",
+    "TechnicalSafetyRequirement",
+    "TestCase",
+})
+
+# Labels whose id lookups are index-backed (see INDEX_DDL); the labelled
+# lookup builders accept these
+ID_INDEXED_LABELS = BULK_NODE_LABELS | {"Function"}
+
+# Components are shared between FMEA and requirements imports, so they are
+# upserted on id; nodes_created in the summary counters gives the new ones
+MERGE_COMPONENT_BULK = """
+UNWIND $rows AS row
+MERGE (n:Component {id: row.id})
+ON CREATE SET n += row, n.created_at = datetime(), n.updated_at = datetime()
+"""
+
+# Test cases are re-imported as their status changes, so existing ones are
+# updated in place; nodes_created in the summary counters gives the new ones.
+# Like MERGE_COMPONENT_BULK, each MERGE is a unique-index seek only because
+# INDEX_DDL declares the id constraint (applied before the first import).
+CREATE_TEST_CASES_BATCH = """
+UNWIND $rows AS row
+MERGE (t:TestCase {id: row.id})
+ON CREATE SET t = row, t.created_at = datetime(), t.updated_at = datetime()
+ON MATCH SET t += row, t.updated_at = datetime()
+"""
+
+
+# ==============================================================================
+# EXISTENCE QUERIES
+# ==============================================================================
+
+# Any label; with a known label use existing_node_ids_query instead
+GET_EXISTING_NODE_IDS = """
+UNWIND $ids AS node_id
+MATCH (n {id: node_id})
+RETURN collect(DISTINCT n.id) AS present
+"""
+
 
 # ==============================================================================
 # MERGE QUERIES (CREATE OR UPDATE)
@@ -365,6 +468,34 @@ RETURN {
 } AS coverage
 """
 
+GET_HAZARDS_COVERAGE_BATCH = """
+UNWIND $hazard_ids AS hazard_id
+MATCH (h:Hazard {id: hazard_id})
+OPTIONAL MATCH coverage_path = (h)-[:MITIGATED_BY]->(sg:SafetyGoal)
+                               -[:REFINED_TO]->(fsr:FunctionalSafetyRequirement)
+                               -[:REFINED_TO]->(tsr:TechnicalSafetyRequirement)
+                               -[:VERIFIED_BY]->(tc:TestCase)
+WITH hazard_id, h,
+     collect(DISTINCT sg) AS safety_goals,
+     collect(DISTINCT fsr) AS fsrs,
+     collect(DISTINCT tsr) AS tsrs,
+     collect(DISTINCT tc) AS test_cases,
+     count(DISTINCT coverage_path) AS complete_chains
+RETURN hazard_id, {
+    hazard: h,
+    safety_goals: safety_goals,
+    fsrs: fsrs,
+    tsrs: tsrs,
+    test_cases: test_cases,
+    complete_chains: complete_chains,
+    coverage_status: CASE
+        WHEN complete_chains > 0 THEN 'full'
+        WHEN size(safety_goals) > 0 THEN 'partial'
+        ELSE 'none'
+    END
+} AS coverage
+"""
+
 GET_ALL_HAZARDS_COVERAGE = """
 MATCH (h:Hazard)
 OPTIONAL MATCH (h)-[:MITIGATED_BY]->(sg:SafetyGoal)
@@ -394,6 +525,65 @@ RETURN {
 ORDER BY h.asil DESC, h.id
 """
 
+# One index seek per ASIL level (hazard_asil_idx); repeated levels collapse
+# in the per-hazard aggregation below
+GET_ALL_HAZARDS_COVERAGE_ASIL_FILTERED = """
+UNWIND $asil_levels AS asil_level
+MATCH (h:Hazard {asil: asil_level})
+OPTIONAL MATCH (h)-[:MITIGATED_BY]->(sg:SafetyGoal)
+                  -[:REFINED_TO]->(fsr:FunctionalSafetyRequirement)
+                  -[:REFINED_TO]->(tsr:TechnicalSafetyRequirement)
+                  -[:VERIFIED_BY]->(tc:TestCase)
+WITH h,
+     collect(DISTINCT sg.id) AS safety_goals,
+     collect(DISTINCT fsr.id) AS fsrs,
+     collect(DISTINCT tsr.id) AS tsrs,
+     collect(DISTINCT tc.id) AS test_cases,
+     count(DISTINCT tc) AS test_count
+RETURN {
+    hazard_id: h.id,
+    description: h.description,
+    asil: h.asil,
+    safety_goals: safety_goals,
+    fsrs: fsrs,
+    tsrs: tsrs,
+    test_cases: test_cases,
+    coverage_status: CASE
+        WHEN test_count > 0 THEN 'full'
+        WHEN size(safety_goals) > 0 THEN 'partial'
+        ELSE 'none'
+    END
+} AS coverage
+ORDER BY h.asil DESC, h.id
+"""
+
+# Summary counters only; $asil_levels may be null to include every hazard
+GET_HAZARDS_COVERAGE_SUMMARY = """
+MATCH (h:Hazard)
+WHERE $asil_levels IS NULL OR h.asil IN $asil_levels
+OPTIONAL MATCH (h)-[:MITIGATED_BY]->(sg:SafetyGoal)
+                  -[:REFINED_TO]->(fsr:FunctionalSafetyRequirement)
+                  -[:REFINED_TO]->(tsr:TechnicalSafetyRequirement)
+                  -[:VERIFIED_BY]->(tc:TestCase)
+WITH h, count(DISTINCT sg) AS safety_goal_count, count(DISTINCT tc) AS test_count
+WITH
+    count(h) AS total_hazards,
+    sum(CASE WHEN test_count > 0 THEN 1 ELSE 0 END) AS fully_covered,
+    sum(CASE WHEN test_count = 0 AND safety_goal_count > 0 THEN 1 ELSE 0 END) AS partially_covered,
+    sum(CASE WHEN safety_goal_count = 0 THEN 1 ELSE 0 END) AS not_covered
+RETURN {
+    total_hazards: total_hazards,
+    fully_covered: fully_covered,
+    partially_covered: partially_covered,
+    not_covered: not_covered,
+    coverage_percentage: CASE
+        WHEN total_hazards > 0
+        THEN toFloat(fully_covered) / total_hazards * 100
+        ELSE 0
+    END
+} AS summary
+"""
+
 GET_COVERAGE_STATISTICS = """
 MATCH (h:Hazard)
 OPTIONAL MATCH (h)-[:MITIGATED_BY]->(sg:SafetyGoal)
@@ -453,6 +643,9 @@ RETURN {
 } AS impact
 """
 
+# Ranked by impact score, ties broken by component ID. Pass the last row's
+# score and ID as $after_score/$after_id to get the next page (keyset
+# pagination), or null for the first page.
 GET_ALL_COMPONENTS_IMPACT = """
 MATCH (c:Component)
 OPTIONAL MATCH (c)-[:IMPLEMENTS]->(f:Function)
@@ -464,6 +657,11 @@ WITH c,
      count(DISTINCT sg) AS safety_goal_count,
      count(DISTINCT fm) AS failure_mode_count,
      max(h.asil) AS max_asil
+WITH c, hazard_count, safety_goal_count, failure_mode_count, max_asil,
+     hazard_count * 10 + safety_goal_count * 5 + failure_mode_count * 3 AS impact_score
+WHERE $after_score IS NULL
+   OR impact_score < $after_score
+   OR (impact_score = $after_score AND c.id > $after_id)
 RETURN {
     component_id: c.id,
     name: c.name,
@@ -472,9 +670,41 @@ RETURN {
     safety_goal_count: safety_goal_count,
     failure_mode_count: failure_mode_count,
     max_asil: max_asil,
-    impact_score: hazard_count * 10 + safety_goal_count * 5 + failure_mode_count * 3
+    impact_score: impact_score
 } AS impact
-ORDER BY impact.impact_score DESC
+ORDER BY impact.impact_score DESC, impact.component_id ASC
+LIMIT $limit
+"""
+
+GET_ALL_COMPONENTS_IMPACT_TYPE_FILTERED = """
+MATCH (c:Component)
+WHERE c.component_type = $component_type
+OPTIONAL MATCH (c)-[:IMPLEMENTS]->(f:Function)
+                  -[:CONTRIBUTES_TO]->(sg:SafetyGoal)
+                  <-[:MITIGATED_BY]-(h:Hazard)
+OPTIONAL MATCH (c)-[:HAS_FAILURE_MODE]->(fm:FailureMode)
+WITH c,
+     count(DISTINCT h) AS hazard_count,
+     count(DISTINCT sg) AS safety_goal_count,
+     count(DISTINCT fm) AS failure_mode_count,
+     max(h.asil) AS max_asil
+WITH c, hazard_count, safety_goal_count, failure_mode_count, max_asil,
+     hazard_count * 10 + safety_goal_count * 5 + failure_mode_count * 3 AS impact_score
+WHERE $after_score IS NULL
+   OR impact_score < $after_score
+   OR (impact_score = $after_score AND c.id > $after_id)
+RETURN {
+    component_id: c.id,
+    name: c.name,
+    component_type: c.component_type,
+    hazard_count: hazard_count,
+    safety_goal_count: safety_goal_count,
+    failure_mode_count: failure_mode_count,
+    max_asil: max_asil,
+    impact_score: impact_score
+} AS impact
+ORDER BY impact.impact_score DESC, impact.component_id ASC
+LIMIT $limit
 """
 
 
@@ -483,18 +713,22 @@ ORDER BY impact.impact_score DESC
 # ==============================================================================
 
 GET_TRACEABILITY_CHAIN = """
-MATCH path = (h:Hazard {id: $hazard_id})-[:MITIGATED_BY]->(sg:SafetyGoal)
-                                       -[:REFINED_TO]->(fsr:FunctionalSafetyRequirement)
-                                       -[:REFINED_TO]->(tsr:TechnicalSafetyRequirement)
-                                       -[:VERIFIED_BY]->(tc:TestCase)
-RETURN {
-    hazard: h,
-    safety_goal: sg,
-    fsr: fsr,
-    tsr: tsr,
-    test_case: tc,
-    path: path
-} AS chain
+MATCH (h:Hazard {id: $hazard_id})
+OPTIONAL MATCH path = (h)-[:MITIGATED_BY]->(sg:SafetyGoal)
+                         -[:REFINED_TO]->(fsr:FunctionalSafetyRequirement)
+                         -[:REFINED_TO]->(tsr:TechnicalSafetyRequirement)
+                         -[:VERIFIED_BY]->(tc:TestCase)
+RETURN CASE
+    WHEN path IS NULL THEN null
+    ELSE {
+        hazard: h,
+        safety_goal: sg,
+        fsr: fsr,
+        tsr: tsr,
+        test_case: tc,
+        path: path
+    }
+END AS chain
 """
 
 GET_REQUIREMENT_TRACEABILITY = """
@@ -527,12 +761,13 @@ RETURN type(r) AS relationship_type, count(*) AS count
 ORDER BY count DESC
 """
 
+# One row per node type with an {asil: count} map
 GET_ASIL_DISTRIBUTION = """
 MATCH (n)
 WHERE n.asil IS NOT NULL
-WITH labels(n)[0] AS node_type, n.asil AS asil
-RETURN node_type, asil, count(*) AS count
-ORDER BY node_type, asil
+WITH labels(n)[0] AS node_type, n.asil AS asil, count(*) AS count
+RETURN node_type, apoc.map.fromPairs(collect([asil, count])) AS distribution
+ORDER BY node_type
 """
 
 GET_TEST_STATUS_STATISTICS = """
@@ -575,6 +810,83 @@ RETURN {
 """
 
 
+# All statistics sections in one round-trip. Every subquery aggregates, so each
+# yields exactly one row even on an empty database.
+GET_DATABASE_STATISTICS = """
+CALL {
+    MATCH (n)
+    UNWIND labels(n) AS label
+    WITH label, count(*) AS count
+    RETURN collect({label: label, count: count}) AS node_stats
+}
+CALL {
+    MATCH ()-[r]->()
+    WITH type(r) AS relationship_type, count(*) AS count
+    RETURN collect({relationship_type: relationship_type, count: count}) AS relationship_stats
+}
+CALL {
+    MATCH (n)
+    WHERE n.asil IS NOT NULL
+    WITH labels(n)[0] AS node_type, n.asil AS asil, count(*) AS count
+    WITH node_type, apoc.map.fromPairs(collect([asil, count])) AS distribution
+    RETURN apoc.map.fromPairs(collect([node_type, distribution])) AS asil_distribution
+}
+CALL {
+    MATCH (tc:TestCase)
+    WITH tc.status AS status, count(*) AS count
+    RETURN collect({status: status, count: count}) AS test_stats
+}
+CALL {
+    MATCH (n)
+    WITH count(n) AS total_nodes
+    OPTIONAL MATCH ()-[r]->()
+    WITH total_nodes, count(r) AS total_relationships
+    OPTIONAL MATCH (h:Hazard)
+    OPTIONAL MATCH (h)-[:MITIGATED_BY]->()-[:REFINED_TO*]->()-[:VERIFIED_BY]->(tc:TestCase)
+    WITH total_nodes, total_relationships,
+         count(DISTINCT h) AS total_hazards,
+         count(DISTINCT tc) AS verified_hazards
+    RETURN {
+        total_nodes: total_nodes,
+        total_relationships: total_relationships,
+        total_hazards: total_hazards,
+        verified_hazards: verified_hazards,
+        coverage_percentage: CASE
+            WHEN total_hazards > 0
+            THEN toFloat(verified_hazards) / total_hazards * 100
+            ELSE 0
+        END
+    } AS summary
+}
+RETURN node_stats, relationship_stats, asil_distribution, test_stats, summary
+"""
+
+# Per-label and per-type counts (used by Neo4jDriver.get_*_counts)
+GET_NODE_COUNTS = """
+CALL db.labels() YIELD label
+CALL {
+    WITH label
+    MATCH (n)
+    WHERE label IN labels(n)
+    RETURN count(n) as count
+}
+RETURN label, count
+ORDER BY count DESC
+"""
+
+GET_RELATIONSHIP_COUNTS = """
+CALL db.relationshipTypes() YIELD relationshipType
+CALL {
+    WITH relationshipType
+    MATCH ()-[r]->()
+    WHERE type(r) = relationshipType
+    RETURN count(r) as count
+}
+RETURN relationshipType, count
+ORDER BY count DESC
+"""
+
+
 # ==============================================================================
 # SEARCH QUERIES
 # ==============================================================================
@@ -587,10 +899,17 @@ ORDER BY score DESC
 LIMIT $limit
 """
 
+# $search_query comes from build_fulltext_query; IDs match by prefix
 SEARCH_HAZARDS = """
-MATCH (h:Hazard)
-WHERE h.description CONTAINS $search_text
-   OR h.id CONTAINS $search_text
+CALL {
+    CALL db.index.fulltext.queryNodes('hazard_description_fulltext', $search_query)
+    YIELD node
+    RETURN node AS h
+    UNION
+    MATCH (h:Hazard)
+    WHERE h.id STARTS WITH $search_text
+    RETURN h
+}
 RETURN h
 ORDER BY h.asil DESC, h.id
 LIMIT $limit
@@ -605,11 +924,17 @@ ORDER BY req.asil DESC, req.id
 LIMIT $limit
 """
 
+# $search_query comes from build_fulltext_query; IDs match by prefix
 SEARCH_COMPONENTS = """
-MATCH (c:Component)
-WHERE c.name CONTAINS $search_text
-   OR c.description CONTAINS $search_text
-   OR c.id CONTAINS $search_text
+CALL {
+    CALL db.index.fulltext.queryNodes('component_search_fulltext', $search_query)
+    YIELD node
+    RETURN node AS c
+    UNION
+    MATCH (c:Component)
+    WHERE c.id STARTS WITH $search_text
+    RETURN c
+}
 RETURN c
 ORDER BY c.name
 LIMIT $limit
@@ -648,6 +973,15 @@ RETURN tc
 ORDER BY tc.status, tc.id
 """
 
+# One row if the component exists (defects possibly empty), no rows otherwise
+GET_DEFECTS_BY_COMPONENT = """
+MATCH (c:Component {id: $component_id})
+OPTIONAL MATCH (d:DefectInstance)-[:FOUND_IN]->(c)
+WITH c, d
+ORDER BY d.severity DESC, d.detected_date DESC
+RETURN c.id AS component_id, collect(d) AS defects
+"""
+
 
 # ==============================================================================
 # DELETION QUERIES
@@ -674,6 +1008,19 @@ MATCH (n)
 DETACH DELETE n
 """
 
+# WARNING: Use with extreme caution
+# Same as DELETE_ALL, but commits every 10K nodes instead of building one
+# transaction state holding the whole graph
+DELETE_ALL_BATCHED = """
+CALL apoc.periodic.iterate(
+    "MATCH (n) RETURN n",
+    "DETACH DELETE n",
+    {batchSize: 10000, parallel: false}
+)
+YIELD batches, total
+RETURN batches, total
+"""
+
 
 # ==============================================================================
 # UPDATE QUERIES
@@ -731,6 +1078,33 @@ LIMIT 10
 """
 
 
+# ==============================================================================
+# INDEX BOOTSTRAP
+# ==============================================================================
+
+# Indexes the service queries rely on, applied at startup. Names match
+# data/schema/neo4j_schema.cypher so both can run against the same database.
+INDEX_DDL = [
+    # ID lookups (uniqueness constraints are backed by a range index)
+    "CREATE CONSTRAINT hazard_id_unique IF NOT EXISTS FOR (n:Hazard) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT scenario_id_unique IF NOT EXISTS FOR (n:Scenario) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT safety_goal_id_unique IF NOT EXISTS FOR (n:SafetyGoal) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT fsr_id_unique IF NOT EXISTS FOR (n:FunctionalSafetyRequirement) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT tsr_id_unique IF NOT EXISTS FOR (n:TechnicalSafetyRequirement) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT component_id_unique IF NOT EXISTS FOR (n:Component) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT function_id_unique IF NOT EXISTS FOR (n:Function) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT fmea_entry_id_unique IF NOT EXISTS FOR (n:FMEAEntry) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT test_case_id_unique IF NOT EXISTS FOR (n:TestCase) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT defect_instance_id_unique IF NOT EXISTS FOR (n:DefectInstance) REQUIRE n.id IS UNIQUE",
+    "CREATE INDEX failure_mode_id_idx IF NOT EXISTS FOR (n:FailureMode) ON (n.id)",
+    # ASIL filters
+    "CREATE INDEX hazard_asil_idx IF NOT EXISTS FOR (n:Hazard) ON (n.asil)",
+    # Text search
+    "CREATE FULLTEXT INDEX hazard_description_fulltext IF NOT EXISTS FOR (n:Hazard) ON EACH [n.description]",
+    "CREATE FULLTEXT INDEX component_search_fulltext IF NOT EXISTS FOR (n:Component) ON EACH [n.name, n.description]",
+]
+
+
 # ==============================================================================
 # UTILITY FUNCTIONS
 # ==============================================================================
@@ -768,24 +1142,383 @@ def build_batch_nodes(nodes: List[Dict[str, Any]], label: str) -> List[Dict[str,
     ]
 
 
+def _label_expression(labels: Tuple[str, ...]) -> str:
+    """
+    Format labels as a node label expression (":A" or ":A|B"), or "" for none.
+
+    Args:
+        labels: Node labels, each in ID_INDEXED_LABELS
+
+    Returns:
+        Label expression to append to a node variable
+
+    Raises:
+        ValueError: If a label has no id index
+    """
+    for label in labels:
+        if label not in ID_INDEXED_LABELS:
+            raise ValueError(f"Unknown node label: {label}")
+
+    return ":" + "|".join(labels) if labels else ""
+
+
+def _endpoint_labels(rel_type: str) -> Tuple[str, str]:
+    """
+    Get the source and target label expressions for a relationship type.
+
+    Args:
+        rel_type: Relationship type
+
+    Returns:
+        (source, target) label expressions; both "" if the type's endpoints
+        are not listed in RELATIONSHIP_ENDPOINTS
+    """
+    source_labels, target_labels = RELATIONSHIP_ENDPOINTS.get(rel_type, ((), ()))
+    return _label_expression(source_labels), _label_expression(target_labels)
+
+
+@functools.lru_cache(maxsize=64)
+def existing_node_ids_query(label: str) -> str:
+    """
+    Build a query returning which of $ids exist as nodes with a given label.
+
+    Args:
+        label: Node label, must be in ID_INDEXED_LABELS
+
+    Returns:
+        Cypher query taking $ids and returning a "present" list
+
+    Raises:
+        ValueError: If label has no id index
+    """
+    return f"""
+UNWIND $ids AS node_id
+MATCH (n{_label_expression((label,))} {{id: node_id}})
+RETURN collect(DISTINCT n.id) AS present
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def get_node_query(label: str) -> str:
+    """
+    Build a query returning the node with a given label and $id.
+
+    Args:
+        label: Node label, must be in ID_INDEXED_LABELS
+
+    Returns:
+        Cypher query taking $id and returning "n"
+
+    Raises:
+        ValueError: If label has no id index
+    """
+    return f"""
+MATCH (n{_label_expression((label,))} {{id: $id}})
+RETURN n
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def create_relationship_query(rel_type: str) -> str:
+    """
+    Build the single-relationship query for a relationship type.
+
+    Known types get the type (and their endpoint labels, see
+    RELATIONSHIP_ENDPOINTS) written into the Cypher, so each type has one
+    fixed statement string (and one cached server plan); the same string
+    object is returned on every call. Other types fall back to
+    CREATE_RELATIONSHIP_APOC.
+
+    Args:
+        rel_type: Relationship type
+
+    Returns:
+        Cypher query taking $source_id, $target_id, $rel_type and $properties
+    """
+    if rel_type not in RELATIONSHIP_TYPES:
+        return CREATE_RELATIONSHIP_APOC
+
+    source, target = _endpoint_labels(rel_type)
+    return f"""
+MATCH (a{source} {{id: $source_id}})
+MATCH (b{target} {{id: $target_id}})
+CREATE (a)-[r:{rel_type}]->(b)
+SET r = $properties
+RETURN r
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def batch_create_relationships_query(rel_type: str) -> str:
+    """
+    Build a batch relationship query with the type written into the Cypher.
+
+    A literal type lets Neo4j plan a native CREATE instead of calling
+    apoc.create.relationship for every row, and lets the endpoints be
+    matched by label (see RELATIONSHIP_ENDPOINTS).
+
+    Args:
+        rel_type: Relationship type, must be in RELATIONSHIP_TYPES
+
+    Returns:
+        Cypher query taking the parallel lists from build_batch_relationships
+
+    Raises:
+        ValueError: If rel_type is not a known relationship type
+    """
+    if rel_type not in RELATIONSHIP_TYPES:
+        raise ValueError(f"Unknown relationship type: {rel_type}")
+
+    source, target = _endpoint_labels(rel_type)
+    return f"""
+UNWIND range(0, size($sources) - 1) AS i
+MATCH (a{source} {{id: $sources[i]}})
+MATCH (b{target} {{id: $targets[i]}})
+CREATE (a)-[r:{rel_type}]->(b)
+SET r = $properties[i]
+RETURN count(r) AS created_count
+"""
+
+
+_PROPERTY_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def build_node_columns(rows: List[Dict[str, Any]]) -> Tuple[List[str], List[List[Any]]]:
+    """
+    Transpose node property rows into one list per property.
+
+    Each key is sent once instead of once per row, and each column is a
+    homogeneous list, which packs smaller than a list of maps.
+
+    Args:
+        rows: Node property dictionaries (keys may differ between rows)
+
+    Returns:
+        (keys, columns) with columns[k][i] the value of keys[k] for row i,
+        None where a row has no such property
+    """
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    columns = [[row.get(key) for row in rows] for key in keys]
+    return keys, columns
+
+
+def columnar_create_nodes_query(label: str, keys: List[str]) -> str:
+    """
+    Build a bulk node query reading properties from parallel columns.
+
+    Setting a property to null is a no-op on a new node, so rows missing a
+    key simply do not get that property.
+
+    Args:
+        label: Node label, must be in BULK_NODE_LABELS
+        keys: Property names, in the order of the $columns parameter
+
+    Returns:
+        Cypher query taking $count and $columns from build_node_columns
+        (count created nodes from the summary counters)
+
+    Raises:
+        ValueError: If label is unknown or a key is not a plain property name
+    """
+    return _columnar_create_nodes_query(label, tuple(keys))
+
+
+@functools.lru_cache(maxsize=64)
+def _columnar_create_nodes_query(label: str, keys: Tuple[str, ...]) -> str:
+    """Build (once per label and key tuple) the query for columnar_create_nodes_query."""
+    if label not in BULK_NODE_LABELS:
+        raise ValueError(f"Unknown node label: {label}")
+    for key in keys:
+        if not _PROPERTY_KEY.match(key):
+            raise ValueError(f"Invalid property name: {key}")
+
+    assignments = "".join(
+        f"    n.{key} = $columns[{index}][i],\n" for index, key in enumerate(keys)
+    )
+    return f"""
+UNWIND range(0, $count - 1) AS i
+CREATE (n:{label})
+SET
+{assignments}    n.created_at = datetime(),
+    n.updated_at = datetime()
+"""
+
+
+def _concurrent_transactions_clause(concurrency: Optional[int]) -> str:
+    """
+    Build the IN ... CONCURRENT TRANSACTIONS suffix of a CALL subquery.
+
+    Args:
+        concurrency: Number of concurrent transactions (None lets the server decide)
+
+    Returns:
+        Clause text; the batch size is left to the $batch_size parameter
+    """
+    if concurrency is None:
+        return "IN CONCURRENT TRANSACTIONS OF $batch_size ROWS"
+    return f"IN {int(concurrency)} CONCURRENT TRANSACTIONS OF $batch_size ROWS"
+
+
+@functools.lru_cache(maxsize=64)
+def concurrent_bulk_create_nodes_query(label: str, concurrency: Optional[int] = None) -> str:
+    """
+    Build a bulk node query that commits in parallel inner transactions.
+
+    Rows are merged on id so that re-running a partially committed import
+    does not duplicate nodes; only rows that created a node are counted, so
+    matched nodes are not reported as created. Must run in an auto-commit
+    transaction (Neo4jDriver.execute_query), not a managed one.
+
+    Args:
+        label: Node label, must be in BULK_NODE_LABELS
+        concurrency: Number of concurrent transactions (None lets the server decide)
+
+    Returns:
+        Cypher query taking $rows and $batch_size
+
+    Raises:
+        ValueError: If label is not a known bulk node label
+    """
+    if label not in BULK_NODE_LABELS:
+        raise ValueError(f"Unknown node label: {label}")
+
+    return f"""
+UNWIND $rows AS row
+CALL {{
+    WITH row
+    MERGE (n:{label} {{id: row.id}})
+    ON CREATE SET n = row, n.created_at = datetime(), n.updated_at = datetime(),
+        n.__import_created = true
+    WITH n, n.__import_created IS NOT NULL AS created
+    REMOVE n.__import_created
+    RETURN created
+}} {_concurrent_transactions_clause(concurrency)}
+RETURN count(CASE WHEN created THEN 1 END) AS created_count
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def concurrent_bulk_create_relationships_query(
+    rel_type: str,
+    concurrency: Optional[int] = None
+) -> str:
+    """
+    Build a batch relationship query that commits in parallel inner transactions.
+
+    Edges are merged so concurrent inner transactions and retries do not
+    duplicate them; only edges actually created are counted. Must run in an
+    auto-commit transaction.
+
+    Args:
+        rel_type: Relationship type, must be in RELATIONSHIP_TYPES
+        concurrency: Number of concurrent transactions (None lets the server decide)
+
+    Returns:
+        Cypher query taking the parallel lists from build_batch_relationships
+        plus $batch_size
+
+    Raises:
+        ValueError: If rel_type is not a known relationship type
+    """
+    if rel_type not in RELATIONSHIP_TYPES:
+        raise ValueError(f"Unknown relationship type: {rel_type}")
+
+    source, target = _endpoint_labels(rel_type)
+    return f"""
+UNWIND range(0, size($sources) - 1) AS i
+CALL {{
+    WITH i
+    MATCH (a{source} {{id: $sources[i]}})
+    MATCH (b{target} {{id: $targets[i]}})
+    MERGE (a)-[r:{rel_type}]->(b)
+    ON CREATE SET r = $properties[i], r.__import_created = true
+    WITH r, r.__import_created IS NOT NULL AS created
+    REMOVE r.__import_created
+    RETURN created
+}} {_concurrent_transactions_clause(concurrency)}
+RETURN count(CASE WHEN created THEN 1 END) AS created_count
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def batch_create_relationship_pairs_query(rel_type: str) -> str:
+    """
+    Build a batch query for property-less relationships given as pairs.
+
+    $pairs is the [source_id, target_id] list as imported, so no per-edge
+    map or parallel lists have to be built in Python. Edges are merged, so
+    re-importing the same pairs does not duplicate them.
+
+    Args:
+        rel_type: Relationship type, must be in RELATIONSHIP_TYPES
+
+    Returns:
+        Cypher query taking $pairs (count created relationships from the
+        summary counters)
+
+    Raises:
+        ValueError: If rel_type is not a known relationship type
+    """
+    if rel_type not in RELATIONSHIP_TYPES:
+        raise ValueError(f"Unknown relationship type: {rel_type}")
+
+    source, target = _endpoint_labels(rel_type)
+    return f"""
+UNWIND $pairs AS pair
+MATCH (a{source} {{id: pair[0]}})
+MATCH (b{target} {{id: pair[1]}})
+MERGE (a)-[r:{rel_type}]->(b)
+"""
+
+
 def build_batch_relationships(
     relationships: List[tuple[str, str, str, Dict[str, Any]]]
-) -> List[Dict[str, Any]]:
+) -> Dict[str, List[Any]]:
     """
-    Build batch relationships list for UNWIND query.
+    Build parallel relationship lists for the indexed UNWIND batch query.
 
     Args:
         relationships: List of (source_id, target_id, rel_type, properties) tuples
 
     Returns:
-        List formatted for batch creation
+        Dictionary of equal-length "sources", "targets", "rel_types" and
+        "properties" lists, ready to pass as query parameters
     """
-    return [
-        {
-            "source_id": source,
-            "target_id": target,
-            "type": rel_type,
-            "properties": props or {}
-        }
-        for source, target, rel_type, props in relationships
-    ]
+    sources: List[str] = []
+    targets: List[str] = []
+    rel_types: List[str] = []
+    properties: List[Dict[str, Any]] = []
+
+    for source, target, rel_type, props in relationships:
+        sources.append(source)
+        targets.append(target)
+        rel_types.append(rel_type)
+        properties.append(props or {})
+
+    return {
+        "sources": sources,
+        "targets": targets,
+        "rel_types": rel_types,
+        "properties": properties
+    }
+
+
+def build_fulltext_query(search_text: str) -> str:
+    """
+    Turn free text into a Lucene query for the full-text search indexes.
+
+    Words are lowercased, Lucene operators escaped and every word becomes a
+    prefix match, so
+    "unintended accel" finds "Unintended acceleration".
+
+    Args:
+        search_text: Raw user search text
+
+    Returns:
+        Lucene query string (empty if the text has no words)
+    """
+    terms = (
+        re.sub(r'([+\-!(){}\[\]^"~*?:\\/&|])', r"\\\1", word.lower()) + "*"
+        for word in search_text.split()
+    )
+    return " AND ".join(terms)
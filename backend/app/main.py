@@ -10,11 +10,12 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.core.config import get_settings
-from app.db.neo4j_driver import close_neo4j_driver, get_neo4j_driver
+from app.db.neo4j_driver import close_neo4j_async_driver, close_neo4j_driver, get_neo4j_driver
 from app.api import import_router, analytics_router
+from app.services import BaseService
 
 # Configure logging
 logging.basicConfig(
@@ -50,6 +51,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if health["status"] == "healthy":
             logger.info("✓ Database connection established")
 
+            BaseService(driver).ensure_indexes()
+            logger.info("✓ Database indexes ensured")
+
             # Log node and relationship counts
             node_counts = driver.get_node_counts()
             if node_counts:
@@ -76,6 +80,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("=" * 70)
 
     # Close database connection
+    await close_neo4j_async_driver()
     close_neo4j_driver()
     logger.info("✓ Database connection closed")
 
@@ -87,11 +92,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 # Create FastAPI application
 settings = get_settings()
 
+# Encode route return values with orjson by default (the import routes too,
+# not just the analytics router); explicit JSONResponse returns are unchanged
 app = FastAPI(
     title=settings.api_title,
     version=settings.api_version,
     description=settings.api_description,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -293,12 +301,14 @@ async def root() -> JSONResponse:
                 "analytics": {
                     "hazard_coverage": "GET /analytics/coverage/hazard/{id}",
                     "all_hazards_coverage": "GET /analytics/coverage/hazards",
+                    "hazards_coverage_batch": "GET /analytics/coverage/hazards/batch?id={id}",
                     "coverage_statistics": "GET /analytics/coverage/statistics",
                     "component_impact": "GET /analytics/impact/component/{id}",
                     "all_components_impact": "GET /analytics/impact/components",
                     "traceability_chain": "GET /analytics/traceability/hazard/{id}",
                     "requirement_traceability": "GET /analytics/traceability/requirement/{id}",
                     "statistics": "GET /analytics/statistics",
+                    "dashboard": "GET /analytics/dashboard",
                     "search_hazards": "GET /analytics/search/hazards?q={query}",
                     "search_components": "GET /analytics/search/components?q={query}",
                     "filter_hazards": "GET /analytics/filter/hazards?asil={level}",
@@ -59,6 +59,7 @@ from app.models.schemas import (
     APIResponse,
     ErrorDetail,
     ErrorResponse,
+    ImportValidationResponse,
     # HARA import
     HARAImportRequest,
     HARAImportResponse,
@@ -124,6 +125,7 @@ __all__ = [
     "APIResponse",
     "ErrorDetail",
     "ErrorResponse",
+    "ImportValidationResponse",
     "HARAImportRequest",
     "HARAImportResponse",
     "FMEAImportRequest",
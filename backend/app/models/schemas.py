@@ -23,6 +23,9 @@ from app.models.nodes import (
 )
 from app.models.enums import ASILLevel, CoverageStatus
 
+# Shared status value for all successful responses
+STATUS_SUCCESS = "success"
+
 
 # ============================================================================
 # COMMON RESPONSE MODELS
@@ -52,6 +55,27 @@ class ErrorResponse(APIResponse):
     errors: List[ErrorDetail] = Field(default_factory=list, description="List of errors")
 
 
+class ImportValidationResponse(APIResponse):
+    """Response model for import dry runs (validated, nothing written)."""
+
+    status: str = Field(default=STATUS_SUCCESS, description="Validation status")
+    data: Dict[str, int] = Field(..., description="Number of entries per payload field")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "success",
+                "message": "HARA data is valid",
+                "data": {
+                    "hazards": 1,
+                    "scenarios": 1,
+                    "safety_goals": 1,
+                    "relationships": 2,
+                },
+            }
+        }
+
+
 # ============================================================================
 # HARA IMPORT
 # ============================================================================
@@ -107,7 +131,7 @@ class HARAImportRequest(BaseModel):
 class HARAImportResponse(APIResponse):
     """Response model for HARA import."""
 
-    status: str = Field(default="success", description="Import status")
+    status: str = Field(default=STATUS_SUCCESS, description="Import status")
     data: Dict[str, int] = Field(..., description="Import statistics")
 
     class Config:
@@ -182,7 +206,7 @@ class FMEAImportRequest(BaseModel):
 class FMEAImportResponse(APIResponse):
     """Response model for FMEA import."""
 
-    status: str = Field(default="success", description="Import status")
+    status: str = Field(default=STATUS_SUCCESS, description="Import status")
     data: Dict[str, int] = Field(..., description="Import statistics")
 
     class Config:
@@ -254,7 +278,7 @@ class RequirementsImportRequest(BaseModel):
 class RequirementsImportResponse(APIResponse):
     """Response model for requirements import."""
 
-    status: str = Field(default="success", description="Import status")
+    status: str = Field(default=STATUS_SUCCESS, description="Import status")
     data: Dict[str, int] = Field(..., description="Import statistics")
 
     class Config:
@@ -314,7 +338,7 @@ class TestsImportRequest(BaseModel):
 class TestsImportResponse(APIResponse):
     """Response model for tests import."""
 
-    status: str = Field(default="success", description="Import status")
+    status: str = Field(default=STATUS_SUCCESS, description="Import status")
     data: Dict[str, int] = Field(..., description="Import statistics")
 
     class Config:
@@ -376,7 +400,7 @@ class DefectsImportRequest(BaseModel):
 class DefectsImportResponse(APIResponse):
     """Response model for defects import (Phase 3)."""
 
-    status: str = Field(default="success", description="Import status")
+    status: str = Field(default=STATUS_SUCCESS, description="Import status")
     data: Dict[str, int] = Field(..., description="Import statistics")
     warnings: List[str] = Field(default_factory=list, description="Import warnings")
 
@@ -429,16 +453,16 @@ class HazardCoverageItem(BaseModel):
 class HazardCoverageSummary(BaseModel):
     """Summary of hazard coverage."""
 
-    total: int = Field(..., description="Total hazards")
-    full_coverage: int = Field(..., description="Hazards with full coverage")
-    partial_coverage: int = Field(..., description="Hazards with partial coverage")
-    no_coverage: int = Field(..., description="Hazards with no coverage")
+    total: int = Field(..., ge=0, description="Total hazards")
+    full_coverage: int = Field(..., ge=0, description="Hazards with full coverage")
+    partial_coverage: int = Field(..., ge=0, description="Hazards with partial coverage")
+    no_coverage: int = Field(..., ge=0, description="Hazards with no coverage")
 
 
 class HazardCoverageResponse(APIResponse):
     """Response model for hazard coverage analysis."""
 
-    status: str = Field(default="success", description="Query status")
+    status: str = Field(default=STATUS_SUCCESS, description="Query status")
     data: Dict[str, Any] = Field(..., description="Coverage data")
 
     class Config:
@@ -495,7 +519,7 @@ class ImpactedArtifact(BaseModel):
 class ImpactAnalysisResponse(APIResponse):
     """Response model for impact analysis."""
 
-    status: str = Field(default="success", description="Query status")
+    status: str = Field(default=STATUS_SUCCESS, description="Query status")
     data: Dict[str, Any] = Field(..., description="Impact analysis data")
 
     class Config:
@@ -566,7 +590,7 @@ class ImpactAnalysisResponse(APIResponse):
 class StatisticsResponse(APIResponse):
     """Response model for database statistics."""
 
-    status: str = Field(default="success", description="Query status")
+    status: str = Field(default=STATUS_SUCCESS, description="Query status")
     data: Dict[str, Any] = Field(..., description="Statistics data")
 
     class Config:
@@ -8,8 +8,13 @@ Provides services for:
 - Database statistics
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from typing import Dict, Any, List, Optional, Type, TypeVar
+
+from neo4j import RoutingControl
+from pydantic import BaseModel
 
 from app.db import queries
 from app.models.schemas import (
@@ -19,12 +24,21 @@ from app.models.schemas import (
     TraceabilityChain,
     HazardCoverageItem,
     HazardCoverageSummary,
-    ImpactedArtifact,
 )
-from app.services.base_service import BaseService
+from app.services.base_service import BaseService, cached
 
 logger = logging.getLogger(__name__)
 
+M = TypeVar("M", bound=BaseModel)
+
+# Statistics scan the whole graph but change slowly; dashboards poll them.
+STATS_CACHE_TTL_SECONDS = 5.0
+
+# Impact traversals are keyed by graph version, which only sees writes made
+# by this process; the TTL bounds staleness from other workers and from
+# writes made outside the services.
+IMPACT_CACHE_TTL_SECONDS = 5.0
+
 
 class AnalyticsService(BaseService):
     """
@@ -37,6 +51,26 @@ class AnalyticsService(BaseService):
     - Database statistics and metrics
     """
 
+    # Build list/statistics responses with model_construct, skipping
+    # validation of data that comes straight from our own Cypher. Set to
+    # False when debugging to validate every response again.
+    _fast_response: bool = True
+
+    def _build_response(self, model: Type[M], **fields: Any) -> M:
+        """
+        Build a response model, skipping validation when fast responses are on.
+
+        Args:
+            model: Response model class
+            **fields: Model field values
+
+        Returns:
+            Response model instance
+        """
+        if self._fast_response:
+            return model.model_construct(**fields)
+        return model(**fields)
+
     # =========================================================================
     # HAZARD COVERAGE ANALYSIS
     # =========================================================================
@@ -61,18 +95,16 @@ class AnalyticsService(BaseService):
         self.logger.info(f"Analyzing coverage for hazard {hazard_id}")
 
         try:
-            # Check if hazard exists
-            if not self._node_exists(hazard_id):
-                raise ValueError(f"Hazard {hazard_id} not found")
-
-            # Query hazard coverage
+            # Query hazard coverage (no rows means the hazard does not exist)
             results = self.driver.execute_query(
                 queries.GET_HAZARD_COVERAGE,
-                parameters={"hazard_id": hazard_id}
+                parameters={"hazard_id": hazard_id},
+                as_dicts=True,
+                routing=RoutingControl.READ
             )
 
             if not results:
-                raise ValueError(f"No coverage data found for hazard {hazard_id}")
+                raise ValueError(f"Hazard {hazard_id} not found")
 
             coverage_data = results[0]["coverage"]
 
@@ -90,15 +122,52 @@ class AnalyticsService(BaseService):
             self.logger.error(f"Failed to get hazard coverage for {hazard_id}: {e}")
             raise
 
+    def get_hazard_coverage_batch(self, hazard_ids: List[str]) -> Dict[str, Any]:
+        """
+        Get coverage analysis for several hazards in a single query.
+
+        Args:
+            hazard_ids: Hazard IDs to analyze
+
+        Returns:
+            Dictionary mapping hazard ID to coverage data. Unknown hazard IDs
+            are omitted.
+
+        Raises:
+            Exception: If query fails
+        """
+        unique_ids = list(dict.fromkeys(hazard_ids))
+        self.logger.info(f"Analyzing coverage for {len(unique_ids)} hazard(s)")
+
+        if not unique_ids:
+            return {}
+
+        try:
+            results = self.driver.execute_query(
+                queries.GET_HAZARDS_COVERAGE_BATCH,
+                parameters={"hazard_ids": unique_ids},
+                as_dicts=True,
+                routing=RoutingControl.READ
+            )
+
+            return {record["hazard_id"]: record["coverage"] for record in results}
+
+        except Exception as e:
+            self.logger.error(f"Failed to get hazard coverage batch: {e}")
+            raise
+
     def get_all_hazards_coverage(
         self,
-        asil_filter: Optional[List[str]] = None
+        asil_filter: Optional[List[str]] = None,
+        summary_only: bool = False
     ) -> HazardCoverageResponse:
         """
         Get coverage analysis for all hazards.
 
         Args:
             asil_filter: Optional list of ASIL levels to filter (e.g., ["C", "D"])
+            summary_only: Return only the summary counters, aggregated in Neo4j
+                instead of shipping every hazard row
 
         Returns:
             HazardCoverageResponse with all hazards coverage
@@ -109,52 +178,42 @@ class AnalyticsService(BaseService):
         self.logger.info("Analyzing coverage for all hazards")
 
         try:
+            if summary_only:
+                results = self.driver.execute_query(
+                    queries.GET_HAZARDS_COVERAGE_SUMMARY,
+                    parameters={"asil_levels": asil_filter or None},
+                    as_dicts=True,
+                    routing=RoutingControl.READ
+                )
+                summary = results[0]["summary"]
+
+                self.logger.info(f"Coverage summary complete: {summary}")
+
+                return self._build_response(
+                    HazardCoverageResponse,
+                    status="success",
+                    message=f"Coverage summary for {summary['total_hazards']} hazard(s)",
+                    data={"summary": summary}
+                )
+
             # Apply ASIL filter if provided
             if asil_filter:
-                query = """
-                MATCH (h:Hazard)
-                WHERE h.asil IN $asil_levels
-                OPTIONAL MATCH (h)-[:MITIGATED_BY]->(sg:SafetyGoal)
-                              -[:REFINED_TO]->(fsr:FunctionalSafetyRequirement)
-                              -[:REFINED_TO]->(tsr:TechnicalSafetyRequirement)
-                              -[:VERIFIED_BY]->(tc:TestCase)
-                WITH h,
-                     collect(DISTINCT sg.id) AS safety_goals,
-                     collect(DISTINCT fsr.id) AS fsrs,
-                     collect(DISTINCT tsr.id) AS tsrs,
-                     collect(DISTINCT tc.id) AS test_cases,
-                     count(DISTINCT tc) AS test_count
-                RETURN {
-                    hazard_id: h.id,
-                    description: h.description,
-                    asil: h.asil,
-                    safety_goals: safety_goals,
-                    fsrs: fsrs,
-                    tsrs: tsrs,
-                    test_cases: test_cases,
-                    coverage_status: CASE
-                        WHEN test_count > 0 THEN 'full'
-                        WHEN size(safety_goals) > 0 THEN 'partial'
-                        ELSE 'none'
-                    END
-                } AS coverage
-                ORDER BY h.asil DESC, h.id
-                """
-                results = self.driver.execute_query(
-                    query,
+                results = self.driver.stream_query(
+                    queries.GET_ALL_HAZARDS_COVERAGE_ASIL_FILTERED,
                     parameters={"asil_levels": asil_filter}
                 )
             else:
-                results = self.driver.execute_query(queries.GET_ALL_HAZARDS_COVERAGE)
+                results = self.driver.stream_query(queries.GET_ALL_HAZARDS_COVERAGE)
 
-            # Build coverage items
-            coverage_items = [record["coverage"] for record in results]
+            # Build coverage items (single-column records, unpacked by position)
+            coverage_items = [coverage for (coverage,) in results]
 
-            # Calculate summary statistics
+            # Calculate summary statistics in a single pass
+            status_counts = Counter(item["coverage_status"] for item in coverage_items)
             total = len(coverage_items)
-            fully_covered = sum(1 for item in coverage_items if item["coverage_status"] == "full")
-            partially_covered = sum(1 for item in coverage_items if item["coverage_status"] == "partial")
-            not_covered = sum(1 for item in coverage_items if item["coverage_status"] == "none")
+            fully_covered = status_counts["full"]
+            partially_covered = status_counts["partial"]
+            not_covered = status_counts["none"]
 
             summary = {
                 "total_hazards": total,
@@ -166,7 +225,8 @@ class AnalyticsService(BaseService):
 
             self.logger.info(f"Coverage analysis complete: {summary}")
 
-            return HazardCoverageResponse(
+            return self._build_response(
+                HazardCoverageResponse,
                 status="success",
                 message=f"Coverage analysis for {total} hazard(s)",
                 data={
@@ -179,6 +239,7 @@ class AnalyticsService(BaseService):
             self.logger.error(f"Failed to get all hazards coverage: {e}")
             raise
 
+    @cached(ttl=STATS_CACHE_TTL_SECONDS)
     def get_coverage_statistics(self) -> Dict[str, Any]:
         """
         Get overall coverage statistics.
@@ -192,7 +253,11 @@ class AnalyticsService(BaseService):
         self.logger.info("Getting coverage statistics")
 
         try:
-            results = self.driver.execute_query(queries.GET_COVERAGE_STATISTICS)
+            results = self.driver.execute_query(
+                queries.GET_COVERAGE_STATISTICS,
+                as_dicts=True,
+                routing=RoutingControl.READ
+            )
 
             if not results:
                 return {
@@ -242,21 +307,15 @@ class AnalyticsService(BaseService):
         self.logger.info(f"Analyzing impact for component {component_id}")
 
         try:
-            # Check if component exists
-            if not self._node_exists(component_id):
-                raise ValueError(f"Component {component_id} not found")
-
-            # Query component impact
-            results = self.driver.execute_query(
-                queries.GET_COMPONENT_IMPACT,
-                parameters={"component_id": component_id}
+            # Read the version before the traversal, so a result that
+            # overlapped a write is filed under the older version
+            version = self.graph_version
+            impact_data = self._cached(
+                f"component_impact:{component_id}:{version}",
+                IMPACT_CACHE_TTL_SECONDS,
+                lambda: self._query_component_impact(component_id)
             )
 
-            if not results:
-                raise ValueError(f"No impact data found for component {component_id}")
-
-            impact_data = results[0]["impact"]
-
             # Build response
             return ImpactAnalysisResponse(
                 status="success",
@@ -271,17 +330,51 @@ class AnalyticsService(BaseService):
             self.logger.error(f"Failed to get component impact for {component_id}: {e}")
             raise
 
+    def _query_component_impact(self, component_id: str) -> Dict[str, Any]:
+        """
+        Run the impact traversal for one component.
+
+        Args:
+            component_id: Component ID
+
+        Returns:
+            Impact data returned by the traversal query
+
+        Raises:
+            ValueError: If component not found
+        """
+        # No rows means the component does not exist
+        results = self.driver.execute_query(
+            queries.GET_COMPONENT_IMPACT,
+            parameters={"component_id": component_id},
+            as_dicts=True,
+            routing=RoutingControl.READ
+        )
+
+        if not results:
+            raise ValueError(f"Component {component_id} not found")
+
+        return results[0]["impact"]
+
     def get_all_components_impact(
         self,
         component_type_filter: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        after_score: Optional[float] = None,
+        after_id: Optional[str] = None
     ) -> ImpactAnalysisResponse:
         """
         Get impact analysis for all components (ranked by impact score).
 
+        Components are ordered by impact score, then component ID, so pages
+        are stable. Pass the previous page's next_cursor values as
+        after_score/after_id to continue after it.
+
         Args:
             component_type_filter: Optional component type filter (hardware, software, etc.)
             limit: Maximum number of components to return (default: 100)
+            after_score: Impact score of the last component on the previous page
+            after_id: Component ID of the last component on the previous page
 
         Returns:
             ImpactAnalysisResponse with all components impact
@@ -292,52 +385,46 @@ class AnalyticsService(BaseService):
         self.logger.info(f"Analyzing impact for all components (limit: {limit})")
 
         try:
+            parameters = {
+                "limit": limit,
+                "after_score": after_score,
+                "after_id": after_id
+            }
+
             # Apply component type filter if provided
             if component_type_filter:
-                query = """
-                MATCH (c:Component)
-                WHERE c.component_type = $component_type
-                OPTIONAL MATCH (c)-[:IMPLEMENTS]->(f:Function)
-                              -[:CONTRIBUTES_TO]->(sg:SafetyGoal)
-                              <-[:MITIGATED_BY]-(h:Hazard)
-                OPTIONAL MATCH (c)-[:HAS_FAILURE_MODE]->(fm:FailureMode)
-                WITH c,
-                     count(DISTINCT h) AS hazard_count,
-                     count(DISTINCT sg) AS safety_goal_count,
-                     count(DISTINCT fm) AS failure_mode_count,
-                     max(h.asil) AS max_asil
-                RETURN {
-                    component_id: c.id,
-                    name: c.name,
-                    component_type: c.component_type,
-                    hazard_count: hazard_count,
-                    safety_goal_count: safety_goal_count,
-                    failure_mode_count: failure_mode_count,
-                    max_asil: max_asil,
-                    impact_score: hazard_count * 10 + safety_goal_count * 5 + failure_mode_count * 3
-                } AS impact
-                ORDER BY impact.impact_score DESC
-                LIMIT $limit
-                """
-                results = self.driver.execute_query(
-                    query,
-                    parameters={"component_type": component_type_filter, "limit": limit}
+                results = self.driver.stream_query(
+                    queries.GET_ALL_COMPONENTS_IMPACT_TYPE_FILTERED,
+                    parameters={**parameters, "component_type": component_type_filter}
                 )
             else:
-                query = queries.GET_ALL_COMPONENTS_IMPACT + f"\nLIMIT {limit}"
-                results = self.driver.execute_query(query)
+                results = self.driver.stream_query(
+                    queries.GET_ALL_COMPONENTS_IMPACT,
+                    parameters=parameters
+                )
+
+            # Build impact items (single-column records, unpacked by position)
+            impact_items = [impact for (impact,) in results]
 
-            # Build impact items
-            impact_items = [record["impact"] for record in results]
+            # A full page may have more after it
+            next_cursor = None
+            if len(impact_items) == limit:
+                last = impact_items[-1]
+                next_cursor = {
+                    "after_score": last["impact_score"],
+                    "after_id": last["component_id"]
+                }
 
             self.logger.info(f"Impact analysis complete for {len(impact_items)} component(s)")
 
-            return ImpactAnalysisResponse(
+            return self._build_response(
+                ImpactAnalysisResponse,
                 status="success",
                 message=f"Impact analysis for {len(impact_items)} component(s)",
                 data={
                     "components": impact_items,
-                    "total_analyzed": len(impact_items)
+                    "total_analyzed": len(impact_items),
+                    "next_cursor": next_cursor
                 }
             )
 
@@ -368,20 +455,22 @@ class AnalyticsService(BaseService):
         self.logger.info(f"Getting traceability chains for hazard {hazard_id}")
 
         try:
-            # Check if hazard exists
-            if not self._node_exists(hazard_id):
-                raise ValueError(f"Hazard {hazard_id} not found")
-
-            # Query traceability chains
+            # Query traceability chains (no rows means the hazard does not exist,
+            # a single null chain means it exists without complete chains)
             results = self.driver.execute_query(
                 queries.GET_TRACEABILITY_CHAIN,
                 parameters={"hazard_id": hazard_id}
             )
 
+            if not results:
+                raise ValueError(f"Hazard {hazard_id} not found")
+
             # Build traceability chain objects
             chains = []
             for record in results:
                 chain_data = record["chain"]
+                if chain_data is None:
+                    continue
                 chains.append(TraceabilityChain(
                     hazard=chain_data["hazard"],
                     safety_goal=chain_data["safety_goal"],
@@ -415,18 +504,14 @@ class AnalyticsService(BaseService):
         self.logger.info(f"Getting traceability for requirement {requirement_id}")
 
         try:
-            # Check if requirement exists
-            if not self._node_exists(requirement_id):
-                raise ValueError(f"Requirement {requirement_id} not found")
-
-            # Query requirement traceability
+            # Query requirement traceability (no rows means the requirement does not exist)
             results = self.driver.execute_query(
                 queries.GET_REQUIREMENT_TRACEABILITY,
                 parameters={"requirement_id": requirement_id}
             )
 
             if not results:
-                raise ValueError(f"No traceability data found for requirement {requirement_id}")
+                raise ValueError(f"Requirement {requirement_id} not found")
 
             traceability_data = results[0]["traceability"]
 
@@ -442,6 +527,7 @@ class AnalyticsService(BaseService):
     # STATISTICS AND METRICS
     # =========================================================================
 
+    @cached(ttl=STATS_CACHE_TTL_SECONDS)
     def get_database_statistics(self) -> StatisticsResponse:
         """
         Get comprehensive database statistics.
@@ -455,34 +541,30 @@ class AnalyticsService(BaseService):
         self.logger.info("Getting database statistics")
 
         try:
-            # Get node counts
-            node_stats = self.driver.execute_query(queries.GET_NODE_STATISTICS)
-            node_counts = {record["label"]: record["count"] for record in node_stats}
-
-            # Get relationship counts
-            rel_stats = self.driver.execute_query(queries.GET_RELATIONSHIP_STATISTICS)
-            rel_counts = {record["relationship_type"]: record["count"] for record in rel_stats}
-
-            # Get ASIL distribution
-            asil_stats = self.driver.execute_query(queries.GET_ASIL_DISTRIBUTION)
-            asil_distribution = {}
-            for record in asil_stats:
-                node_type = record["node_type"]
-                asil = record["asil"]
-                count = record["count"]
+            # Fetch all statistics sections in a single query
+            results = self.driver.execute_query(
+                queries.GET_DATABASE_STATISTICS,
+                as_dicts=True,
+                routing=RoutingControl.READ
+            )
+            record = results[0] if results else {}
 
-                if node_type not in asil_distribution:
-                    asil_distribution[node_type] = {}
+            node_counts = {
+                item["label"]: item["count"] for item in record.get("node_stats", [])
+            }
+            rel_counts = {
+                item["relationship_type"]: item["count"]
+                for item in record.get("relationship_stats", [])
+            }
 
-                asil_distribution[node_type][asil] = count
+            # Already pivoted into {node_type: {asil: count}} by the query
+            asil_distribution = record.get("asil_distribution") or {}
 
-            # Get test status statistics
-            test_stats = self.driver.execute_query(queries.GET_TEST_STATUS_STATISTICS)
-            test_status_counts = {record["status"]: record["count"] for record in test_stats}
+            test_status_counts = {
+                item["status"]: item["count"] for item in record.get("test_stats", [])
+            }
 
-            # Get database summary
-            summary_stats = self.driver.execute_query(queries.GET_DATABASE_SUMMARY)
-            summary = summary_stats[0]["summary"] if summary_stats else {}
+            summary = record.get("summary") or {}
 
             statistics = {
                 "summary": summary,
@@ -494,7 +576,8 @@ class AnalyticsService(BaseService):
 
             self.logger.info(f"Database statistics retrieved: {summary}")
 
-            return StatisticsResponse(
+            return self._build_response(
+                StatisticsResponse,
                 status="success",
                 message="Database statistics retrieved",
                 data=statistics
@@ -504,6 +587,7 @@ class AnalyticsService(BaseService):
             self.logger.error(f"Failed to get database statistics: {e}")
             raise
 
+    @cached(ttl=STATS_CACHE_TTL_SECONDS)
     def get_node_counts(self) -> Dict[str, int]:
         """
         Get node counts by label.
@@ -520,6 +604,7 @@ class AnalyticsService(BaseService):
             self.logger.error(f"Failed to get node counts: {e}")
             raise
 
+    @cached(ttl=STATS_CACHE_TTL_SECONDS)
     def get_relationship_counts(self) -> Dict[str, int]:
         """
         Get relationship counts by type.
@@ -536,13 +621,112 @@ class AnalyticsService(BaseService):
             self.logger.error(f"Failed to get relationship counts: {e}")
             raise
 
+    async def aget_node_counts(self) -> Dict[str, int]:
+        """
+        Get node counts by label using the async driver.
+
+        Returns:
+            Dictionary mapping labels to counts
+
+        Raises:
+            Exception: If query fails
+        """
+        try:
+            results = await self.driver.execute_query_async(queries.GET_NODE_COUNTS)
+            return {record["label"]: record["count"] for record in results}
+        except Exception as e:
+            self.logger.error(f"Failed to get node counts: {e}")
+            raise
+
+    async def aget_relationship_counts(self) -> Dict[str, int]:
+        """
+        Get relationship counts by type using the async driver.
+
+        Returns:
+            Dictionary mapping relationship types to counts
+
+        Raises:
+            Exception: If query fails
+        """
+        try:
+            results = await self.driver.execute_query_async(queries.GET_RELATIONSHIP_COUNTS)
+            return {record["relationshipType"]: record["count"] for record in results}
+        except Exception as e:
+            self.logger.error(f"Failed to get relationship counts: {e}")
+            raise
+
+    async def aget_coverage_statistics(self) -> Dict[str, Any]:
+        """
+        Get overall coverage statistics using the async driver.
+
+        Returns:
+            Coverage statistics with counts and percentages
+
+        Raises:
+            Exception: If query fails
+        """
+        try:
+            results = await self.driver.execute_query_async(queries.GET_COVERAGE_STATISTICS)
+
+            if not results:
+                return {
+                    "total_hazards": 0,
+                    "fully_covered": 0,
+                    "partially_covered": 0,
+                    "not_covered": 0,
+                    "coverage_percentage": 0
+                }
+
+            return results[0]["statistics"]
+
+        except Exception as e:
+            self.logger.error(f"Failed to get coverage statistics: {e}")
+            raise
+
+    async def aget_dashboard(self) -> StatisticsResponse:
+        """
+        Get node counts, relationship counts and coverage statistics at once.
+
+        The three queries are independent, so they run concurrently and the
+        total latency is that of the slowest one.
+
+        Returns:
+            StatisticsResponse with node_counts, relationship_counts and coverage
+
+        Raises:
+            Exception: If any query fails
+        """
+        self.logger.info("Getting dashboard statistics")
+
+        try:
+            node_counts, relationship_counts, coverage = await asyncio.gather(
+                self.aget_node_counts(),
+                self.aget_relationship_counts(),
+                self.aget_coverage_statistics(),
+            )
+
+            return self._build_response(
+                StatisticsResponse,
+                status="success",
+                message="Dashboard statistics retrieved",
+                data={
+                    "node_counts": node_counts,
+                    "relationship_counts": relationship_counts,
+                    "coverage": coverage
+                }
+            )
+
+        except Exception as e:
+            self.logger.error(f"Failed to get dashboard statistics: {e}")
+            raise
+
     # =========================================================================
     # SEARCH AND FILTER
     # =========================================================================
 
     def search_hazards(self, search_text: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
-        Search hazards by text.
+        Search hazards by description words or ID prefix.
 
         Args:
             search_text: Search query
@@ -556,13 +740,21 @@ class AnalyticsService(BaseService):
         """
         self.logger.info(f"Searching hazards for: {search_text}")
 
+        search_query = queries.build_fulltext_query(search_text)
+        if not search_query:
+            return []
+
         try:
-            results = self.driver.execute_query(
+            results = self.driver.stream_query(
                 queries.SEARCH_HAZARDS,
-                parameters={"search_text": search_text, "limit": limit}
+                parameters={
+                    "search_text": search_text,
+                    "search_query": search_query,
+                    "limit": limit
+                }
             )
 
-            hazards = [record["h"] for record in results]
+            hazards = [hazard for (hazard,) in results]
             self.logger.info(f"Found {len(hazards)} matching hazard(s)")
 
             return hazards
@@ -573,7 +765,7 @@ class AnalyticsService(BaseService):
 
     def search_components(self, search_text: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
-        Search components by text.
+        Search components by name/description words or ID prefix.
 
         Args:
             search_text: Search query
@@ -587,13 +779,21 @@ class AnalyticsService(BaseService):
         """
         self.logger.info(f"Searching components for: {search_text}")
 
+        search_query = queries.build_fulltext_query(search_text)
+        if not search_query:
+            return []
+
         try:
-            results = self.driver.execute_query(
+            results = self.driver.stream_query(
                 queries.SEARCH_COMPONENTS,
-                parameters={"search_text": search_text, "limit": limit}
+                parameters={
+                    "search_text": search_text,
+                    "search_query": search_query,
+                    "limit": limit
+                }
             )
 
-            components = [record["c"] for record in results]
+            components = [component for (component,) in results]
             self.logger.info(f"Found {len(components)} matching component(s)")
 
             return components
@@ -618,12 +818,12 @@ class AnalyticsService(BaseService):
         self.logger.info(f"Filtering hazards by ASIL: {asil_levels}")
 
         try:
-            results = self.driver.execute_query(
+            results = self.driver.stream_query(
                 queries.FILTER_HAZARDS_BY_ASIL,
                 parameters={"asil_levels": asil_levels}
             )
 
-            hazards = [record["h"] for record in results]
+            hazards = [hazard for (hazard,) in results]
             self.logger.info(f"Found {len(hazards)} hazard(s) with ASIL in {asil_levels}")
 
             return hazards
@@ -2,14 +2,88 @@
 Base service class with common functionality.
 """
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import get_settings
 from app.db.neo4j_driver import Neo4jDriver, get_neo4j_driver
 from app.db import queries
 
 logger = logging.getLogger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def cached(ttl: float) -> Callable[[F], F]:
+    """
+    Cache a service method's result for a short time.
+
+    Entries are keyed by method name and arguments and shared across service
+    instances on the same driver and database. Any service write clears them
+    (see ``invalidate_stats_cache``).
+
+    Args:
+        ttl: Time to live in seconds
+
+    Example:
+        ```python
+        @cached(ttl=5.0)
+        def get_coverage_statistics(self) -> Dict[str, Any]:
+            ...
+        ```
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(self: "BaseService", *args: Any, **kwargs: Any) -> Any:
+            key = f"{func.__qualname__}:{args!r}:{sorted(kwargs.items())!r}"
+            return self._cached(key, ttl, lambda: func(self, *args, **kwargs))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _list_dumper(model: type) -> Callable[[List[Any]], List[Dict[str, Any]]]:
+    """
+    Build (once per model class) a list serializer with exclude_none bound.
+
+    Calls go straight to the compiled pydantic-core serializer, skipping the
+    per-call keyword handling of TypeAdapter.dump_python.
+    """
+    adapter = TypeAdapter(List[model])  # type: ignore[valid-type]
+    return functools.partial(adapter.serializer.to_python, exclude_none=True)
+
+
+def _dump_rows(nodes: List[BaseModel]) -> List[Dict[str, Any]]:
+    """
+    Dump a list of node models to property dictionaries without None values.
+
+    A single serializer call handles the whole list in pydantic-core, which
+    is about twice as fast as calling model_dump on each instance.
+
+    Args:
+        nodes: Node models, all of the same class
+
+    Returns:
+        One property dictionary per node
+    """
+    return _list_dumper(type(nodes[0]))(nodes)
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most size items (itertools.batched, pre-3.12)."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 class BaseService:
     """
@@ -20,8 +94,23 @@ class BaseService:
     - Error handling
     - Logging
     - Statistics tracking
+    - Graph version tracking for read-side caches
     """
 
+    # Incremented on every write made through a service. Read-side caches key
+    # their entries on this value so any import invalidates them.
+    _graph_version: int = 0
+
+    # Short-lived results of expensive read queries:
+    # (driver, database, key) -> (expires_at, value)
+    _cache: Dict[Tuple[Any, str, str], Tuple[float, Any]] = {}
+
+    # Entries kept before expired (then oldest) ones are evicted on insert
+    _cache_max_entries: int = 1024
+
+    # Set once INDEX_DDL has been applied in this process
+    _indexes_ensured: bool = False
+
     def __init__(self, driver: Optional[Neo4jDriver] = None):
         """
         Initialize service.
@@ -32,6 +121,143 @@ class BaseService:
         self.driver = driver or get_neo4j_driver()
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # Bulk imports: CALL { ... } IN CONCURRENT TRANSACTIONS when enabled,
+        # with None concurrency leaving the thread count to the server
+        settings = get_settings()
+        self.database = settings.neo4j_database
+        self.concurrent_imports = settings.neo4j_concurrent_imports
+        self.import_concurrency = settings.neo4j_import_concurrency
+        self.import_batch_size = settings.neo4j_import_batch_size
+        # Nodes dumped and sent per bulk statement, bounding import memory
+        self.import_chunk_size = settings.neo4j_import_chunk_size
+
+    @staticmethod
+    def _bump_graph_version() -> None:
+        """Mark the graph as modified, invalidating version-keyed caches."""
+        BaseService._graph_version += 1
+        BaseService.invalidate_stats_cache()
+
+    @classmethod
+    def invalidate_stats_cache(cls) -> None:
+        """Drop all cached read results."""
+        BaseService._cache.clear()
+
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """
+        Return a cached value, or compute and cache it.
+
+        Entries are scoped to this service's driver and database, so services
+        pointed at different databases never share results. When the cache
+        is full, inserting drops expired entries first and then the oldest.
+
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+            fn: Function computing the value on a miss
+
+        Returns:
+            Cached or freshly computed value
+        """
+        scoped_key = (self.driver, self.database, key)
+        now = time.monotonic()
+        entry = BaseService._cache.get(scoped_key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        value = fn()
+        BaseService._store_cached(scoped_key, now + ttl, value, now)
+        return value
+
+    @staticmethod
+    def _store_cached(
+        key: Tuple[Any, str, str],
+        expires_at: float,
+        value: Any,
+        now: float
+    ) -> None:
+        """Insert a cache entry, evicting expired and then oldest entries when full."""
+        cache = BaseService._cache
+        cache.pop(key, None)
+
+        if len(cache) >= BaseService._cache_max_entries:
+            for stale in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+                del cache[stale]
+            while len(cache) >= BaseService._cache_max_entries:
+                del cache[next(iter(cache))]
+
+        cache[key] = (expires_at, value)
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the ID and full-text indexes the service queries rely on.
+
+        Every statement is idempotent (IF NOT EXISTS), so this is safe to run
+        on each application start.
+
+        Raises:
+            Exception: If an index cannot be created
+        """
+        try:
+            for statement in queries.INDEX_DDL:
+                self.driver.execute_query(statement)
+
+            BaseService._indexes_ensured = True
+            self.logger.info(f"Ensured {len(queries.INDEX_DDL)} index(es)")
+
+        except Exception as e:
+            self.logger.error(f"Failed to ensure indexes: {e}")
+            raise
+
+    def _ensure_indexes_once(self) -> None:
+        """
+        Apply INDEX_DDL before the first import in this process.
+
+        The application lifespan normally does this at startup; services used
+        without it (scripts, tests) would otherwise match relationship
+        endpoints by id without the constraint indexes. Failures are logged
+        and retried on the next import rather than failing this one.
+        """
+        if BaseService._indexes_ensured:
+            return
+
+        try:
+            self.ensure_indexes()
+        except Exception as e:
+            self.logger.warning(f"Importing without ensured indexes: {e}")
+
+    @property
+    def graph_version(self) -> int:
+        """Current graph version (changes after every service write)."""
+        return BaseService._graph_version
+
+    def _run_phases_concurrently(
+        self,
+        phases: Dict[str, Tuple[Callable[[list], int], list]]
+    ) -> Dict[str, int]:
+        """
+        Run independent import phases at the same time.
+
+        Each phase runs its (blocking) bulk write in a worker thread with its
+        own session, so the round trips of the different node types overlap.
+        Phases with an empty list are skipped.
+
+        Args:
+            phases: Stats key -> (import method, items to import)
+
+        Returns:
+            Stats key -> count returned by the import method
+        """
+        active = {key: phase for key, phase in phases.items() if phase[1]}
+        if len(active) <= 1:
+            return {key: method(items) for key, (method, items) in active.items()}
+
+        with ThreadPoolExecutor(max_workers=len(active)) as executor:
+            futures = {
+                key: executor.submit(method, items)
+                for key, (method, items) in active.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
     def _create_node(
         self,
         query: str,
@@ -55,11 +281,12 @@ class BaseService:
         try:
             properties = queries.build_node_properties(data)
             result = self.driver.execute_write_transaction(query, properties)
+            self._bump_graph_version()
 
             if not result:
                 raise ValueError(f"Failed to create {node_type}: no result returned")
 
-            self.logger.debug(f"Created {node_type}: {data.get('id')}")
+            self.logger.debug("Created %s: %s", node_type, data.get("id"))
             return result[0]
 
         except Exception as e:
@@ -95,6 +322,7 @@ class BaseService:
                 queries.BATCH_CREATE_NODES,
                 parameters={"nodes": batch_data}
             )
+            self._bump_graph_version()
 
             count = result[0]["created_count"] if result else 0
             self.logger.info(f"Created {count} {node_type}(s) in batch")
@@ -104,6 +332,205 @@ class BaseService:
             self.logger.error(f"Failed to create {node_type} batch: {e}")
             raise
 
+    def _bulk_create_nodes(
+        self,
+        nodes: Iterable[Any],
+        node_type: str
+    ) -> int:
+        """
+        Create node models in chunks of import_chunk_size, one UNWIND per chunk.
+
+        Only one chunk is dumped to dictionaries at a time, so memory stays
+        bounded by the chunk size rather than the number of nodes.
+
+        Args:
+            nodes: Pydantic node models (any iterable)
+            node_type: Node label, must be in queries.BULK_NODE_LABELS
+
+        Returns:
+            Number of nodes created
+        """
+        return sum(
+            self._create_node_chunk(chunk, node_type)
+            for chunk in _batched(nodes, self.import_chunk_size)
+        )
+
+    def _create_node_chunk(
+        self,
+        nodes: List[Any],
+        node_type: str
+    ) -> int:
+        """
+        Create a list of node models with one UNWIND statement.
+
+        Properties are sent as columns (one list per property) rather than
+        one map per row; see queries.build_node_columns.
+
+        If the bulk statement fails, the chunk is bisected (see
+        _write_bisected) with the same columnar statement, so good halves are
+        still written in one statement each and a single bad row only loses
+        itself. With concurrent imports
+        enabled, inner transactions may already have committed, so the
+        fallback skips IDs that now exist.
+
+        Args:
+            nodes: List of Pydantic node models
+            node_type: Node label, must be in queries.BULK_NODE_LABELS
+
+        Returns:
+            Number of nodes created
+        """
+        if not nodes:
+            return 0
+
+        rows = _dump_rows(nodes)
+
+        def write(chunk: List[Dict[str, Any]]) -> int:
+            keys, columns = queries.build_node_columns(chunk)
+            created = self.driver.execute_write_counters(
+                queries.columnar_create_nodes_query(node_type, keys),
+                parameters={"count": len(chunk), "columns": columns}
+            ).nodes_created
+            self._bump_graph_version()
+            return created
+
+        try:
+            if self.concurrent_imports:
+                # CALL ... IN TRANSACTIONS needs an auto-commit transaction
+                result = self.driver.execute_query(
+                    queries.concurrent_bulk_create_nodes_query(
+                        node_type, self.import_concurrency
+                    ),
+                    parameters={"rows": rows, "batch_size": self.import_batch_size}
+                )
+                self._bump_graph_version()
+                return result[0]["created_count"] if result else 0
+
+            return write(rows)
+
+        except Exception as e:
+            self.logger.warning(
+                f"Bulk {node_type} creation failed, isolating bad rows: {e}"
+            )
+
+        if self.concurrent_imports:
+            self._bump_graph_version()
+            committed = self._exists_set(
+                [row["id"] for row in rows if "id" in row], node_type
+            )
+            rows = [row for row in rows if row.get("id") not in committed]
+
+        # The whole chunk already failed, so start from its halves
+        middle = len(rows) // 2
+        halves = [rows[:middle], rows[middle:]] if middle else [rows]
+        return sum(
+            self._write_bisected(
+                half,
+                write,
+                lambda row: f"{node_type} {row.get('id')}"
+            )
+            for half in halves
+            if half
+        )
+
+    def _bulk_merge_nodes(
+        self,
+        merge_query: str,
+        nodes: Iterable[Any],
+        node_type: str
+    ) -> int:
+        """
+        Upsert node models in chunks of import_chunk_size, one MERGE per chunk.
+
+        Args:
+            merge_query: UNWIND $rows ... MERGE query (e.g. queries.MERGE_COMPONENT_BULK)
+            nodes: Pydantic node models (any iterable)
+            node_type: Node type name (for logging)
+
+        Returns:
+            Number of nodes created, as reported by the server
+        """
+        return sum(
+            self._merge_node_chunk(merge_query, chunk, node_type)
+            for chunk in _batched(nodes, self.import_chunk_size)
+        )
+
+    def _merge_node_chunk(
+        self,
+        merge_query: str,
+        nodes: List[Any],
+        node_type: str
+    ) -> int:
+        """
+        Upsert a list of node models with one UNWIND ... MERGE statement.
+
+        Existing nodes are left as they are, so no separate existence check
+        is needed. If the statement fails, the rows are split in half and
+        retried until the failing rows are isolated (see _write_bisected).
+
+        Args:
+            merge_query: UNWIND $rows ... MERGE query (e.g. queries.MERGE_COMPONENT_BULK)
+            nodes: List of Pydantic node models
+            node_type: Node type name (for logging)
+
+        Returns:
+            Number of nodes created, as reported by the server
+        """
+        if not nodes:
+            return 0
+
+        def merge(rows: List[Dict[str, Any]]) -> int:
+            counters = self.driver.execute_write_counters(
+                merge_query,
+                parameters={"rows": rows}
+            )
+            self._bump_graph_version()
+            return counters.nodes_created
+
+        return self._write_bisected(
+            _dump_rows(nodes),
+            merge,
+            lambda row: f"{node_type} {row.get('id')}"
+        )
+
+    def _write_bisected(
+        self,
+        rows: List[Any],
+        write: Callable[[List[Any]], int],
+        describe: Callable[[Any], str]
+    ) -> int:
+        """
+        Write rows as one batch, splitting failed batches in half.
+
+        A failed batch is rolled back as a whole, so its halves are retried
+        recursively until each bad row fails on its own. With k bad rows this
+        costs O(k log n) extra statements instead of one per row, and every
+        good row is still written.
+
+        Args:
+            rows: Rows to write
+            write: Writes a list of rows in one transaction, returning the count created
+            describe: Formats a row for the failure log
+
+        Returns:
+            Number of entities created
+        """
+        try:
+            return write(rows)
+
+        except Exception as e:
+            if len(rows) == 1:
+                self.logger.warning("Failed to import %s: %s", describe(rows[0]), e)
+                return 0
+
+            self.logger.debug("Batch of %d row(s) failed, splitting: %s", len(rows), e)
+
+        middle = len(rows) // 2
+        return (
+            self._write_bisected(rows[:middle], write, describe)
+            + self._write_bisected(rows[middle:], write, describe)
+        )
+
     def _create_relationship(
         self,
         source_id: str,
@@ -135,11 +562,14 @@ class BaseService:
             }
 
             result = self.driver.execute_write_transaction(
-                queries.CREATE_RELATIONSHIP,
+                queries.create_relationship_query(rel_type),
                 parameters=params
             )
+            self._bump_graph_version()
 
-            self.logger.debug(f"Created relationship: ({source_id})-[{rel_type}]->({target_id})")
+            self.logger.debug(
+                "Created relationship: (%s)-[%s]->(%s)", source_id, rel_type, target_id
+            )
             return result[0] if result else {}
 
         except Exception as e:
@@ -169,55 +599,242 @@ class BaseService:
         if not relationships:
             return 0
 
-        try:
-            batch_data = queries.build_batch_relationships(relationships)
-            result = self.driver.execute_write_transaction(
-                queries.BATCH_CREATE_RELATIONSHIPS,
-                parameters={"relationships": batch_data}
+        # Known types get a static CREATE; the rest share one APOC batch
+        groups: Dict[Optional[str], List[tuple]] = defaultdict(list)
+        for relationship in relationships:
+            rel_type = relationship[2]
+            groups[rel_type if rel_type in queries.RELATIONSHIP_TYPES else None].append(
+                relationship
             )
 
-            count = result[0]["created_count"] if result else 0
-            self.logger.info(f"Created {count} {rel_type_name} relationship(s) in batch")
+        try:
+            count = 0
+            for rel_type, group in groups.items():
+                parameters = queries.build_batch_relationships(group)
+
+                if rel_type is not None and self.concurrent_imports:
+                    # CALL ... IN TRANSACTIONS needs an auto-commit transaction
+                    result = self.driver.execute_query(
+                        queries.concurrent_bulk_create_relationships_query(
+                            rel_type, self.import_concurrency
+                        ),
+                        parameters={**parameters, "batch_size": self.import_batch_size}
+                    )
+                    count += result[0]["created_count"] if result else 0
+                else:
+                    query = (
+                        queries.batch_create_relationships_query(rel_type)
+                        if rel_type is not None
+                        else queries.BATCH_CREATE_RELATIONSHIPS
+                    )
+                    count += self.driver.execute_write_counters(
+                        query,
+                        parameters=parameters
+                    ).relationships_created
+                self._bump_graph_version()
+
+            self.logger.debug("Created %d %s relationship(s) in batch", count, rel_type_name)
             return count
 
         except Exception as e:
             self.logger.error(f"Failed to create {rel_type_name} relationships batch: {e}")
             raise
 
-    def _node_exists(self, node_id: str) -> bool:
+    def _dedupe_relationships(
+        self,
+        relationships: Dict[str, List[List[str]]]
+    ) -> Tuple[Dict[str, List[Tuple[str, str]]], int]:
+        """
+        Drop repeated (source, target) pairs within each relationship type.
+
+        Order is kept (first occurrence wins), so the remaining pairs are
+        written exactly as before, just once each.
+
+        Args:
+            relationships: Relationship type -> [source, target] pairs
+
+        Returns:
+            (deduplicated relationships, number of pairs dropped)
+        """
+        deduped: Dict[str, List[Tuple[str, str]]] = {}
+        dropped = 0
+
+        for rel_type, pairs in relationships.items():
+            unique = list(dict.fromkeys(map(tuple, pairs)))
+            dropped += len(pairs) - len(unique)
+            deduped[rel_type] = unique
+
+        if dropped:
+            self.logger.info(f"Dropped {dropped} duplicate relationship pair(s)")
+
+        return deduped, dropped
+
+    def _bulk_create_relationships(self, rel_type: str, pairs: List[List[str]]) -> int:
+        """
+        Create all relationships of one type with one UNWIND statement per chunk.
+
+        A failed batch is bisected to isolate the bad pairs (see
+        _write_bisected), so a failing edge only loses itself. Known types
+        are written in chunks, and the chunks after a failed one are written
+        normally; other types (and concurrent imports) go through
+        _create_relationships_batch.
+
+        Args:
+            rel_type: Relationship type
+            pairs: List of [source_id, target_id] pairs
+
+        Returns:
+            Number of relationships created
+        """
+        if not pairs:
+            return 0
+
+        if rel_type in queries.RELATIONSHIP_TYPES and not self.concurrent_imports:
+            # Known type without properties: send the pairs exactly as given
+            query = queries.batch_create_relationship_pairs_query(rel_type)
+
+            def merge(chunk: List[List[str]]) -> int:
+                created = self.driver.execute_write_counters(
+                    query,
+                    parameters={"pairs": chunk}
+                ).relationships_created
+                self._bump_graph_version()
+                return created
+
+            return sum(
+                self._write_bisected(
+                    chunk,
+                    merge,
+                    lambda pair: f"relationship ({pair[0]})-[{rel_type}]->({pair[1]})"
+                )
+                for chunk in _batched(pairs, self.import_chunk_size)
+            )
+
+        return self._write_bisected(
+            [(source_id, target_id, rel_type, None) for source_id, target_id in pairs],
+            lambda chunk: self._create_relationships_batch(chunk, rel_type),
+            lambda edge: f"relationship ({edge[0]})-[{rel_type}]->({edge[1]})"
+        )
+
+    def _bulk_create_relationship_types(
+        self,
+        relationships: Dict[str, List[List[str]]]
+    ) -> Dict[str, int]:
+        """
+        Create several relationship types at once, one worker thread per type.
+
+        Each type is a separate _bulk_create_relationships call with its own
+        session, so unrelated types (e.g. FOUND_IN and VIOLATES) overlap
+        instead of queueing. Lock conflicts between types on shared nodes are
+        transient errors, which the managed write transactions retry.
+
+        Args:
+            relationships: Relationship type -> [source, target] pairs
+
+        Returns:
+            Relationship type -> number created (types without pairs omitted)
+        """
+        active = {rel_type: pairs for rel_type, pairs in relationships.items() if pairs}
+        if len(active) <= 1:
+            return {
+                rel_type: self._bulk_create_relationships(rel_type, pairs)
+                for rel_type, pairs in active.items()
+            }
+
+        with ThreadPoolExecutor(max_workers=min(8, len(active))) as executor:
+            futures = {
+                rel_type: executor.submit(self._bulk_create_relationships, rel_type, pairs)
+                for rel_type, pairs in active.items()
+            }
+            return {rel_type: future.result() for rel_type, future in futures.items()}
+
+    def _import_relationships(self, relationships: Dict[str, Any]) -> int:
+        """
+        Import relationships between entities of any import.
+
+        Shared by all import services: each type is written as one batch,
+        types in parallel (see _bulk_create_relationship_types).
+
+        Args:
+            relationships: Dictionary mapping relationship types to [source, target] pairs
+
+        Returns:
+            Total number of relationships created
+        """
+        self.logger.info("Importing %d relationship type(s)...", len(relationships))
+
+        created_counts = self._bulk_create_relationship_types(relationships)
+        total_created = sum(created_counts.values())
+
+        # One summary line; the per-type counts are formatted only if logged
+        self.logger.info("Created %d relationship(s) by type: %s", total_created, created_counts)
+
+        return total_created
+
+    def _node_exists(self, node_id: str, label: Optional[str] = None) -> bool:
         """
         Check if a node exists.
 
         Args:
             node_id: Node ID to check
+            label: Optional node label; lets the lookup use that label's id index
 
         Returns:
             True if node exists, False otherwise
         """
+        return node_id in self._exists_set([node_id], label)
+
+    def _exists_set(self, node_ids: List[str], label: Optional[str] = None) -> Set[str]:
+        """
+        Check which of several nodes exist, in a single query.
+
+        Args:
+            node_ids: Node IDs to check
+            label: Optional node label, must be in queries.ID_INDEXED_LABELS;
+                without one, every node is scanned for each ID
+
+        Returns:
+            Set of the IDs that exist (empty if the check fails)
+        """
+        if not node_ids:
+            return set()
+
         try:
+            query = (
+                queries.existing_node_ids_query(label)
+                if label is not None
+                else queries.GET_EXISTING_NODE_IDS
+            )
             result = self.driver.execute_query(
-                "MATCH (n {id: $id}) RETURN count(n) AS count",
-                parameters={"id": node_id}
+                query,
+                parameters={"ids": list(node_ids)}
             )
-            return result[0]["count"] > 0 if result else False
+            return set(result[0]["present"]) if result else set()
 
         except Exception as e:
-            self.logger.error(f"Failed to check node existence {node_id}: {e}")
-            return False
+            self.logger.error(f"Failed to check existence of {len(node_ids)} node(s): {e}")
+            return set()
 
-    def _get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+    def _get_node(self, node_id: str, label: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get a node by ID.
 
         Args:
             node_id: Node ID
+            label: Optional node label, must be in queries.ID_INDEXED_LABELS;
+                without one, every node is scanned for the ID
 
         Returns:
             Node data or None if not found
         """
         try:
+            query = (
+                queries.get_node_query(label)
+                if label is not None
+                else "MATCH (n {id: $id}) RETURN n"
+            )
             result = self.driver.execute_query(
-                "MATCH (n {id: $id}) RETURN n",
+                query,
                 parameters={"id": node_id}
             )
             return result[0]["n"] if result else None
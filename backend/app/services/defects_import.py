@@ -38,12 +38,14 @@ class DefectsImportService(BaseService):
             Exception: If import fails
         """
         self.logger.info("Starting defects import...")
+        self._ensure_indexes_once()
 
         try:
             # Statistics counters
             stats = {
                 "defects_created": 0,
                 "relationships_created": 0,
+                "duplicate_relationships_dropped": 0,
             }
 
             # Import defects
@@ -52,9 +54,10 @@ class DefectsImportService(BaseService):
 
             # Import relationships
             if request.relationships:
-                stats["relationships_created"] = self._import_relationships(
-                    request.relationships
+                relationships, stats["duplicate_relationships_dropped"] = (
+                    self._dedupe_relationships(request.relationships)
                 )
+                stats["relationships_created"] = self._import_relationships(relationships)
 
             self.logger.info(f"Defects import completed: {stats}")
 
@@ -80,65 +83,14 @@ class DefectsImportService(BaseService):
         """
         self.logger.info(f"Importing {len(defects)} defect(s)...")
 
-        created_count = 0
-        for defect in defects:
-            try:
-                defect_data = defect.model_dump(exclude_none=True)
-                self._create_node(
-                    queries.CREATE_DEFECT,
-                    defect_data,
-                    "DefectInstance"
-                )
-                created_count += 1
-
-            except Exception as e:
-                self.logger.warning(f"Failed to import defect {defect.id}: {e}")
-                # Continue with next defect
+        created_count = self._bulk_create_nodes(
+            defects,
+            "DefectInstance"
+        )
 
         self.logger.info(f"Successfully imported {created_count}/{len(defects)} defect(s)")
         return created_count
 
-    def _import_relationships(self, relationships: Dict[str, Any]) -> int:
-        """
-        Import relationships between defects and components/requirements.
-
-        Args:
-            relationships: Dictionary mapping relationship types to [source, target] pairs
-
-        Returns:
-            Total number of relationships created
-        """
-        self.logger.info(f"Importing {len(relationships)} relationship type(s)...")
-
-        total_created = 0
-
-        for rel_type, pairs in relationships.items():
-            if not pairs:
-                continue
-
-            self.logger.info(f"Creating {len(pairs)} {rel_type} relationship(s)...")
-
-            created_count = 0
-            for source_id, target_id in pairs:
-                try:
-                    self._create_relationship(
-                        source_id=source_id,
-                        target_id=target_id,
-                        rel_type=rel_type
-                    )
-                    created_count += 1
-
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to create relationship ({source_id})-[{rel_type}]->({target_id}): {e}"
-                    )
-                    # Continue with next relationship
-
-            self.logger.info(f"Created {created_count}/{len(pairs)} {rel_type} relationship(s)")
-            total_created += created_count
-
-        return total_created
-
     def update_defect_status(
         self,
         defect_id: str,
@@ -161,11 +113,7 @@ class DefectsImportService(BaseService):
         self.logger.info(f"Updating defect {defect_id} status to {status}")
 
         try:
-            # Check if defect exists
-            if not self._node_exists(defect_id):
-                raise ValueError(f"Defect {defect_id} not found")
-
-            # Update defect status
+            # Update defect status (no row back means no such defect)
             result_data = self.driver.execute_write_transaction(
                 queries.UPDATE_DEFECT_STATUS,
                 parameters={
@@ -175,7 +123,9 @@ class DefectsImportService(BaseService):
             )
 
             if not result_data:
-                raise ValueError(f"Failed to update defect {defect_id}")
+                raise ValueError(f"Defect {defect_id} not found")
+
+            self._bump_graph_version()
 
             self.logger.info(f"Successfully updated defect {defect_id}")
             return result_data[0]["d"]
@@ -200,23 +150,16 @@ class DefectsImportService(BaseService):
         self.logger.info(f"Getting defects for component {component_id}")
 
         try:
-            # Check if component exists
-            if not self._node_exists(component_id):
-                raise ValueError(f"Component {component_id} not found")
-
-            # Query defects
-            query = """
-            MATCH (d:DefectInstance)-[:FOUND_IN]->(c:Component {id: $component_id})
-            RETURN d
-            ORDER BY d.severity DESC, d.detected_date DESC
-            """
-
+            # Query defects (no row back means no such component)
             results = self.driver.execute_query(
-                query,
+                queries.GET_DEFECTS_BY_COMPONENT,
                 parameters={"component_id": component_id}
             )
 
-            defects = [record["d"] for record in results]
+            if not results:
+                raise ValueError(f"Component {component_id} not found")
+
+            defects = results[0]["defects"]
             self.logger.info(f"Found {len(defects)} defect(s) for component {component_id}")
 
             return defects
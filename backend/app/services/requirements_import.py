@@ -4,8 +4,8 @@ Requirements import service.
 Handles importing FSRs, TSRs, and their relationships.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
 
 from app.db import queries
 from app.models.schemas import RequirementsImportRequest, RequirementsImportResponse
@@ -29,7 +29,11 @@ class RequirementsImportService(BaseService):
         request: RequirementsImportRequest
     ) -> RequirementsImportResponse:
         """
-        Import complete requirements dataset.
+        Import complete Requirements dataset, creating the node types concurrently.
+
+        The FSRs, TSRs and components do not depend on each other, so they are
+        written at the same time; relationships are imported once all nodes
+        exist.
 
         Args:
             request: Requirements import request with FSRs, TSRs, relationships
@@ -41,34 +45,29 @@ class RequirementsImportService(BaseService):
             ValueError: If validation fails
             Exception: If import fails
         """
-        self.logger.info("Starting requirements import...")
+        self.logger.info("Starting requirements import (concurrent phases)...")
+        self._ensure_indexes_once()
 
         try:
-            # Statistics counters
             stats = {
                 "fsrs_created": 0,
                 "tsrs_created": 0,
                 "components_created": 0,
                 "relationships_created": 0,
+                "duplicate_relationships_dropped": 0,
             }
 
-            # Import FSRs
-            if request.fsrs:
-                stats["fsrs_created"] = self._import_fsrs(request.fsrs)
-
-            # Import TSRs
-            if request.tsrs:
-                stats["tsrs_created"] = self._import_tsrs(request.tsrs)
-
-            # Import components (if provided and not already present)
-            if request.components:
-                stats["components_created"] = self._import_components(request.components)
+            stats.update(self._run_phases_concurrently({
+                "fsrs_created": (self._import_fsrs, request.fsrs),
+                "tsrs_created": (self._import_tsrs, request.tsrs),
+                "components_created": (self._import_components, request.components),
+            }))
 
-            # Import relationships
             if request.relationships:
-                stats["relationships_created"] = self._import_relationships(
-                    request.relationships
+                relationships, stats["duplicate_relationships_dropped"] = (
+                    self._dedupe_relationships(request.relationships)
                 )
+                stats["relationships_created"] = self._import_relationships(relationships)
 
             self.logger.info(f"Requirements import completed: {stats}")
 
@@ -82,6 +81,26 @@ class RequirementsImportService(BaseService):
             self.logger.error(f"Requirements import failed: {e}")
             raise
 
+    async def aimport_requirements(self, request: RequirementsImportRequest) -> RequirementsImportResponse:
+        """
+        Import complete requirements dataset without blocking the event loop.
+
+        Runs import_requirements in a worker thread. The writes stay on the sync
+        driver, whose bulk paths (summary counters, bisection of failed
+        batches) the async driver does not share.
+
+        Args:
+            request: Same request as import_requirements
+
+        Returns:
+            RequirementsImportResponse with import statistics
+
+        Raises:
+            ValueError: If validation fails
+            Exception: If import fails
+        """
+        return await asyncio.to_thread(self.import_requirements, request)
+
     def _import_fsrs(self, fsrs: list) -> int:
         """
         Import Functional Safety Requirements.
@@ -94,20 +113,10 @@ class RequirementsImportService(BaseService):
         """
         self.logger.info(f"Importing {len(fsrs)} FSR(s)...")
 
-        created_count = 0
-        for fsr in fsrs:
-            try:
-                fsr_data = fsr.model_dump(exclude_none=True)
-                self._create_node(
-                    queries.CREATE_FSR,
-                    fsr_data,
-                    "FunctionalSafetyRequirement"
-                )
-                created_count += 1
-
-            except Exception as e:
-                self.logger.warning(f"Failed to import FSR {fsr.id}: {e}")
-                # Continue with next FSR
+        created_count = self._bulk_create_nodes(
+            fsrs,
+            "FunctionalSafetyRequirement"
+        )
 
         self.logger.info(f"Successfully imported {created_count}/{len(fsrs)} FSR(s)")
         return created_count
@@ -124,20 +133,10 @@ class RequirementsImportService(BaseService):
         """
         self.logger.info(f"Importing {len(tsrs)} TSR(s)...")
 
-        created_count = 0
-        for tsr in tsrs:
-            try:
-                tsr_data = tsr.model_dump(exclude_none=True)
-                self._create_node(
-                    queries.CREATE_TSR,
-                    tsr_data,
-                    "TechnicalSafetyRequirement"
-                )
-                created_count += 1
-
-            except Exception as e:
-                self.logger.warning(f"Failed to import TSR {tsr.id}: {e}")
-                # Continue with next TSR
+        created_count = self._bulk_create_nodes(
+            tsrs,
+            "TechnicalSafetyRequirement"
+        )
 
         self.logger.info(f"Successfully imported {created_count}/{len(tsrs)} TSR(s)")
         return created_count
@@ -154,66 +153,11 @@ class RequirementsImportService(BaseService):
         """
         self.logger.info(f"Importing {len(components)} component(s)...")
 
-        created_count = 0
-        for component in components:
-            try:
-                # Check if component already exists
-                if self._node_exists(component.id):
-                    self.logger.debug(f"Component {component.id} already exists, skipping")
-                    continue
-
-                component_data = component.model_dump(exclude_none=True)
-                self._create_node(
-                    queries.CREATE_COMPONENT,
-                    component_data,
-                    "Component"
-                )
-                created_count += 1
-
-            except Exception as e:
-                self.logger.warning(f"Failed to import component {component.id}: {e}")
-                # Continue with next component
+        created_count = self._bulk_merge_nodes(
+            queries.MERGE_COMPONENT_BULK,
+            components,
+            "Component"
+        )
 
         self.logger.info(f"Successfully imported {created_count}/{len(components)} component(s)")
         return created_count
-
-    def _import_relationships(self, relationships: Dict[str, Any]) -> int:
-        """
-        Import relationships between requirements and other entities.
-
-        Args:
-            relationships: Dictionary mapping relationship types to [source, target] pairs
-
-        Returns:
-            Total number of relationships created
-        """
-        self.logger.info(f"Importing {len(relationships)} relationship type(s)...")
-
-        total_created = 0
-
-        for rel_type, pairs in relationships.items():
-            if not pairs:
-                continue
-
-            self.logger.info(f"Creating {len(pairs)} {rel_type} relationship(s)...")
-
-            created_count = 0
-            for source_id, target_id in pairs:
-                try:
-                    self._create_relationship(
-                        source_id=source_id,
-                        target_id=target_id,
-                        rel_type=rel_type
-                    )
-                    created_count += 1
-
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to create relationship ({source_id})-[{rel_type}]->({target_id}): {e}"
-                    )
-                    # Continue with next relationship
-
-            self.logger.info(f"Created {created_count}/{len(pairs)} {rel_type} relationship(s)")
-            total_created += created_count
-
-        return total_created
@@ -38,12 +38,14 @@ class TestsImportService(BaseService):
             Exception: If import fails
         """
         self.logger.info("Starting tests import...")
+        self._ensure_indexes_once()
 
         try:
             # Statistics counters
             stats = {
                 "test_cases_created": 0,
                 "relationships_created": 0,
+                "duplicate_relationships_dropped": 0,
             }
 
             # Import test cases
@@ -52,9 +54,10 @@ class TestsImportService(BaseService):
 
             # Import relationships
             if request.relationships:
-                stats["relationships_created"] = self._import_relationships(
-                    request.relationships
+                relationships, stats["duplicate_relationships_dropped"] = (
+                    self._dedupe_relationships(request.relationships)
                 )
+                stats["relationships_created"] = self._import_relationships(relationships)
 
             self.logger.info(f"Tests import completed: {stats}")
 
@@ -70,75 +73,25 @@ class TestsImportService(BaseService):
 
     def _import_test_cases(self, test_cases: list) -> int:
         """
-        Import test cases.
+        Import test cases, updating any that already exist.
 
         Args:
             test_cases: List of TestCaseNode models
 
         Returns:
-            Number of test cases created
+            Number of test cases created (updated ones are not counted)
         """
         self.logger.info(f"Importing {len(test_cases)} test case(s)...")
 
-        created_count = 0
-        for tc in test_cases:
-            try:
-                tc_data = tc.model_dump(exclude_none=True)
-                self._create_node(
-                    queries.CREATE_TEST_CASE,
-                    tc_data,
-                    "TestCase"
-                )
-                created_count += 1
-
-            except Exception as e:
-                self.logger.warning(f"Failed to import test case {tc.id}: {e}")
-                # Continue with next test case
+        created_count = self._bulk_merge_nodes(
+            queries.CREATE_TEST_CASES_BATCH,
+            test_cases,
+            "TestCase"
+        )
 
         self.logger.info(f"Successfully imported {created_count}/{len(test_cases)} test case(s)")
         return created_count
 
-    def _import_relationships(self, relationships: Dict[str, Any]) -> int:
-        """
-        Import relationships between test cases and requirements/components.
-
-        Args:
-            relationships: Dictionary mapping relationship types to [source, target] pairs
-
-        Returns:
-            Total number of relationships created
-        """
-        self.logger.info(f"Importing {len(relationships)} relationship type(s)...")
-
-        total_created = 0
-
-        for rel_type, pairs in relationships.items():
-            if not pairs:
-                continue
-
-            self.logger.info(f"Creating {len(pairs)} {rel_type} relationship(s)...")
-
-            created_count = 0
-            for source_id, target_id in pairs:
-                try:
-                    self._create_relationship(
-                        source_id=source_id,
-                        target_id=target_id,
-                        rel_type=rel_type
-                    )
-                    created_count += 1
-
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to create relationship ({source_id})-[{rel_type}]->({target_id}): {e}"
-                    )
-                    # Continue with next relationship
-
-            self.logger.info(f"Created {created_count}/{len(pairs)} {rel_type} relationship(s)")
-            total_created += created_count
-
-        return total_created
-
     def update_test_status(
         self,
         test_id: str,
@@ -163,22 +116,22 @@ class TestsImportService(BaseService):
         self.logger.info(f"Updating test case {test_id} status to {status}")
 
         try:
-            # Check if test exists
-            if not self._node_exists(test_id):
-                raise ValueError(f"Test case {test_id} not found")
-
-            # Update test status
-            result_data = self.driver.execute_write_transaction(
+            # Single managed write routed to the leader (no row back means no
+            # such test case)
+            result_data = self.driver.execute_query(
                 queries.UPDATE_TEST_STATUS,
                 parameters={
                     "test_id": test_id,
                     "status": status,
                     "result": result
-                }
+                },
+                as_dicts=True
             )
 
             if not result_data:
-                raise ValueError(f"Failed to update test case {test_id}")
+                raise ValueError(f"Test case {test_id} not found")
+
+            self._bump_graph_version()
 
             self.logger.info(f"Successfully updated test case {test_id}")
             return result_data[0]["tc"]
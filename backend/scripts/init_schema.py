@@ -18,13 +18,24 @@ Environment variables required:
 """
 
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from neo4j import GraphDatabase, Driver
+from neo4j import GraphDatabase, Driver, ManagedTransaction, RoutingControl, Session
 from neo4j.exceptions import ServiceUnavailable, AuthError
 
+# Schema statements committed together in one transaction
+SCHEMA_BATCH_SIZE = 10
+
+# Constraint and index DDL statements in the schema file. Anchoring at the
+# start of a line skips commented-out DDL; group 2 is the statement kind.
+SCHEMA_STATEMENT_PATTERN = re.compile(
+    r"^[ \t]*(CREATE\s+(CONSTRAINT|(?:FULLTEXT\s+)?INDEX)\b[^;]*);",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 class SchemaInitializer:
     """Initialize Neo4j database schema."""
@@ -99,6 +110,48 @@ class SchemaInitializer:
         print(f"✓ Reading schema from {schema_file}")
         return schema_file.read_text()
 
+    @staticmethod
+    def _run_statements(tx: ManagedTransaction, statements: List[str]) -> None:
+        """
+        Run schema statements inside one transaction.
+
+        Args:
+            tx: Managed write transaction
+            statements: Schema statements without trailing semicolons
+        """
+        for statement in statements:
+            tx.run(statement + ";").consume()
+
+    def _run_batch(self, session: Session, batch: List[str]) -> List[Optional[Exception]]:
+        """
+        Commit a batch of schema statements, falling back to one at a time.
+
+        The batch is first committed as a single transaction. If any statement
+        fails the whole transaction is rolled back, so the batch is re-run
+        statement by statement to apply the rest and pin down the failures.
+
+        Args:
+            session: Open Neo4j session
+            batch: Schema statements without trailing semicolons
+
+        Returns:
+            One entry per statement: None if it ran, else the raised exception
+        """
+        try:
+            session.execute_write(self._run_statements, batch)
+            return [None] * len(batch)
+        except Exception:
+            pass
+
+        outcomes: List[Optional[Exception]] = []
+        for statement in batch:
+            try:
+                self.driver.execute_query(statement + ";", routing_=RoutingControl.WRITE)
+                outcomes.append(None)
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
     def execute_schema(self, schema_script: str) -> tuple[int, int]:
         """
         Execute schema creation script.
@@ -112,40 +165,40 @@ class SchemaInitializer:
         if not self.driver:
             raise RuntimeError("Not connected to database")
 
-        # Split script into individual statements
-        statements = [
-            stmt.strip()
-            for stmt in schema_script.split(";")
-            if stmt.strip()
-            and not stmt.strip().startswith("//")
-            and "CREATE CONSTRAINT" in stmt or "CREATE INDEX" in stmt or "CREATE FULLTEXT INDEX" in stmt
-        ]
+        # Extract and classify DDL statements in a single scan
+        statements: List[str] = []
+        is_constraint: List[bool] = []
+        for match in SCHEMA_STATEMENT_PATTERN.finditer(schema_script):
+            statements.append(match.group(1))
+            is_constraint.append(match.group(2).upper() == "CONSTRAINT")
 
         constraints_created = 0
         indexes_created = 0
 
         print(f"\n⚙ Executing {len(statements)} schema statements...")
 
+        # Commit statements in batches so each transaction log flush covers
+        # several statements instead of one
+        outcomes: List[Optional[Exception]] = []
         with self.driver.session() as session:
-            for i, statement in enumerate(statements, 1):
-                try:
-                    # Add semicolon back
-                    full_statement = statement + ";"
-                    session.run(full_statement)
-
-                    if "CONSTRAINT" in statement:
-                        constraints_created += 1
-                        print(f"  [{i}/{len(statements)}] Constraint created")
-                    elif "INDEX" in statement:
-                        indexes_created += 1
-                        print(f"  [{i}/{len(statements)}] Index created")
-
-                except Exception as e:
-                    # Constraint/index might already exist
-                    if "already exists" in str(e).lower() or "equivalent" in str(e).lower():
-                        print(f"  [{i}/{len(statements)}] Already exists (skipped)")
-                    else:
-                        print(f"  [{i}/{len(statements)}] Error: {e}")
+            for start in range(0, len(statements), SCHEMA_BATCH_SIZE):
+                batch = statements[start:start + SCHEMA_BATCH_SIZE]
+                outcomes.extend(self._run_batch(session, batch))
+
+        for i, (constraint, error) in enumerate(zip(is_constraint, outcomes, strict=True), 1):
+            if error is None:
+                if constraint:
+                    constraints_created += 1
+                    print(f"  [{i}/{len(statements)}] Constraint created")
+                else:
+                    indexes_created += 1
+                    print(f"  [{i}/{len(statements)}] Index created")
+
+            # Constraint/index might already exist
+            elif "already exists" in str(error).lower() or "equivalent" in str(error).lower():
+                print(f"  [{i}/{len(statements)}] Already exists (skipped)")
+            else:
+                print(f"  [{i}/{len(statements)}] Error: {error}")
 
         return constraints_created, indexes_created
 
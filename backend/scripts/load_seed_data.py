@@ -13,10 +13,14 @@ import argparse
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +29,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum entities per list in a single import POST
+IMPORT_CHUNK_SIZE = 1000
+
 
 class SeedDataLoader:
     """Load seed data into the Safety Graph Twin API."""
@@ -38,6 +45,21 @@ class SeedDataLoader:
         """
         self.api_url = api_url.rstrip("/")
         self.seed_dir = Path(__file__).parent.parent / "data" / "seed"
+        # One session for all calls, so HTTP keep-alive connections are reused.
+        # Retry only applies to idempotent methods, so import POSTs (which
+        # create nodes) are never replayed.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
 
     def check_api_health(self) -> bool:
         """
@@ -47,25 +69,34 @@ class SeedDataLoader:
             True if API is healthy, False otherwise
         """
         try:
-            response = requests.get(f"{self.api_url}/health", timeout=5)
+            # Both checks hit the same API, so issue them at the same time
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                api_future = executor.submit(
+                    self.session.get, f"{self.api_url}/health", timeout=5
+                )
+                db_future = executor.submit(
+                    self.session.get, f"{self.api_url}/health/db", timeout=5
+                )
+                response = api_future.result()
+                db_response = db_future.result()
+
             response.raise_for_status()
 
             health = response.json()
-            logger.info(f"✓ API health check: {health['status']}")
+            logger.info("✓ API health check: %s", health["status"])
 
             # Check database health
-            db_response = requests.get(f"{self.api_url}/health/db", timeout=5)
             db_health = db_response.json()
 
             if db_health["status"] == "healthy":
-                logger.info(f"✓ Database health check: {db_health['status']}")
+                logger.info("✓ Database health check: %s", db_health["status"])
                 return True
             else:
-                logger.error(f"✗ Database unhealthy: {db_health.get('message')}")
+                logger.error("✗ Database unhealthy: %s", db_health.get("message"))
                 return False
 
         except requests.RequestException as e:
-            logger.error(f"✗ API health check failed: {e}")
+            logger.error("✗ API health check failed: %s", e)
             return False
 
     def load_json_file(self, filename: str) -> Dict[str, Any]:
@@ -83,11 +114,81 @@ class SeedDataLoader:
             json.JSONDecodeError: If JSON is invalid
         """
         file_path = self.seed_dir / filename
-        logger.info(f"Loading {filename}...")
+        logger.info("Loading %s...", filename)
 
         with open(file_path, "r") as f:
             return json.load(f)
 
+    def iter_import_chunks(
+        self, data: Dict[str, Any], chunk_size: int = IMPORT_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Split an import payload into request bodies of bounded size.
+
+        Every entity list is sliced to at most chunk_size items per body.
+        Relationships are only sent with the last body, once all nodes they
+        reference have been created.
+
+        Args:
+            data: Parsed seed file
+            chunk_size: Maximum number of items per entity list
+
+        Yields:
+            Import request bodies
+        """
+        entity_keys = [
+            key for key, value in data.items()
+            if isinstance(value, list) and key != "relationships"
+        ]
+        longest = max((len(data[key]) for key in entity_keys), default=0)
+        starts = range(0, longest, chunk_size) if longest else [0]
+        last_start = starts[-1]
+
+        for start in starts:
+            body = {
+                key: value
+                for key, value in data.items()
+                if key not in entity_keys and key != "relationships"
+            }
+            for key in entity_keys:
+                body[key] = data[key][start:start + chunk_size]
+            body["relationships"] = (
+                data.get("relationships", {}) if start == last_start else {}
+            )
+            yield body
+
+    def post_import(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, int]:
+        """
+        POST seed data to an import endpoint in bounded chunks.
+
+        Args:
+            endpoint: Import endpoint name (e.g. "hara")
+            data: Parsed seed file
+
+        Returns:
+            Import statistics summed across all chunks
+
+        Raises:
+            requests.HTTPError: If any chunk is rejected
+        """
+        stats: Dict[str, int] = {}
+
+        for body in self.iter_import_chunks(data):
+            # orjson serializes far faster than the stdlib json behind json=;
+            # requests sets Content-Length from the bytes
+            response = self.session.post(
+                f"{self.api_url}/import/{endpoint}",
+                data=orjson.dumps(body),
+                headers={"Content-Type": "application/json"},
+                timeout=30,
+            )
+            response.raise_for_status()
+
+            for key, value in response.json()["data"].items():
+                stats[key] = stats.get(key, 0) + value
+
+        return stats
+
     def import_hara_data(self) -> bool:
         """
         Import HARA data (hazards, scenarios, safety goals).
@@ -102,35 +203,33 @@ class SeedDataLoader:
         try:
             data = self.load_json_file("hara_data.json")
 
-            response = requests.post(
-                f"{self.api_url}/import/hara",
-                json=data,
-                headers={"Content-Type": "application/json"},
-                timeout=30,
+            stats = self.post_import("hara", data)
+
+            logger.info(
+                "✓ HARA import successful:\n"
+                "  - Hazards created: %s\n"
+                "  - Scenarios created: %s\n"
+                "  - Safety goals created: %s\n"
+                "  - Relationships created: %s",
+                stats["hazards_created"],
+                stats["scenarios_created"],
+                stats["safety_goals_created"],
+                stats["relationships_created"],
             )
 
-            response.raise_for_status()
-            result = response.json()
-
-            logger.info(f"✓ HARA import successful:")
-            logger.info(f"  - Hazards created: {result['data']['hazards_created']}")
-            logger.info(f"  - Scenarios created: {result['data']['scenarios_created']}")
-            logger.info(f"  - Safety goals created: {result['data']['safety_goals_created']}")
-            logger.info(f"  - Relationships created: {result['data']['relationships_created']}")
-
             return True
 
         except requests.HTTPError as e:
-            logger.error(f"✗ HARA import failed (HTTP {e.response.status_code}):")
+            logger.error("✗ HARA import failed (HTTP %s):", e.response.status_code)
             try:
                 error_detail = e.response.json()
-                logger.error(f"  {error_detail}")
+                logger.error("  %s", error_detail)
             except json.JSONDecodeError:
-                logger.error(f"  {e.response.text}")
+                logger.error("  %s", e.response.text)
             return False
 
         except Exception as e:
-            logger.error(f"✗ HARA import failed: {e}")
+            logger.error("✗ HARA import failed: %s", e)
             return False
 
     def import_fmea_data(self) -> bool:
@@ -147,35 +246,33 @@ class SeedDataLoader:
         try:
             data = self.load_json_file("fmea_data.json")
 
-            response = requests.post(
-                f"{self.api_url}/import/fmea",
-                json=data,
-                headers={"Content-Type": "application/json"},
-                timeout=30,
+            stats = self.post_import("fmea", data)
+
+            logger.info(
+                "✓ FMEA import successful:\n"
+                "  - Components created: %s\n"
+                "  - Failure modes created: %s\n"
+                "  - FMEA entries created: %s\n"
+                "  - Relationships created: %s",
+                stats["components_created"],
+                stats["failure_modes_created"],
+                stats["fmea_entries_created"],
+                stats["relationships_created"],
             )
 
-            response.raise_for_status()
-            result = response.json()
-
-            logger.info(f"✓ FMEA import successful:")
-            logger.info(f"  - Components created: {result['data']['components_created']}")
-            logger.info(f"  - Failure modes created: {result['data']['failure_modes_created']}")
-            logger.info(f"  - FMEA entries created: {result['data']['fmea_entries_created']}")
-            logger.info(f"  - Relationships created: {result['data']['relationships_created']}")
-
             return True
 
         except requests.HTTPError as e:
-            logger.error(f"✗ FMEA import failed (HTTP {e.response.status_code}):")
+            logger.error("✗ FMEA import failed (HTTP %s):", e.response.status_code)
             try:
                 error_detail = e.response.json()
-                logger.error(f"  {error_detail}")
+                logger.error("  %s", error_detail)
             except json.JSONDecodeError:
-                logger.error(f"  {e.response.text}")
+                logger.error("  %s", e.response.text)
             return False
 
         except Exception as e:
-            logger.error(f"✗ FMEA import failed: {e}")
+            logger.error("✗ FMEA import failed: %s", e)
             return False
 
     def import_requirements_data(self) -> bool:
@@ -192,35 +289,33 @@ class SeedDataLoader:
         try:
             data = self.load_json_file("requirements_data.json")
 
-            response = requests.post(
-                f"{self.api_url}/import/requirements",
-                json=data,
-                headers={"Content-Type": "application/json"},
-                timeout=30,
+            stats = self.post_import("requirements", data)
+
+            logger.info(
+                "✓ Requirements import successful:\n"
+                "  - FSRs created: %s\n"
+                "  - TSRs created: %s\n"
+                "  - Components created: %s\n"
+                "  - Relationships created: %s",
+                stats["fsrs_created"],
+                stats["tsrs_created"],
+                stats["components_created"],
+                stats["relationships_created"],
             )
 
-            response.raise_for_status()
-            result = response.json()
-
-            logger.info(f"✓ Requirements import successful:")
-            logger.info(f"  - FSRs created: {result['data']['fsrs_created']}")
-            logger.info(f"  - TSRs created: {result['data']['tsrs_created']}")
-            logger.info(f"  - Components created: {result['data']['components_created']}")
-            logger.info(f"  - Relationships created: {result['data']['relationships_created']}")
-
             return True
 
         except requests.HTTPError as e:
-            logger.error(f"✗ Requirements import failed (HTTP {e.response.status_code}):")
+            logger.error("✗ Requirements import failed (HTTP %s):", e.response.status_code)
             try:
                 error_detail = e.response.json()
-                logger.error(f"  {error_detail}")
+                logger.error("  %s", error_detail)
             except json.JSONDecodeError:
-                logger.error(f"  {e.response.text}")
+                logger.error("  %s", e.response.text)
             return False
 
         except Exception as e:
-            logger.error(f"✗ Requirements import failed: {e}")
+            logger.error("✗ Requirements import failed: %s", e)
             return False
 
     def import_tests_data(self) -> bool:
@@ -237,33 +332,29 @@ class SeedDataLoader:
         try:
             data = self.load_json_file("tests_data.json")
 
-            response = requests.post(
-                f"{self.api_url}/import/tests",
-                json=data,
-                headers={"Content-Type": "application/json"},
-                timeout=30,
-            )
+            stats = self.post_import("tests", data)
 
-            response.raise_for_status()
-            result = response.json()
-
-            logger.info(f"✓ Tests import successful:")
-            logger.info(f"  - Test cases created: {result['data']['test_cases_created']}")
-            logger.info(f"  - Relationships created: {result['data']['relationships_created']}")
+            logger.info(
+                "✓ Tests import successful:\n"
+                "  - Test cases created: %s\n"
+                "  - Relationships created: %s",
+                stats["test_cases_created"],
+                stats["relationships_created"],
+            )
 
             return True
 
         except requests.HTTPError as e:
-            logger.error(f"✗ Tests import failed (HTTP {e.response.status_code}):")
+            logger.error("✗ Tests import failed (HTTP %s):", e.response.status_code)
             try:
                 error_detail = e.response.json()
-                logger.error(f"  {error_detail}")
+                logger.error("  %s", error_detail)
             except json.JSONDecodeError:
-                logger.error(f"  {e.response.text}")
+                logger.error("  %s", e.response.text)
             return False
 
         except Exception as e:
-            logger.error(f"✗ Tests import failed: {e}")
+            logger.error("✗ Tests import failed: %s", e)
             return False
 
     def get_statistics(self) -> bool:
@@ -278,30 +369,30 @@ class SeedDataLoader:
         logger.info("=" * 70)
 
         try:
-            response = requests.get(f"{self.api_url}/analytics/statistics", timeout=10)
+            response = self.session.get(f"{self.api_url}/analytics/statistics", timeout=10)
             response.raise_for_status()
 
             result = response.json()
             stats = result["data"]
 
             summary = stats.get("summary", {})
-            logger.info(f"Summary:")
-            logger.info(f"  - Total nodes: {summary.get('total_nodes', 0)}")
-            logger.info(f"  - Total relationships: {summary.get('total_relationships', 0)}")
-            logger.info(f"  - Total hazards: {summary.get('total_hazards', 0)}")
-            logger.info(f"  - Verified hazards: {summary.get('verified_hazards', 0)}")
-            logger.info(f"  - Coverage: {summary.get('coverage_percentage', 0):.1f}%")
+            logger.info("Summary:")
+            logger.info("  - Total nodes: %s", summary.get("total_nodes", 0))
+            logger.info("  - Total relationships: %s", summary.get("total_relationships", 0))
+            logger.info("  - Total hazards: %s", summary.get("total_hazards", 0))
+            logger.info("  - Verified hazards: %s", summary.get("verified_hazards", 0))
+            logger.info("  - Coverage: %.1f%%", summary.get("coverage_percentage", 0))
 
             node_counts = stats.get("node_counts", {})
             if node_counts:
-                logger.info(f"\nNode counts:")
+                logger.info("\nNode counts:")
                 for label, count in sorted(node_counts.items()):
-                    logger.info(f"  - {label}: {count}")
+                    logger.info("  - %s: %s", label, count)
 
             return True
 
         except Exception as e:
-            logger.error(f"✗ Failed to get statistics: {e}")
+            logger.error("✗ Failed to get statistics: %s", e)
             return False
 
     def load_all(self) -> bool:
@@ -311,45 +402,50 @@ class SeedDataLoader:
         Returns:
             True if all imports successful, False otherwise
         """
-        logger.info("=" * 70)
-        logger.info("Safety Graph Twin - Seed Data Loader")
-        logger.info("=" * 70)
+        try:
+            logger.info("=" * 70)
+            logger.info("Safety Graph Twin - Seed Data Loader")
+            logger.info("=" * 70)
 
-        # Check API health
-        if not self.check_api_health():
-            logger.error("API is not healthy. Cannot proceed with import.")
-            return False
+            # Check API health
+            if not self.check_api_health():
+                logger.error("API is not healthy. Cannot proceed with import.")
+                return False
 
-        # Import data in dependency order
-        success = True
+            # Import data in dependency order
+            success = True
 
-        # 1. HARA (no dependencies)
-        if not self.import_hara_data():
-            success = False
+            # 1-2. HARA and FMEA (no dependencies, so run side by side)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                hara = executor.submit(self.import_hara_data)
+                fmea = executor.submit(self.import_fmea_data)
 
-        # 2. FMEA (no dependencies)
-        if not self.import_fmea_data():
-            success = False
+                if not hara.result():
+                    success = False
+                if not fmea.result():
+                    success = False
 
-        # 3. Requirements (depends on HARA safety goals and FMEA components)
-        if not self.import_requirements_data():
-            success = False
+            # 3. Requirements (depends on HARA safety goals and FMEA components)
+            if not self.import_requirements_data():
+                success = False
 
-        # 4. Tests (depends on Requirements TSRs and Components)
-        if not self.import_tests_data():
-            success = False
+            # 4. Tests (depends on Requirements TSRs and Components)
+            if not self.import_tests_data():
+                success = False
 
-        # Get final statistics
-        self.get_statistics()
+            # Get final statistics
+            self.get_statistics()
 
-        logger.info("=" * 70)
-        if success:
-            logger.info("✓ All seed data loaded successfully!")
-        else:
-            logger.warning("⚠ Some imports failed. Check logs above for details.")
-        logger.info("=" * 70)
+            logger.info("=" * 70)
+            if success:
+                logger.info("✓ All seed data loaded successfully!")
+            else:
+                logger.warning("⚠ Some imports failed. Check logs above for details.")
+            logger.info("=" * 70)
 
-        return success
+            return success
+        finally:
+            self.close()
 
 
 def main():
@@ -2,13 +2,198 @@
 Pytest configuration and fixtures for Safety Graph Twin tests.
 """
 
+import functools
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from neo4j import GraphDatabase
 
 from app.core.config import get_settings
+from app.db import queries
 from app.db.neo4j_driver import Neo4jDriver, get_neo4j_driver, close_neo4j_driver
 from app.main import app
+from app.models.schemas import HARAImportRequest
+from app.services.base_service import BaseService
+
+
+# ============================================================================
+# Graph Helpers
+# ============================================================================
+
+# Hazard -> safety goal -> FSR -> TSR -> test case, fully traced
+FULL_CHAIN_GRAPH = {
+    "nodes": {
+        "Hazard": [{"id": "H-001", "description": "Test", "asil": "D"}],
+        "SafetyGoal": [{"id": "SG-001", "description": "Test", "asil": "D"}],
+        "FunctionalSafetyRequirement": [
+            {"id": "FSR-001", "text": "Test", "asil": "D", "status": "approved"}
+        ],
+        "TechnicalSafetyRequirement": [
+            {"id": "TSR-001", "text": "Test", "asil": "D", "status": "approved",
+             "verification_method": "Test"}
+        ],
+        "TestCase": [{"id": "TC-001", "name": "Test", "test_type": "unit", "status": "passed"}],
+    },
+    "relationships": {
+        "MITIGATED_BY": [["H-001", "SG-001"]],
+        "REFINED_TO": [["SG-001", "FSR-001"], ["FSR-001", "TSR-001"]],
+        "VERIFIED_BY": [["TSR-001", "TC-001"]],
+    },
+}
+
+
+# Hazards at every ASIL level; only H-D1 is mitigated (by SG-001)
+MULTI_ASIL_GRAPH = {
+    "nodes": {
+        "Hazard": [
+            {"id": "H-D1", "description": "ASIL D hazard 1", "asil": "D"},
+            {"id": "H-D2", "description": "ASIL D hazard 2", "asil": "D"},
+            {"id": "H-C", "description": "ASIL C hazard", "asil": "C"},
+            {"id": "H-B", "description": "ASIL B hazard", "asil": "B"},
+            {"id": "H-A", "description": "ASIL A hazard", "asil": "A"},
+        ],
+        "SafetyGoal": [{"id": "SG-001", "description": "Test", "asil": "D"}],
+    },
+    "relationships": {
+        "MITIGATED_BY": [["H-D1", "SG-001"]],
+    },
+}
+
+
+def _clear_graph(session_driver) -> None:
+    """Delete all nodes and relationships, keeping indexes."""
+    with session_driver.session() as session:
+        # Batched transactions; indexes are created once per session below
+        session.run(queries.DELETE_ALL_BATCHED).consume()
+
+    # The graph changed behind the services' back; drop their read caches
+    BaseService._bump_graph_version()
+
+
+def _load_graph(driver: Neo4jDriver, nodes: dict = None, relationships: dict = None) -> None:
+    """
+    Write nodes and relationships in a single transaction.
+
+    Each label and each relationship type is one UNWIND statement; all of
+    them share one session and one commit.
+    """
+    def _write(tx) -> None:
+        for label, rows in (nodes or {}).items():
+            query = f"""
+            UNWIND $rows AS row
+            CREATE (n:{label})
+            SET n = row, n.created_at = datetime(), n.updated_at = datetime()
+            """
+            tx.run(query, rows=rows).consume()
+
+        for rel_type, pairs in (relationships or {}).items():
+            tx.run(queries.batch_create_relationship_pairs_query(rel_type), pairs=pairs).consume()
+
+    with driver.get_session() as session:
+        session.execute_write(_write)
+
+    # Written behind the services' back; drop their read caches
+    BaseService._bump_graph_version()
+
+
+@functools.lru_cache(maxsize=64)
+def _create_node_query(label: str) -> str:
+    """Build the create_test_node statement for a label, once per label."""
+    return f"""
+    CREATE (n:{label} $properties)
+    RETURN n
+    """
+
+
+@functools.lru_cache(maxsize=64)
+def _create_relationship_query(rel_type: str, source_label: str = None,
+                               target_label: str = None) -> str:
+    """Build the create_test_relationship statement, once per type/label combination."""
+    source = f"a:{source_label}" if source_label else "a"
+    target = f"b:{target_label}" if target_label else "b"
+    return f"""
+    MATCH ({source} {{id: $source_id}})
+    MATCH ({target} {{id: $target_id}})
+    CREATE (a)-[r:{rel_type}]->(b)
+    RETURN r
+    """
+
+
+def _parse_json_with_orjson(response) -> None:
+    """Response hook: make ``response.json()`` decode with orjson."""
+    response.json = lambda **kwargs: orjson.loads(response.content)
+
+
+def _hara_import_payload() -> dict:
+    """Build a fresh sample HARA import payload."""
+    return {
+        "hazards": [
+            {
+                "id": "H-TEST-001",
+                "description": "Test hazard 1",
+                "asil": "D"
+            },
+            {
+                "id": "H-TEST-002",
+                "description": "Test hazard 2",
+                "asil": "C"
+            }
+        ],
+        "scenarios": [
+            {
+                "id": "SC-TEST-001",
+                "name": "Test scenario",
+                "description": "Test operating scenario"
+            }
+        ],
+        "safety_goals": [
+            {
+                "id": "SG-TEST-001",
+                "description": "Test safety goal",
+                "asil": "D"
+            }
+        ],
+        "relationships": {
+            "OCCURS_IN": [["H-TEST-001", "SC-TEST-001"]],
+            "MITIGATED_BY": [["H-TEST-001", "SG-TEST-001"]]
+        }
+    }
+
+
+def _fmea_import_payload() -> dict:
+    """Build a fresh sample FMEA import payload."""
+    return {
+        "components": [
+            {
+                "id": "C-TEST-001",
+                "name": "Test Component",
+                "component_type": "hardware"
+            }
+        ],
+        "failure_modes": [
+            {
+                "id": "FM-TEST-001",
+                "description": "Test failure mode",
+                "category": "electrical"
+            }
+        ],
+        "fmea_entries": [
+            {
+                "id": "FMEA-TEST-001",
+                "function_description": "Test function",
+                "potential_failure": "Test failure",
+                "severity": 8,
+                "occurrence": 3,
+                "detection": 4,
+                "rpn": 96
+            }
+        ],
+        "relationships": {
+            "HAS_FAILURE_MODE": [["C-TEST-001", "FM-TEST-001"]],
+            "ANALYZED_IN": [["FM-TEST-001", "FMEA-TEST-001"]]
+        }
+    }
 
 
 # ============================================================================
@@ -35,11 +220,79 @@ def neo4j_session_driver(test_settings):
         auth=(test_settings.neo4j_user, test_settings.neo4j_password)
     )
 
+    # Service tests don't start the app, so the lifespan that normally
+    # creates these may never run
+    with driver.session() as session:
+        for statement in queries.INDEX_DDL:
+            session.run(statement)
+
     yield driver
 
     driver.close()
 
 
+@pytest.fixture(scope="session")
+def neo4j_app_driver():
+    """Get the application's singleton Neo4j driver once per test session."""
+    return get_neo4j_driver()
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """
+    Get FastAPI test client.
+
+    The client is entered once per session, so the app lifespan (startup
+    and shutdown) runs once rather than per test.
+    """
+    with TestClient(app) as client:
+        client.event_hooks["response"].append(_parse_json_with_orjson)
+        yield client
+
+
+# ============================================================================
+# Class Fixtures (run once per test class)
+# ============================================================================
+
+@pytest.fixture(scope="class")
+def full_chain_graph(neo4j_session_driver, neo4j_app_driver):
+    """
+    Seed FULL_CHAIN_GRAPH once for a class of read-only tests.
+
+    The database is cleared once before seeding, not before every test, so
+    tests using this fixture must not write (or request clean_database).
+
+    Returns:
+        IDs of the chain's nodes by role
+    """
+    _clear_graph(neo4j_session_driver)
+    _load_graph(neo4j_app_driver, **FULL_CHAIN_GRAPH)
+
+    return {
+        "hazard": "H-001",
+        "safety_goal": "SG-001",
+        "fsr": "FSR-001",
+        "tsr": "TSR-001",
+        "test_case": "TC-001",
+    }
+
+
+@pytest.fixture(scope="class")
+def multi_asil_graph(neo4j_session_driver, neo4j_app_driver):
+    """
+    Seed MULTI_ASIL_GRAPH once for a class of read-only tests.
+
+    Like full_chain_graph, tests using this fixture must not write.
+
+    Returns:
+        IDs of the mitigated hazard and its safety goal
+    """
+    _clear_graph(neo4j_session_driver)
+    _load_graph(neo4j_app_driver, **MULTI_ASIL_GRAPH)
+
+    return {"mitigated": "H-D1", "safety_goal": "SG-001"}
+
+
 # ============================================================================
 # Function Fixtures (run once per test function)
 # ============================================================================
@@ -52,9 +305,7 @@ def clean_database(neo4j_session_driver):
     WARNING: This deletes all data in the database!
     Only use with a test database, never production!
     """
-    with neo4j_session_driver.session() as session:
-        # Delete all nodes and relationships
-        session.run("MATCH (n) DETACH DELETE n")
+    _clear_graph(neo4j_session_driver)
 
     yield
 
@@ -64,20 +315,12 @@ def clean_database(neo4j_session_driver):
 
 
 @pytest.fixture
-def neo4j_driver(clean_database):
-    """Get Neo4j driver instance for testing."""
-    driver = get_neo4j_driver()
-    yield driver
+def neo4j_driver(clean_database, neo4j_app_driver):
+    """Get Neo4j driver instance for testing, on a clean database."""
+    yield neo4j_app_driver
     # Don't close the driver - it's a singleton managed by the application
 
 
-@pytest.fixture
-def api_client():
-    """Get FastAPI test client."""
-    client = TestClient(app)
-    yield client
-
-
 # ============================================================================
 # Test Data Fixtures
 # ============================================================================
@@ -163,74 +406,31 @@ def sample_test_case():
 @pytest.fixture
 def sample_hara_import():
     """Sample HARA import request for testing."""
-    return {
-        "hazards": [
-            {
-                "id": "H-TEST-001",
-                "description": "Test hazard 1",
-                "asil": "D"
-            },
-            {
-                "id": "H-TEST-002",
-                "description": "Test hazard 2",
-                "asil": "C"
-            }
-        ],
-        "scenarios": [
-            {
-                "id": "SC-TEST-001",
-                "name": "Test scenario",
-                "description": "Test operating scenario"
-            }
-        ],
-        "safety_goals": [
-            {
-                "id": "SG-TEST-001",
-                "description": "Test safety goal",
-                "asil": "D"
-            }
-        ],
-        "relationships": {
-            "OCCURS_IN": [["H-TEST-001", "SC-TEST-001"]],
-            "MITIGATED_BY": [["H-TEST-001", "SG-TEST-001"]]
-        }
-    }
+    return _hara_import_payload()
+
+
+@pytest.fixture(scope="session")
+def sample_hara_request():
+    """Sample HARA import request, validated once per session. Do not mutate."""
+    return HARAImportRequest.model_validate(_hara_import_payload())
+
+
+@pytest.fixture(scope="session")
+def sample_hara_import_body():
+    """Sample HARA import request, JSON-encoded once per session."""
+    return orjson.dumps(_hara_import_payload())
 
 
 @pytest.fixture
 def sample_fmea_import():
     """Sample FMEA import request for testing."""
-    return {
-        "components": [
-            {
-                "id": "C-TEST-001",
-                "name": "Test Component",
-                "component_type": "hardware"
-            }
-        ],
-        "failure_modes": [
-            {
-                "id": "FM-TEST-001",
-                "description": "Test failure mode",
-                "category": "electrical"
-            }
-        ],
-        "fmea_entries": [
-            {
-                "id": "FMEA-TEST-001",
-                "function_description": "Test function",
-                "potential_failure": "Test failure",
-                "severity": 8,
-                "occurrence": 3,
-                "detection": 4,
-                "rpn": 96
-            }
-        ],
-        "relationships": {
-            "HAS_FAILURE_MODE": [["C-TEST-001", "FM-TEST-001"]],
-            "ANALYZED_IN": [["FM-TEST-001", "FMEA-TEST-001"]]
-        }
-    }
+    return _fmea_import_payload()
+
+
+@pytest.fixture(scope="session")
+def sample_fmea_import_body():
+    """Sample FMEA import request, JSON-encoded once per session."""
+    return orjson.dumps(_fmea_import_payload())
 
 
 # ============================================================================
@@ -247,14 +447,15 @@ def create_test_node(neo4j_driver):
             node = create_test_node("Hazard", {"id": "H-001", "description": "Test"})
     """
     def _create_node(label: str, properties: dict):
-        query = f"""
-        CREATE (n:{label} $properties)
-        RETURN n
-        """
-        result = neo4j_driver.execute_write_transaction(query, {"properties": properties})
-        return result[0]["n"] if result else None
+        query = _create_node_query(label)
+        record = session.execute_write(
+            lambda tx: tx.run(query, properties=properties).single()
+        )
+        return record["n"] if record else None
 
-    return _create_node
+    # One session for the whole test instead of one per call
+    with neo4j_driver.get_session() as session:
+        yield _create_node
 
 
 @pytest.fixture
@@ -262,24 +463,81 @@ def create_test_relationship(neo4j_driver):
     """
     Factory fixture to create test relationships in the database.
 
+    Pass the endpoint labels when known so the MATCHes use the per-label id
+    indexes instead of scanning every node.
+
     Usage:
         def test_something(create_test_relationship):
-            rel = create_test_relationship("H-001", "SG-001", "MITIGATED_BY")
+            rel = create_test_relationship("H-001", "SG-001", "MITIGATED_BY",
+                                           source_label="Hazard", target_label="SafetyGoal")
     """
-    def _create_relationship(source_id: str, target_id: str, rel_type: str):
-        query = f"""
-        MATCH (a {{id: $source_id}})
-        MATCH (b {{id: $target_id}})
-        CREATE (a)-[r:{rel_type}]->(b)
-        RETURN r
-        """
-        result = neo4j_driver.execute_write_transaction(
-            query,
-            {"source_id": source_id, "target_id": target_id}
+    def _create_relationship(source_id: str, target_id: str, rel_type: str,
+                             source_label: str = None, target_label: str = None):
+        query = _create_relationship_query(rel_type, source_label, target_label)
+        record = session.execute_write(
+            lambda tx: tx.run(query, source_id=source_id, target_id=target_id).single()
         )
-        return result[0]["r"] if result else None
+        return record["r"] if record else None
+
+    with neo4j_driver.get_session() as session:
+        yield _create_relationship
+
+
+@pytest.fixture
+def seed_graph(neo4j_driver):
+    """
+    Factory fixture to bulk-load a graph straight into the (clean) database.
+
+    Each label and each relationship type is written with one UNWIND
+    statement, so tests that only need data to query skip the import API.
 
-    return _create_relationship
+    Usage:
+        def test_something(seed_graph):
+            seed_graph(
+                nodes={"Hazard": [{"id": "H-001", "description": "Test", "asil": "D"}]},
+                relationships={"MITIGATED_BY": [["H-001", "SG-001"]]},
+            )
+    """
+    def _seed_graph(nodes: dict = None, relationships: dict = None):
+        _load_graph(neo4j_driver, nodes, relationships)
+
+    return _seed_graph
+
+
+@pytest.fixture
+def seed_numbered(neo4j_driver):
+    """
+    Factory fixture to generate n numbered nodes server-side.
+
+    The whole set comes from one ``UNWIND range(1, $n)`` statement, so
+    volume tests ship a few parameters instead of one row per node. IDs are
+    ``<id_prefix>001`` .. ``<id_prefix>NNN``; each ``numbered`` property is
+    its text prefix followed by the node number.
+
+    Usage:
+        def test_something(seed_numbered):
+            seed_numbered("Hazard", 50, "H-", numbered={"description": "Test hazard "}, asil="D")
+    """
+    def _seed_numbered(label: str, n: int, id_prefix: str,
+                       numbered: dict = None, **properties):
+        query = f"""
+        UNWIND range(1, $n) AS i
+        CREATE (node:{label})
+        SET node = $properties,
+            node += apoc.map.fromPairs([key IN keys($numbered) | [key, $numbered[key] + toString(i)]]),
+            node.id = $id_prefix + right('00' + toString(i), 3),
+            node.created_at = datetime(),
+            node.updated_at = datetime()
+        """
+        neo4j_driver.execute_write_transaction(query, {
+            "n": n,
+            "id_prefix": id_prefix,
+            "numbered": numbered or {},
+            "properties": properties,
+        })
+        BaseService._bump_graph_version()
+
+    return _seed_numbered
 
 
 # ============================================================================
@@ -7,77 +7,147 @@ import pytest
 
 @pytest.mark.integration
 @pytest.mark.api
-class TestHazardCoverageAPI:
-    """Test cases for hazard coverage analysis API."""
+class TestFullChainAPI:
+    """Read-only tests sharing one fully traced hazard chain (seeded once)."""
 
-    def test_get_hazard_coverage_full(self, api_client, clean_database):
+    def test_get_hazard_coverage_full(self, api_client, full_chain_graph):
         """Test hazard coverage with full traceability chain."""
-        # Create complete chain
-        api_client.post("/import/hara", json={
-            "hazards": [{"id": "H-001", "description": "Test", "asil": "D"}],
-            "scenarios": [],
-            "safety_goals": [{"id": "SG-001", "description": "Test", "asil": "D"}],
-            "relationships": {"MITIGATED_BY": [["H-001", "SG-001"]]}
-        })
-
-        api_client.post("/import/requirements", json={
-            "fsrs": [{"id": "FSR-001", "text": "Test", "asil": "D", "status": "approved"}],
-            "tsrs": [{"id": "TSR-001", "text": "Test", "asil": "D", "status": "approved",
-                     "verification_method": "Test"}],
-            "components": [],
-            "relationships": {
-                "REFINED_TO": [["SG-001", "FSR-001"], ["FSR-001", "TSR-001"]]
-            }
-        })
-
-        api_client.post("/import/tests", json={
-            "test_cases": [{"id": "TC-001", "name": "Test", "test_type": "unit", "status": "passed"}],
-            "relationships": {"VERIFIED_BY": [["TSR-001", "TC-001"]]}
-        })
-
-        # Get coverage
-        response = api_client.get("/analytics/coverage/hazard/H-001")
+        response = api_client.get(f"/analytics/coverage/hazard/{full_chain_graph['hazard']}")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
         assert data["data"]["coverage"]["coverage_status"] == "full"
 
-    def test_get_hazard_coverage_partial(self, api_client, clean_database):
-        """Test hazard coverage with partial traceability (no tests)."""
-        # Create partial chain (no tests)
-        api_client.post("/import/hara", json={
-            "hazards": [{"id": "H-001", "description": "Test", "asil": "D"}],
-            "scenarios": [],
-            "safety_goals": [{"id": "SG-001", "description": "Test", "asil": "D"}],
-            "relationships": {"MITIGATED_BY": [["H-001", "SG-001"]]}
-        })
+    def test_get_traceability_chain(self, api_client, full_chain_graph):
+        """Test getting traceability chain for hazard."""
+        response = api_client.get(f"/analytics/traceability/hazard/{full_chain_graph['hazard']}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data, list)
+        assert len(data) >= 1
 
-        # Get coverage
-        response = api_client.get("/analytics/coverage/hazard/H-001")
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestMultiAsilAPI:
+    """Read-only tests sharing one set of hazards across all ASIL levels (seeded once)."""
+
+    def test_get_hazard_coverage_partial(self, api_client, multi_asil_graph):
+        """Test hazard coverage with partial traceability (no tests)."""
+        response = api_client.get(f"/analytics/coverage/hazard/{multi_asil_graph['mitigated']}")
 
         assert response.status_code == 200
         data = response.json()
         assert data["data"]["coverage"]["coverage_status"] in ["partial", "none"]
 
-    def test_get_hazard_coverage_not_found(self, api_client, clean_database):
+    def test_get_hazard_coverage_not_found(self, api_client, multi_asil_graph):
         """Test hazard coverage for non-existent hazard."""
         response = api_client.get("/analytics/coverage/hazard/H-NOTFOUND")
 
         assert response.status_code == 404
 
-    def test_get_all_hazards_coverage(self, api_client, clean_database):
+    def test_get_hazard_coverage_batch(self, api_client, multi_asil_graph):
+        """Test batch coverage reports the same status as the single-hazard endpoint."""
+        response = api_client.get("/analytics/coverage/hazards/batch?id=H-D1&id=H-A")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        for hazard_id in ("H-D1", "H-A"):
+            single = api_client.get(f"/analytics/coverage/hazard/{hazard_id}").json()
+            assert (
+                data["coverage"][hazard_id]["coverage_status"]
+                == single["data"]["coverage"]["coverage_status"]
+            )
+        assert data["coverage"]["H-D1"]["coverage_status"] in ["partial", "none"]
+        assert data["coverage"]["H-A"]["coverage_status"] == "none"
+        assert data["not_found"] == []
+
+    def test_get_hazard_coverage_batch_not_found(self, api_client, multi_asil_graph):
+        """Test batch coverage lists unknown IDs instead of failing."""
+        response = api_client.get(
+            "/analytics/coverage/hazards/batch?id=H-D1&id=H-NOTFOUND&id=H-C"
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert set(data["coverage"]) == {"H-D1", "H-C"}
+        assert data["not_found"] == ["H-NOTFOUND"]
+
+    def test_get_hazard_coverage_batch_duplicates(self, api_client, multi_asil_graph):
+        """Test duplicate IDs are analyzed and reported once."""
+        response = api_client.get(
+            "/analytics/coverage/hazards/batch?id=H-B&id=H-B&id=H-MISSING&id=H-MISSING"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"] == "Coverage analysis for 1 hazard(s)"
+        assert list(data["data"]["coverage"]) == ["H-B"]
+        assert data["data"]["not_found"] == ["H-MISSING"]
+
+    @pytest.mark.parametrize("query,expected_count", [
+        ("asil=D&asil=C", 3),
+        ("asil=D", 2),
+        ("asil=A", 1),
+    ])
+    def test_get_all_hazards_coverage_asil_filter(
+        self, api_client, multi_asil_graph, query, expected_count
+    ):
+        """Test getting coverage with ASIL filter."""
+        response = api_client.get(f"/analytics/coverage/hazards?{query}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]["summary"]["total_hazards"] == expected_count
+
+    @pytest.mark.parametrize("query", ["", "asil=D&", "asil=A&asil=B&"])
+    def test_get_all_hazards_coverage_summary_only(self, api_client, multi_asil_graph, query):
+        """Test summary_only counters match the summary of the full response."""
+        full = api_client.get(f"/analytics/coverage/hazards?{query}").json()["data"]
+        response = api_client.get(f"/analytics/coverage/hazards?{query}summary_only=true")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert "hazards" not in data
+        assert data["summary"] == pytest.approx(full["summary"])
+
+    @pytest.mark.parametrize("asil,expected_count", [
+        ("D", 2),
+        ("C", 1),
+        ("B", 1),
+        ("A", 1),
+        ("QM", 0),
+    ])
+    def test_filter_hazards_by_asil(self, api_client, multi_asil_graph, asil, expected_count):
+        """Test filtering hazards by ASIL level."""
+        response = api_client.get(f"/analytics/filter/hazards?asil={asil}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "results" in data
+        assert data["count"] == expected_count
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestHazardCoverageAPI:
+    """Test cases for hazard coverage analysis API."""
+
+    def test_get_all_hazards_coverage(self, api_client, seed_graph):
         """Test getting coverage for all hazards."""
         # Create multiple hazards with different coverage
-        api_client.post("/import/hara", json={
-            "hazards": [
-                {"id": "H-001", "description": "Covered", "asil": "D"},
-                {"id": "H-002", "description": "Not covered", "asil": "C"}
-            ],
-            "scenarios": [],
-            "safety_goals": [{"id": "SG-001", "description": "Test", "asil": "D"}],
-            "relationships": {"MITIGATED_BY": [["H-001", "SG-001"]]}
-        })
+        seed_graph(
+            nodes={
+                "Hazard": [
+                    {"id": "H-001", "description": "Covered", "asil": "D"},
+                    {"id": "H-002", "description": "Not covered", "asil": "C"}
+                ],
+                "SafetyGoal": [{"id": "SG-001", "description": "Test", "asil": "D"}],
+            },
+            relationships={"MITIGATED_BY": [["H-001", "SG-001"]]},
+        )
 
         response = api_client.get("/analytics/coverage/hazards")
 
@@ -87,39 +157,30 @@ class TestHazardCoverageAPI:
         assert "summary" in data["data"]
         assert data["data"]["summary"]["total_hazards"] == 2
 
-    def test_get_all_hazards_coverage_asil_filter(self, api_client, clean_database):
-        """Test getting coverage with ASIL filter."""
-        # Create hazards with different ASIL levels
-        api_client.post("/import/hara", json={
-            "hazards": [
-                {"id": "H-D", "description": "ASIL D", "asil": "D"},
-                {"id": "H-C", "description": "ASIL C", "asil": "C"},
-                {"id": "H-A", "description": "ASIL A", "asil": "A"}
-            ],
-            "scenarios": [],
-            "safety_goals": [],
-            "relationships": {}
-        })
-
-        # Filter for ASIL D and C only
-        response = api_client.get("/analytics/coverage/hazards?asil=D&asil=C")
+    def test_get_all_hazards_coverage_summary_only_empty(self, api_client, clean_database):
+        """Test summary_only on an empty graph returns all-zero counters."""
+        response = api_client.get("/analytics/coverage/hazards?summary_only=true")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["data"]["summary"]["total_hazards"] == 2
-
-    def test_get_coverage_statistics(self, api_client, clean_database):
+        assert response.json()["data"]["summary"] == {
+            "total_hazards": 0,
+            "fully_covered": 0,
+            "partially_covered": 0,
+            "not_covered": 0,
+            "coverage_percentage": 0,
+        }
+
+    def test_get_coverage_statistics(self, api_client, seed_graph):
         """Test getting coverage statistics."""
         # Create some hazards
-        api_client.post("/import/hara", json={
-            "hazards": [
-                {"id": "H-001", "description": "Test1", "asil": "D"},
-                {"id": "H-002", "description": "Test2", "asil": "C"}
-            ],
-            "scenarios": [],
-            "safety_goals": [],
-            "relationships": {}
-        })
+        seed_graph(
+            nodes={
+                "Hazard": [
+                    {"id": "H-001", "description": "Test1", "asil": "D"},
+                    {"id": "H-002", "description": "Test2", "asil": "C"}
+                ],
+            },
+        )
 
         response = api_client.get("/analytics/coverage/statistics")
 
@@ -134,15 +195,16 @@ class TestHazardCoverageAPI:
 class TestComponentImpactAPI:
     """Test cases for component impact analysis API."""
 
-    def test_get_component_impact(self, api_client, clean_database):
+    def test_get_component_impact(self, api_client, seed_graph):
         """Test component impact analysis."""
         # Create component with some connections
-        api_client.post("/import/fmea", json={
-            "components": [{"id": "C-001", "name": "Test", "component_type": "hardware"}],
-            "failure_modes": [{"id": "FM-001", "description": "Test", "category": "electrical"}],
-            "fmea_entries": [],
-            "relationships": {"HAS_FAILURE_MODE": [["C-001", "FM-001"]]}
-        })
+        seed_graph(
+            nodes={
+                "Component": [{"id": "C-001", "name": "Test", "component_type": "hardware"}],
+                "FailureMode": [{"id": "FM-001", "description": "Test", "category": "electrical"}],
+            },
+            relationships={"HAS_FAILURE_MODE": [["C-001", "FM-001"]]},
+        )
 
         response = api_client.get("/analytics/impact/component/C-001")
 
@@ -158,18 +220,17 @@ class TestComponentImpactAPI:
 
         assert response.status_code == 404
 
-    def test_get_all_components_impact(self, api_client, clean_database):
+    def test_get_all_components_impact(self, api_client, seed_graph):
         """Test getting impact for all components."""
         # Create multiple components
-        api_client.post("/import/fmea", json={
-            "components": [
-                {"id": "C-001", "name": "Component 1", "component_type": "hardware"},
-                {"id": "C-002", "name": "Component 2", "component_type": "software"}
-            ],
-            "failure_modes": [],
-            "fmea_entries": [],
-            "relationships": {}
-        })
+        seed_graph(
+            nodes={
+                "Component": [
+                    {"id": "C-001", "name": "Component 1", "component_type": "hardware"},
+                    {"id": "C-002", "name": "Component 2", "component_type": "software"}
+                ],
+            },
+        )
 
         response = api_client.get("/analytics/impact/components")
 
@@ -179,19 +240,12 @@ class TestComponentImpactAPI:
         assert "components" in data["data"]
         assert len(data["data"]["components"]) == 2
 
-    def test_get_all_components_impact_with_limit(self, api_client, clean_database):
+    @pytest.mark.slow
+    def test_get_all_components_impact_with_limit(self, api_client, seed_numbered):
         """Test getting impact with limit parameter."""
         # Create multiple components
-        components = [
-            {"id": f"C-{i:03d}", "name": f"Component {i}", "component_type": "hardware"}
-            for i in range(1, 11)
-        ]
-        api_client.post("/import/fmea", json={
-            "components": components,
-            "failure_modes": [],
-            "fmea_entries": [],
-            "relationships": {}
-        })
+        seed_numbered("Component", 10, "C-", numbered={"name": "Component "},
+                      component_type="hardware")
 
         response = api_client.get("/analytics/impact/components?limit=5")
 
@@ -199,17 +253,33 @@ class TestComponentImpactAPI:
         data = response.json()
         assert len(data["data"]["components"]) == 5
 
-    def test_get_all_components_impact_type_filter(self, api_client, clean_database):
+    def test_get_all_components_impact_pagination(self, api_client, seed_numbered):
+        """Test paging through tied impact scores with the returned cursor."""
+        # All components score 0, so order comes from the ID tie-break
+        seed_numbered("Component", 10, "C-", numbered={"name": "Component "},
+                      component_type="hardware")
+
+        first = api_client.get("/analytics/impact/components?limit=6").json()["data"]
+        cursor = first["next_cursor"]
+        second = api_client.get(
+            "/analytics/impact/components",
+            params={"limit": 6, **cursor}
+        ).json()["data"]
+
+        ids = [c["component_id"] for c in first["components"] + second["components"]]
+        assert ids == [f"C-{i:03d}" for i in range(1, 11)]
+        assert second["next_cursor"] is None
+
+    def test_get_all_components_impact_type_filter(self, api_client, seed_graph):
         """Test getting impact with component type filter."""
-        api_client.post("/import/fmea", json={
-            "components": [
-                {"id": "C-HW", "name": "Hardware", "component_type": "hardware"},
-                {"id": "C-SW", "name": "Software", "component_type": "software"}
-            ],
-            "failure_modes": [],
-            "fmea_entries": [],
-            "relationships": {}
-        })
+        seed_graph(
+            nodes={
+                "Component": [
+                    {"id": "C-HW", "name": "Hardware", "component_type": "hardware"},
+                    {"id": "C-SW", "name": "Software", "component_type": "software"}
+                ],
+            },
+        )
 
         response = api_client.get("/analytics/impact/components?component_type=hardware")
 
@@ -224,57 +294,18 @@ class TestComponentImpactAPI:
 class TestTraceabilityAPI:
     """Test cases for traceability analysis API."""
 
-    def test_get_traceability_chain(self, api_client, clean_database):
-        """Test getting traceability chain for hazard."""
-        # Create complete chain
-        api_client.post("/import/hara", json={
-            "hazards": [{"id": "H-001", "description": "Test", "asil": "D"}],
-            "scenarios": [],
-            "safety_goals": [{"id": "SG-001", "description": "Test", "asil": "D"}],
-            "relationships": {"MITIGATED_BY": [["H-001", "SG-001"]]}
-        })
-
-        api_client.post("/import/requirements", json={
-            "fsrs": [{"id": "FSR-001", "text": "Test", "asil": "D", "status": "approved"}],
-            "tsrs": [{"id": "TSR-001", "text": "Test", "asil": "D", "status": "approved",
-                     "verification_method": "Test"}],
-            "components": [],
-            "relationships": {
-                "REFINED_TO": [["SG-001", "FSR-001"], ["FSR-001", "TSR-001"]]
-            }
-        })
-
-        api_client.post("/import/tests", json={
-            "test_cases": [{"id": "TC-001", "name": "Test", "test_type": "unit", "status": "passed"}],
-            "relationships": {"VERIFIED_BY": [["TSR-001", "TC-001"]]}
-        })
-
-        response = api_client.get("/analytics/traceability/hazard/H-001")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) >= 1
-
-    def test_get_requirement_traceability(self, api_client, clean_database):
+    def test_get_requirement_traceability(self, api_client, seed_graph):
         """Test getting requirement traceability."""
         # Create requirement with upstream/downstream links
-        api_client.post("/import/hara", json={
-            "hazards": [],
-            "scenarios": [],
-            "safety_goals": [{"id": "SG-001", "description": "Test", "asil": "D"}],
-            "relationships": {}
-        })
-
-        api_client.post("/import/requirements", json={
-            "fsrs": [{"id": "FSR-001", "text": "Test", "asil": "D", "status": "approved"}],
-            "tsrs": [{"id": "TSR-001", "text": "Test", "asil": "D", "status": "approved",
-                     "verification_method": "Test"}],
-            "components": [],
-            "relationships": {
-                "REFINED_TO": [["SG-001", "FSR-001"], ["FSR-001", "TSR-001"]]
-            }
-        })
+        seed_graph(
+            nodes={
+                "SafetyGoal": [{"id": "SG-001", "description": "Test", "asil": "D"}],
+                "FunctionalSafetyRequirement": [{"id": "FSR-001", "text": "Test", "asil": "D", "status": "approved"}],
+                "TechnicalSafetyRequirement": [{"id": "TSR-001", "text": "Test", "asil": "D", "status": "approved",
+                                                "verification_method": "Test"}],
+            },
+            relationships={"REFINED_TO": [["SG-001", "FSR-001"], ["FSR-001", "TSR-001"]]},
+        )
 
         response = api_client.get("/analytics/traceability/requirement/FSR-001")
 
@@ -288,15 +319,10 @@ class TestTraceabilityAPI:
 class TestStatisticsAPI:
     """Test cases for statistics API."""
 
-    def test_get_database_statistics(self, api_client, clean_database):
+    def test_get_database_statistics(self, api_client, seed_graph):
         """Test getting database statistics."""
         # Create some data
-        api_client.post("/import/hara", json={
-            "hazards": [{"id": "H-001", "description": "Test", "asil": "D"}],
-            "scenarios": [],
-            "safety_goals": [],
-            "relationships": {}
-        })
+        seed_graph(nodes={"Hazard": [{"id": "H-001", "description": "Test", "asil": "D"}]})
 
         response = api_client.get("/analytics/statistics")
 
@@ -314,24 +340,35 @@ class TestStatisticsAPI:
         data = response.json()
         assert data["status"] == "success"
 
+    def test_get_dashboard(self, api_client, seed_graph):
+        """Test getting counts and coverage in one call."""
+        seed_graph(nodes={"Hazard": [{"id": "H-001", "description": "Test", "asil": "D"}]})
+
+        response = api_client.get("/analytics/dashboard")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["node_counts"]["Hazard"] == 1
+        assert "relationship_counts" in data
+        assert data["coverage"]["total_hazards"] == 1
+
 
 @pytest.mark.integration
 @pytest.mark.api
 class TestSearchAndFilterAPI:
     """Test cases for search and filter API."""
 
-    def test_search_hazards(self, api_client, clean_database):
+    def test_search_hazards(self, api_client, seed_graph):
         """Test searching hazards by text."""
-        api_client.post("/import/hara", json={
-            "hazards": [
-                {"id": "H-001", "description": "Unintended acceleration", "asil": "D"},
-                {"id": "H-002", "description": "Loss of braking", "asil": "D"},
-                {"id": "H-003", "description": "Steering failure", "asil": "C"}
-            ],
-            "scenarios": [],
-            "safety_goals": [],
-            "relationships": {}
-        })
+        seed_graph(
+            nodes={
+                "Hazard": [
+                    {"id": "H-001", "description": "Unintended acceleration", "asil": "D"},
+                    {"id": "H-002", "description": "Loss of braking", "asil": "D"},
+                    {"id": "H-003", "description": "Steering failure", "asil": "C"}
+                ],
+            },
+        )
 
         response = api_client.get("/analytics/search/hazards?q=acceleration")
 
@@ -340,17 +377,16 @@ class TestSearchAndFilterAPI:
         assert "results" in data
         assert data["count"] >= 1
 
-    def test_search_components(self, api_client, clean_database):
+    def test_search_components(self, api_client, seed_graph):
         """Test searching components by text."""
-        api_client.post("/import/fmea", json={
-            "components": [
-                {"id": "C-001", "name": "Inverter Module", "component_type": "hardware"},
-                {"id": "C-002", "name": "Control Software", "component_type": "software"}
-            ],
-            "failure_modes": [],
-            "fmea_entries": [],
-            "relationships": {}
-        })
+        seed_graph(
+            nodes={
+                "Component": [
+                    {"id": "C-001", "name": "Inverter Module", "component_type": "hardware"},
+                    {"id": "C-002", "name": "Control Software", "component_type": "software"}
+                ],
+            },
+        )
 
         response = api_client.get("/analytics/search/components?q=Inverter")
 
@@ -359,40 +395,11 @@ class TestSearchAndFilterAPI:
         assert "results" in data
         assert data["count"] >= 1
 
-    def test_filter_hazards_by_asil(self, api_client, clean_database):
-        """Test filtering hazards by ASIL level."""
-        api_client.post("/import/hara", json={
-            "hazards": [
-                {"id": "H-D1", "description": "ASIL D hazard 1", "asil": "D"},
-                {"id": "H-D2", "description": "ASIL D hazard 2", "asil": "D"},
-                {"id": "H-C", "description": "ASIL C hazard", "asil": "C"},
-                {"id": "H-A", "description": "ASIL A hazard", "asil": "A"}
-            ],
-            "scenarios": [],
-            "safety_goals": [],
-            "relationships": {}
-        })
-
-        response = api_client.get("/analytics/filter/hazards?asil=D")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "results" in data
-        assert data["count"] == 2
-
-    def test_search_with_limit(self, api_client, clean_database):
+    @pytest.mark.slow
+    def test_search_with_limit(self, api_client, seed_numbered):
         """Test search with limit parameter."""
         # Create many hazards
-        hazards = [
-            {"id": f"H-{i:03d}", "description": f"Test hazard {i}", "asil": "D"}
-            for i in range(1, 51)
-        ]
-        api_client.post("/import/hara", json={
-            "hazards": hazards,
-            "scenarios": [],
-            "safety_goals": [],
-            "relationships": {}
-        })
+        seed_numbered("Hazard", 50, "H-", numbered={"description": "Test hazard "}, asil="D")
 
         response = api_client.get("/analytics/search/hazards?q=Test&limit=10")
 
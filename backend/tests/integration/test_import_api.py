@@ -4,15 +4,29 @@ Integration tests for import API endpoints.
 
 import pytest
 
+from app.services.defects_import import DefectsImportService
+
+
+def post_json(client, path: str, body: bytes):
+    """POST an already-encoded JSON body."""
+    return client.post(path, content=body, headers={"content-type": "application/json"})
+
+
+def post_ok(client, path: str, payload: dict, expect: int = 201):
+    """POST a setup payload and assert the expected status; the body is left unparsed."""
+    response = client.post(path, json=payload)
+    assert response.status_code == expect, response.text
+    return response
+
 
 @pytest.mark.integration
 @pytest.mark.api
 class TestHARAImportAPI:
     """Test cases for HARA import API endpoint."""
 
-    def test_import_hara_success(self, api_client, clean_database, sample_hara_import):
+    def test_import_hara_success(self, api_client, clean_database, sample_hara_import_body):
         """Test successful HARA import via API."""
-        response = api_client.post("/import/hara", json=sample_hara_import)
+        response = post_json(api_client, "/import/hara", sample_hara_import_body)
 
         assert response.status_code == 201
         data = response.json()
@@ -22,8 +36,8 @@ class TestHARAImportAPI:
         assert data["data"]["safety_goals_created"] == 1
         assert data["data"]["relationships_created"] == 2
 
-    def test_import_hara_validation_error(self, api_client, clean_database):
-        """Test HARA import with invalid data."""
+    def test_import_hara_validation_error(self, api_client):
+        """Test HARA import with invalid data is rejected with 422."""
         invalid_data = {
             "hazards": [
                 {
@@ -41,7 +55,7 @@ class TestHARAImportAPI:
 
         assert response.status_code == 422  # Validation error
 
-    def test_import_hara_empty_data(self, api_client, clean_database):
+    def test_import_hara_empty_data(self, api_client):
         """Test HARA import with empty dataset."""
         empty_data = {
             "hazards": [],
@@ -63,9 +77,9 @@ class TestHARAImportAPI:
 class TestFMEAImportAPI:
     """Test cases for FMEA import API endpoint."""
 
-    def test_import_fmea_success(self, api_client, clean_database, sample_fmea_import):
+    def test_import_fmea_success(self, api_client, clean_database, sample_fmea_import_body):
         """Test successful FMEA import via API."""
-        response = api_client.post("/import/fmea", json=sample_fmea_import)
+        response = post_json(api_client, "/import/fmea", sample_fmea_import_body)
 
         assert response.status_code == 201
         data = response.json()
@@ -75,22 +89,22 @@ class TestFMEAImportAPI:
         assert data["data"]["fmea_entries_created"] == 1
         assert data["data"]["relationships_created"] == 2
 
-    def test_import_fmea_duplicate_component(self, api_client, clean_database, sample_fmea_import):
+    def test_import_fmea_duplicate_component(self, api_client, clean_database, sample_fmea_import_body):
         """Test FMEA import with duplicate component (should skip)."""
         # First import
-        response1 = api_client.post("/import/fmea", json=sample_fmea_import)
+        response1 = post_json(api_client, "/import/fmea", sample_fmea_import_body)
         assert response1.status_code == 201
 
         # Second import with same component
-        response2 = api_client.post("/import/fmea", json=sample_fmea_import)
+        response2 = post_json(api_client, "/import/fmea", sample_fmea_import_body)
         assert response2.status_code == 201
 
         # Component should be skipped on second import
         data2 = response2.json()
         assert data2["data"]["components_created"] == 0  # Skipped
 
-    def test_import_fmea_rpn_validation(self, api_client, clean_database):
-        """Test FMEA import with invalid RPN."""
+    def test_import_fmea_rpn_validation(self, api_client):
+        """Test FMEA import with invalid RPN is rejected with 422."""
         invalid_data = {
             "components": [],
             "failure_modes": [],
@@ -113,6 +127,42 @@ class TestFMEAImportAPI:
         assert response.status_code == 422  # Validation error
 
 
+@pytest.mark.integration
+@pytest.mark.api
+class TestImportValidationAPI:
+    """Test cases for the dry-run validation endpoints (no database writes)."""
+
+    def test_validate_hara_success(self, api_client, sample_hara_import_body):
+        """Test a valid HARA payload reports its entry counts."""
+        response = post_json(api_client, "/import/hara/validate", sample_hara_import_body)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["data"] == {
+            "hazards": 2,
+            "scenarios": 1,
+            "safety_goals": 1,
+            "relationships": 2,
+        }
+
+    def test_validate_hara_invalid(self, api_client):
+        """Test an invalid HARA payload is rejected with 422."""
+        response = api_client.post("/import/hara/validate", json={
+            "hazards": [{"id": "INVALID_ID", "description": "Test", "asil": "Z"}]
+        })
+
+        assert response.status_code == 422
+
+    def test_validate_fmea_invalid_rpn(self, api_client):
+        """Test an FMEA payload with RPN above 1000 is rejected with 422."""
+        response = api_client.post("/import/fmea/validate", json={
+            "fmea_entries": [{"id": "FMEA-TEST-001", "rpn": 1500}]
+        })
+
+        assert response.status_code == 422
+
+
 @pytest.mark.integration
 @pytest.mark.api
 class TestRequirementsImportAPI:
@@ -133,7 +183,7 @@ class TestRequirementsImportAPI:
             ],
             "relationships": {}
         }
-        api_client.post("/import/hara", json=hara_data)
+        post_ok(api_client, "/import/hara", hara_data)
 
         # Now import requirements
         req_data = {
@@ -195,7 +245,7 @@ class TestTestsImportAPI:
             "components": [],
             "relationships": {}
         }
-        api_client.post("/import/requirements", json=req_data)
+        post_ok(api_client, "/import/requirements", req_data)
 
         # Now import test cases
         test_data = {
@@ -279,7 +329,7 @@ class TestDefectsImportAPI:
             "fmea_entries": [],
             "relationships": {}
         }
-        api_client.post("/import/fmea", json=fmea_data)
+        post_ok(api_client, "/import/fmea", fmea_data)
 
         # Now import defects
         defect_data = {
@@ -306,6 +356,30 @@ class TestDefectsImportAPI:
         assert data["data"]["defects_created"] == 1
         assert data["data"]["relationships_created"] == 1
 
+    def test_get_defects_by_component(self, neo4j_app_driver, seed_graph):
+        """Test defects are listed for an existing component, none for a clean one."""
+        seed_graph(
+            nodes={
+                "Component": [
+                    {"id": "C-001", "name": "With defect"},
+                    {"id": "C-002", "name": "Without defects"},
+                ],
+                "DefectInstance": [{"id": "D-001", "title": "Test", "severity": "high"}],
+            },
+            relationships={"FOUND_IN": [["D-001", "C-001"]]},
+        )
+        service = DefectsImportService(driver=neo4j_app_driver)
+
+        assert [defect["id"] for defect in service.get_defects_by_component("C-001")] == ["D-001"]
+        assert service.get_defects_by_component("C-002") == []
+
+    def test_get_defects_by_component_not_found(self, neo4j_app_driver, clean_database):
+        """Test an unknown component raises instead of returning no defects."""
+        service = DefectsImportService(driver=neo4j_app_driver)
+
+        with pytest.raises(ValueError, match="C-MISSING not found"):
+            service.get_defects_by_component("C-MISSING")
+
 
 @pytest.mark.integration
 @pytest.mark.api
@@ -315,7 +389,7 @@ class TestCompleteTraceabilityChain:
     def test_import_complete_chain(self, api_client, clean_database):
         """Test importing complete traceability chain from hazard to test."""
         # 1. Import HARA
-        hara_response = api_client.post("/import/hara", json={
+        post_ok(api_client, "/import/hara", {
             "hazards": [
                 {"id": "H-001", "description": "Test hazard", "asil": "D"}
             ],
@@ -327,10 +401,9 @@ class TestCompleteTraceabilityChain:
                 "MITIGATED_BY": [["H-001", "SG-001"]]
             }
         })
-        assert hara_response.status_code == 201
 
         # 2. Import Requirements
-        req_response = api_client.post("/import/requirements", json={
+        post_ok(api_client, "/import/requirements", {
             "fsrs": [
                 {"id": "FSR-001", "text": "Test FSR", "asil": "D", "status": "approved"}
             ],
@@ -346,10 +419,9 @@ class TestCompleteTraceabilityChain:
                 ]
             }
         })
-        assert req_response.status_code == 201
 
         # 3. Import Tests
-        test_response = api_client.post("/import/tests", json={
+        post_ok(api_client, "/import/tests", {
             "test_cases": [
                 {"id": "TC-001", "name": "Test case", "test_type": "unit", "status": "passed"}
             ],
@@ -357,7 +429,6 @@ class TestCompleteTraceabilityChain:
                 "VERIFIED_BY": [["TSR-001", "TC-001"]]
             }
         })
-        assert test_response.status_code == 201
 
         # 4. Verify complete chain exists
         coverage_response = api_client.get("/analytics/coverage/hazard/H-001")
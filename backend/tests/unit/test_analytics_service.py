@@ -0,0 +1,88 @@
+"""
+Unit tests for analytics service helpers.
+"""
+
+import pytest
+from neo4j import RoutingControl
+
+from app.services.analytics_service import AnalyticsService
+from app.services.base_service import BaseService
+
+
+class ImpactDriver:
+    """Driver stub answering the impact traversal for a fixed set of components."""
+
+    def __init__(self, components, write_during_query=False):
+        self.components = set(components)
+        self.write_during_query = write_during_query
+        self.calls = 0
+
+    def execute_query(self, query, parameters=None, as_dicts=False, routing=RoutingControl.WRITE):
+        # Impact is a pure read; it must not be routed to the cluster leader
+        assert routing == RoutingControl.READ
+        self.calls += 1
+        if self.write_during_query:
+            # An import finishing while the traversal runs
+            BaseService._bump_graph_version()
+        component_id = parameters["component_id"]
+        if component_id not in self.components:
+            return []
+        return [{"impact": {"component_id": component_id, "query": self.calls}}]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and end every test with an empty read cache."""
+    BaseService.invalidate_stats_cache()
+    yield
+    BaseService.invalidate_stats_cache()
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestComponentImpactCache:
+    """Test cases for caching of component impact traversals."""
+
+    def test_repeated_lookup_hits_cache(self):
+        """Test a second lookup reuses the first traversal."""
+        driver = ImpactDriver({"C-001"})
+
+        first = AnalyticsService(driver=driver).get_component_impact("C-001")
+        second = AnalyticsService(driver=driver).get_component_impact("C-001")
+
+        assert driver.calls == 1
+        assert second.data["impact"] == first.data["impact"]
+
+    def test_write_invalidates_cached_impact(self):
+        """Test a graph write forces the next lookup to traverse again."""
+        driver = ImpactDriver({"C-001"})
+        service = AnalyticsService(driver=driver)
+        service.get_component_impact("C-001")
+
+        BaseService._bump_graph_version()
+        result = service.get_component_impact("C-001")
+
+        assert driver.calls == 2
+        assert result.data["impact"]["query"] == 2
+
+    def test_traversal_overlapping_a_write_is_not_reused(self):
+        """Test a result computed across a write is not served as current."""
+        driver = ImpactDriver({"C-001"}, write_during_query=True)
+        service = AnalyticsService(driver=driver)
+
+        service.get_component_impact("C-001")
+        driver.write_during_query = False
+        service.get_component_impact("C-001")
+
+        assert driver.calls == 2
+
+    def test_unknown_component_is_not_cached(self):
+        """Test a missing component raises every time instead of being cached."""
+        driver = ImpactDriver(set())
+        service = AnalyticsService(driver=driver)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                service.get_component_impact("C-404")
+
+        assert driver.calls == 2
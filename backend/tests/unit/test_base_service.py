@@ -0,0 +1,421 @@
+"""
+Unit tests for base service helpers.
+"""
+
+import pytest
+
+from app.db import queries
+from app.models.nodes import HazardNode
+from app.services.base_service import BaseService, cached
+
+
+class CountingService(BaseService):
+    """Service with a cached method that counts its invocations."""
+
+    calls = 0
+
+    @cached(ttl=60.0)
+    def get_value(self, key=None):
+        CountingService.calls += 1
+        return CountingService.calls
+
+
+@pytest.fixture
+def counting_service():
+    """Counting service backed by a dummy driver."""
+    BaseService.invalidate_stats_cache()
+    CountingService.calls = 0
+    yield CountingService(driver=object())
+    BaseService.invalidate_stats_cache()
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestCachedDecorator:
+    """Test cases for the TTL cache helper."""
+
+    def test_repeated_calls_hit_cache(self, counting_service):
+        """Test a second call within the TTL reuses the first result."""
+        assert counting_service.get_value() == 1
+        assert counting_service.get_value() == 1
+
+    def test_cache_shared_across_instances(self, counting_service):
+        """Test a new service instance sees the cached value."""
+        counting_service.get_value()
+
+        assert CountingService(driver=counting_service.driver).get_value() == 1
+
+    def test_cache_scoped_to_driver(self, counting_service):
+        """Test services on another driver (database) do not share results."""
+        counting_service.get_value()
+
+        assert CountingService(driver=object()).get_value() == 2
+
+    def test_full_cache_evicts_expired_then_oldest(self, counting_service, monkeypatch):
+        """Test inserting into a full cache drops expired, then oldest, entries."""
+        monkeypatch.setattr(BaseService, "_cache_max_entries", 2)
+        counting_service._cached("expired", -1.0, lambda: "x")
+        counting_service._cached("old", 60.0, lambda: "y")
+
+        counting_service._cached("new", 60.0, lambda: "z")
+        assert len(BaseService._cache) == 2
+        assert "expired" not in {key for _, _, key in BaseService._cache}
+
+        counting_service._cached("newer", 60.0, lambda: "w")
+        assert {key for _, _, key in BaseService._cache} == {"new", "newer"}
+
+    def test_arguments_are_part_of_key(self, counting_service):
+        """Test different arguments are cached separately."""
+        assert counting_service.get_value(["C", "D"]) == 1
+        assert counting_service.get_value(["A"]) == 2
+        assert counting_service.get_value(["C", "D"]) == 1
+
+    def test_graph_write_invalidates_cache(self, counting_service):
+        """Test bumping the graph version clears cached results."""
+        version = counting_service.graph_version
+        counting_service.get_value()
+
+        BaseService._bump_graph_version()
+
+        assert counting_service.graph_version == version + 1
+        assert counting_service.get_value() == 2
+
+
+class FakeDriver:
+    """Driver stub answering the existence query from a fixed set of IDs."""
+
+    def __init__(self, present):
+        self.present = set(present)
+        self.calls = []
+        self.queries = []
+
+    def execute_query(self, query, parameters=None):
+        self.calls.append(parameters)
+        self.queries.append(query)
+        ids = parameters["ids"]
+        return [{"present": [node_id for node_id in ids if node_id in self.present]}]
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestExistsSet:
+    """Test cases for batched node existence checks."""
+
+    def test_returns_only_present_ids(self):
+        """Test one query reports which IDs exist."""
+        driver = FakeDriver({"C-001", "C-003"})
+        service = BaseService(driver=driver)
+
+        assert service._exists_set(["C-001", "C-002", "C-003"]) == {"C-001", "C-003"}
+        assert len(driver.calls) == 1
+
+    def test_empty_input_skips_query(self):
+        """Test no query is sent for an empty ID list."""
+        driver = FakeDriver(set())
+
+        assert BaseService(driver=driver)._exists_set([]) == set()
+        assert driver.calls == []
+
+    def test_node_exists_wraps_exists_set(self):
+        """Test the single-ID check uses the batched query."""
+        service = BaseService(driver=FakeDriver({"H-001"}))
+
+        assert service._node_exists("H-001")
+        assert not service._node_exists("H-002")
+
+    def test_label_scopes_the_lookup(self):
+        """Test passing a label sends the label-scoped query."""
+        driver = FakeDriver({"C-001"})
+
+        assert BaseService(driver=driver)._exists_set(["C-001"], "Component") == {"C-001"}
+        assert driver.queries == [queries.existing_node_ids_query("Component")]
+
+
+def hazard(hazard_id, severity=None):
+    """Hazard node model with only the fields these tests care about."""
+    return HazardNode(id=hazard_id, description="Test hazard", asil="D", severity=severity)
+
+
+def counters(**values):
+    """Stand-in for neo4j SummaryCounters with the given counts."""
+    fields = {"nodes_created": 0, "relationships_created": 0, **values}
+    return type("Counters", (), fields)()
+
+
+class WriteDriver:
+    """
+    Driver stub recording columnar writes; any statement touching H-BAD fails.
+
+    It deliberately has no per-row write method, so a fallback that leaves
+    the columnar statement fails the test instead of passing silently.
+    """
+
+    def __init__(self):
+        self.writes = []
+
+    def execute_write_counters(self, query, parameters=None):
+        assert "UNWIND range(0, $count - 1)" in query
+        self.writes.append(parameters)
+        if "H-BAD" in parameters["columns"][0]:
+            raise RuntimeError("bad row in batch")
+        return counters(nodes_created=parameters["count"])
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestBulkCreateNodes:
+    """Test cases for UNWIND-based node creation."""
+
+    def test_single_statement_for_all_rows(self):
+        """Test every row is sent in one columnar write."""
+        driver = WriteDriver()
+        rows = [hazard("H-001"), hazard("H-002", severity=3)]
+
+        count = BaseService(driver=driver)._bulk_create_nodes(rows, "Hazard")
+
+        assert count == 2
+        assert len(driver.writes) == 1
+        parameters = driver.writes[0]
+        assert parameters["count"] == 2
+        assert ["H-001", "H-002"] in parameters["columns"]
+        assert [None, 3] in parameters["columns"]
+
+    def test_large_inputs_are_chunked(self):
+        """Test nodes are written one chunk per statement from any iterable."""
+        driver = WriteDriver()
+        service = BaseService(driver=driver)
+        service.import_chunk_size = 2
+
+        rows = (hazard(f"H-{index:03d}") for index in range(5))
+        count = service._bulk_create_nodes(rows, "Hazard")
+
+        assert count == 5
+        assert [parameters["count"] for parameters in driver.writes] == [2, 2, 1]
+
+    def test_bisects_on_failure(self):
+        """Test a failed bulk write is bisected and only the bad row is lost."""
+        driver = WriteDriver()
+        rows = [hazard("H-001"), hazard("H-BAD", severity=3), hazard("H-003")]
+
+        count = BaseService(driver=driver)._bulk_create_nodes(rows, "Hazard")
+
+        assert count == 2
+        # whole chunk, then [H-001] alone, then [H-BAD, H-003] split into single rows;
+        # isolated rows stay columnar, so absent optional fields are just null
+        assert [parameters["columns"][0] for parameters in driver.writes] == [
+            ["H-001", "H-BAD", "H-003"], ["H-001"], ["H-BAD", "H-003"], ["H-BAD"], ["H-003"]
+        ]
+
+    def test_good_half_written_in_one_statement(self):
+        """Test the half without a bad row is still written as one batch."""
+        driver = WriteDriver()
+        rows = [hazard("H-001"), hazard("H-002"), hazard("H-003"), hazard("H-BAD")]
+
+        count = BaseService(driver=driver)._bulk_create_nodes(rows, "Hazard")
+
+        assert count == 3
+        assert [parameters["count"] for parameters in driver.writes] == [4, 2, 2, 1, 1]
+        assert driver.writes[1]["columns"][0] == ["H-001", "H-002"]
+
+
+class RelationshipDriver:
+    """Driver stub counting relationship writes; batches touching a bad source fail."""
+
+    def __init__(self, bad_sources=()):
+        self.bad_sources = set(bad_sources)
+        self.writes = []
+
+    def execute_write_counters(self, query, parameters=None):
+        self.writes.append(parameters)
+        if "pairs" in parameters:
+            sources = [source for source, _ in parameters["pairs"]]
+        else:
+            sources = parameters["sources"]
+        if any(source in self.bad_sources for source in sources):
+            raise RuntimeError("bad pair")
+        return counters(relationships_created=len(sources))
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestBulkCreateRelationships:
+    """Test cases for UNWIND-based relationship creation."""
+
+    pairs = [["H-001", "SG-001"], ["H-002", "SG-001"]]
+
+    def test_one_write_per_type(self):
+        """Test all pairs of a type are sent in a single write."""
+        driver = RelationshipDriver()
+
+        count = BaseService(driver=driver)._bulk_create_relationships("MITIGATED_BY", self.pairs)
+
+        assert count == 2
+        assert len(driver.writes) == 1
+        assert driver.writes[0]["pairs"] == self.pairs
+
+    def test_pairs_are_chunked(self):
+        """Test long pair lists are written one chunk per statement."""
+        driver = RelationshipDriver()
+        service = BaseService(driver=driver)
+        service.import_chunk_size = 1
+
+        assert service._bulk_create_relationships("MITIGATED_BY", self.pairs) == 2
+        assert [write["pairs"] for write in driver.writes] == [self.pairs[:1], self.pairs[1:]]
+
+    def test_bisects_failed_chunk(self):
+        """Test a failed chunk is split until only the bad pair is lost."""
+        driver = RelationshipDriver(bad_sources={"H-003"})
+        pairs = [["H-001", "SG-001"], ["H-002", "SG-001"], ["H-003", "SG-001"], ["H-004", "SG-001"]]
+
+        count = BaseService(driver=driver)._bulk_create_relationships("MITIGATED_BY", pairs)
+
+        assert count == 3
+        # whole chunk, first half, second half, then each pair of the bad half
+        assert len(driver.writes) == 5
+
+    def test_unknown_type_failure_is_bisected(self):
+        """Test a failed unknown-type batch is split until only the bad edge is lost."""
+        driver = RelationshipDriver(bad_sources={"H-002"})
+
+        count = BaseService(driver=driver)._bulk_create_relationships("CUSTOM_LINK", self.pairs)
+
+        assert count == 1
+        # whole batch, then each edge on its own
+        assert [write["sources"] for write in driver.writes] == [
+            ["H-001", "H-002"], ["H-001"], ["H-002"]
+        ]
+
+
+class CountersDriver:
+    """Driver stub answering MERGE writes with server-style counters."""
+
+    def __init__(self, existing, bad_ids=()):
+        self.existing = set(existing)
+        self.bad_ids = set(bad_ids)
+        self.calls = 0
+
+    def execute_write_counters(self, query, parameters=None):
+        self.calls += 1
+        if any(row["id"] in self.bad_ids for row in parameters["rows"]):
+            raise RuntimeError("bad row")
+        created = {row["id"] for row in parameters["rows"]} - self.existing
+        self.existing |= created
+        return counters(nodes_created=len(created))
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestBulkMergeNodes:
+    """Test cases for UNWIND ... MERGE upserts."""
+
+    def test_counts_only_new_nodes(self):
+        """Test the created count comes from the server counters."""
+        driver = CountersDriver({"H-001"})
+        rows = [hazard("H-001"), hazard("H-002"), hazard("H-002")]
+
+        count = BaseService(driver=driver)._bulk_merge_nodes("MERGE", rows, "Hazard")
+
+        assert count == 1
+        assert driver.calls == 1
+
+    def test_bad_row_only_loses_itself(self):
+        """Test a failing merge is bisected so the other rows still land."""
+        driver = CountersDriver(set(), bad_ids={"H-002"})
+        rows = [hazard("H-001"), hazard("H-002"), hazard("H-003")]
+
+        count = BaseService(driver=driver)._bulk_merge_nodes("MERGE", rows, "Hazard")
+
+        assert count == 2
+        assert driver.existing == {"H-001", "H-003"}
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestRunPhasesConcurrently:
+    """Test cases for running independent import phases together."""
+
+    def test_collects_counts_and_skips_empty_phases(self):
+        """Test each non-empty phase reports its count under its key."""
+        service = BaseService(driver=object())
+        called = []
+
+        def phase(items):
+            called.append(items)
+            return len(items)
+
+        stats = service._run_phases_concurrently({
+            "hazards_created": (phase, ["H-001", "H-002"]),
+            "scenarios_created": (phase, []),
+            "safety_goals_created": (phase, ["SG-001"]),
+        })
+
+        assert stats == {"hazards_created": 2, "safety_goals_created": 1}
+        assert len(called) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestDedupeRelationships:
+    """Test cases for dropping repeated relationship pairs."""
+
+    def test_keeps_first_occurrence_per_type(self):
+        """Test duplicates are dropped per type, in order, and counted."""
+        service = BaseService(driver=object())
+
+        deduped, dropped = service._dedupe_relationships({
+            "MITIGATED_BY": [["H-001", "SG-001"], ["H-002", "SG-001"], ["H-001", "SG-001"]],
+            "OCCURS_IN": [["H-001", "SC-001"]],
+        })
+
+        assert deduped == {
+            "MITIGATED_BY": [("H-001", "SG-001"), ("H-002", "SG-001")],
+            "OCCURS_IN": [("H-001", "SC-001")],
+        }
+        assert dropped == 1
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestBulkCreateRelationshipTypes:
+    """Test cases for creating relationship types in parallel."""
+
+    def test_counts_per_type(self):
+        """Test every non-empty type is written and counted separately."""
+        driver = RelationshipDriver()
+
+        counts = BaseService(driver=driver)._bulk_create_relationship_types({
+            "MITIGATED_BY": [["H-001", "SG-001"], ["H-002", "SG-001"]],
+            "OCCURS_IN": [["H-001", "SC-001"]],
+            "VERIFIED_BY": [],
+        })
+
+        assert counts == {"MITIGATED_BY": 2, "OCCURS_IN": 1}
+        assert len(driver.writes) == 2
+
+
+class DDLDriver:
+    """Driver stub recording schema statements."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute_query(self, query, parameters=None):
+        self.statements.append(query)
+        return []
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestEnsureIndexesOnce:
+    """Test cases for applying the index DDL once per process."""
+
+    def test_applies_ddl_only_once(self, monkeypatch):
+        """Test the DDL runs on the first import and is skipped afterwards."""
+        monkeypatch.setattr(BaseService, "_indexes_ensured", False)
+        driver = DDLDriver()
+        service = BaseService(driver=driver)
+
+        service._ensure_indexes_once()
+        service._ensure_indexes_once()
+
+        assert len(driver.statements) == len(queries.INDEX_DDL)
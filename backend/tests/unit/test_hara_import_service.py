@@ -2,10 +2,15 @@
 Unit tests for HARA import service.
 """
 
+import asyncio
+
 import pytest
+from pydantic import ValidationError
 
+from app.models.enums import ASILLevel
 from app.models.schemas import HARAImportRequest
 from app.models.nodes import HazardNode, ScenarioNode, SafetyGoalNode
+from app.services.base_service import BaseService
 from app.services.hara_import import HARAImportService
 
 
@@ -14,11 +19,11 @@ from app.services.hara_import import HARAImportService
 class TestHARAImportService:
     """Test cases for HARA import service."""
 
-    def test_service_initialization(self, neo4j_driver):
+    def test_service_initialization(self, neo4j_app_driver):
         """Test service can be initialized."""
-        service = HARAImportService(driver=neo4j_driver)
+        service = HARAImportService(driver=neo4j_app_driver)
         assert service is not None
-        assert service.driver == neo4j_driver
+        assert service.driver == neo4j_app_driver
 
     def test_import_hazards_only(self, clean_database, neo4j_driver):
         """Test importing only hazards."""
@@ -87,12 +92,27 @@ class TestHARAImportService:
         assert result.data["safety_goals_created"] == 1
         assert result.data["relationships_created"] == 2
 
+    def test_import_sample_hara(self, clean_database, neo4j_driver, sample_hara_request):
+        """Test importing the shared sample HARA request."""
+        service = HARAImportService(driver=neo4j_driver)
+
+        result = service.import_hara(sample_hara_request)
+
+        assert result.status == "success"
+        assert result.data["hazards_created"] == 2
+        assert result.data["scenarios_created"] == 1
+        assert result.data["safety_goals_created"] == 1
+        assert result.data["relationships_created"] == 2
+
     def test_import_multiple_hazards(self, clean_database, neo4j_driver):
         """Test importing multiple hazards."""
         service = HARAImportService(driver=neo4j_driver)
 
+        # Trusted payload: skip field validation, this test is about the service
         hazards = [
-            HazardNode(id=f"H-TEST-{i:03d}", description=f"Test hazard {i}", asil="D")
+            HazardNode.model_construct(
+                id=f"H-TEST-{i:03d}", description=f"Test hazard {i}", asil=ASILLevel.D
+            )
             for i in range(1, 6)
         ]
 
@@ -132,13 +152,11 @@ class TestHARAImportService:
         assert result.status == "success"
         assert result.data["hazards_created"] == 5
 
-    def test_import_validates_safety_goal_asil(self, clean_database, neo4j_driver):
+    def test_import_validates_safety_goal_asil(self):
         """Test that safety goals cannot have ASIL QM."""
-        service = HARAImportService(driver=neo4j_driver)
-
-        # Safety goal with QM should fail validation at Pydantic level
-        with pytest.raises(Exception):  # Pydantic ValidationError
-            request = HARAImportRequest(
+        # Rejected at the Pydantic level, before any service or database call
+        with pytest.raises(ValidationError):
+            HARAImportRequest(
                 hazards=[],
                 scenarios=[],
                 safety_goals=[
@@ -151,9 +169,10 @@ class TestHARAImportService:
                 relationships={}
             )
 
-    def test_import_empty_request(self, clean_database, neo4j_driver):
+    def test_import_empty_request(self, neo4j_app_driver):
         """Test importing empty request."""
-        service = HARAImportService(driver=neo4j_driver)
+        # Nothing is written or read back, so no clean database is needed
+        service = HARAImportService(driver=neo4j_app_driver)
 
         request = HARAImportRequest(
             hazards=[],
@@ -224,17 +243,89 @@ class TestHARAImportService:
         result = service.import_hara(request)
         assert result.status == "success"
 
-        # Verify relationships exist in database
+        # Verify relationships exist in database (one round trip, booleans only)
         query = """
-        MATCH (h:Hazard {id: 'H-TEST-001'})-[:MITIGATED_BY]->(sg:SafetyGoal {id: 'SG-TEST-001'})
-        RETURN h, sg
+        RETURN EXISTS {
+            MATCH (:Hazard {id: 'H-TEST-001'})-[:MITIGATED_BY]->(:SafetyGoal {id: 'SG-TEST-001'})
+        } AS mitigated,
+        EXISTS {
+            MATCH (:Hazard {id: 'H-TEST-001'})-[:OCCURS_IN]->(:Scenario {id: 'SC-TEST-001'})
+        } AS occurs
         """
         results = neo4j_driver.execute_query(query)
-        assert len(results) == 1
+        assert results[0]["mitigated"] is True
+        assert results[0]["occurs"] is True
 
-        query = """
-        MATCH (h:Hazard {id: 'H-TEST-001'})-[:OCCURS_IN]->(sc:Scenario {id: 'SC-TEST-001'})
-        RETURN h, sc
-        """
-        results = neo4j_driver.execute_query(query)
-        assert len(results) == 1
+
+class ImportDriver:
+    """Driver stub answering bulk writes with their row counts."""
+
+    def __init__(self):
+        self.writes = []
+
+    def execute_write_counters(self, query, parameters=None):
+        self.writes.append(parameters)
+        if "pairs" in parameters:
+            created = {"nodes_created": 0, "relationships_created": len(parameters["pairs"])}
+        else:
+            created = {"nodes_created": parameters["count"], "relationships_created": 0}
+        return type("Counters", (), created)()
+
+
+def hara_request():
+    """Small HARA request with one of each node type and two relationships."""
+    return HARAImportRequest(
+        hazards=[
+            HazardNode(id="H-TEST-001", description="Test hazard 1", asil="D"),
+            HazardNode(id="H-TEST-002", description="Test hazard 2", asil="C"),
+        ],
+        scenarios=[ScenarioNode(id="SC-TEST-001", name="Test scenario")],
+        safety_goals=[SafetyGoalNode(id="SG-TEST-001", description="Test safety goal", asil="D")],
+        relationships={
+            "OCCURS_IN": [["H-TEST-001", "SC-TEST-001"]],
+            "MITIGATED_BY": [["H-TEST-001", "SG-TEST-001"], ["H-TEST-001", "SG-TEST-001"]],
+        }
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestAsyncHARAImport:
+    """Test cases for the concurrent HARA import (no database)."""
+
+    @pytest.fixture(autouse=True)
+    def indexes_ensured(self, monkeypatch):
+        """Skip the index DDL; the stub driver does not answer it."""
+        monkeypatch.setattr(BaseService, "_indexes_ensured", True)
+
+    def test_aimport_reports_counts(self):
+        """Test awaiting aimport_hara writes every phase and reports its counts."""
+        driver = ImportDriver()
+        service = HARAImportService(driver=driver)
+        service.concurrent_imports = False
+
+        result = asyncio.run(service.aimport_hara(hara_request()))
+
+        assert result.status == "success"
+        assert result.data == {
+            "hazards_created": 2,
+            "scenarios_created": 1,
+            "safety_goals_created": 1,
+            "relationships_created": 2,
+            "duplicate_relationships_dropped": 1,
+        }
+        # one statement per node type plus one per relationship type
+        assert len(driver.writes) == 5
+
+    def test_sync_import_inside_running_loop(self):
+        """Test import_hara also works when called from a running event loop."""
+        service = HARAImportService(driver=ImportDriver())
+        service.concurrent_imports = False
+
+        async def import_from_loop():
+            return service.import_hara(hara_request())
+
+        result = asyncio.run(import_from_loop())
+
+        assert result.data["hazards_created"] == 2
+        assert result.data["relationships_created"] == 2
@@ -0,0 +1,63 @@
+"""
+Unit tests for the Neo4j driver manager.
+"""
+
+import asyncio
+
+import pytest
+
+from app.db.neo4j_driver import Neo4jDriver
+
+
+async def access(manager):
+    """Touch the async driver from the running loop."""
+    return manager.async_driver
+
+
+@pytest.mark.unit
+class TestAsyncDriverLoop:
+    """Test cases for binding the async driver to one event loop."""
+
+    @pytest.fixture
+    def owner_loop(self):
+        """Event loop that opens (and finally closes) the async driver."""
+        loop = asyncio.new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.fixture
+    def manager(self, owner_loop):
+        """Driver manager with no sync connection (bypasses the singleton)."""
+        manager = object.__new__(Neo4jDriver)
+        yield manager
+        # Close on the loop the driver belongs to
+        if manager._async_driver is not None:
+            owner_loop.run_until_complete(manager.close_async())
+
+    def test_reuses_driver_on_same_loop(self, manager, owner_loop):
+        """Test repeated access from one loop returns the same driver."""
+        first = owner_loop.run_until_complete(access(manager))
+        second = owner_loop.run_until_complete(access(manager))
+
+        assert first is second
+
+    def test_rejects_second_loop(self, manager, owner_loop):
+        """Test another loop cannot silently replace (and leak) the open driver."""
+        first = owner_loop.run_until_complete(access(manager))
+
+        with pytest.raises(RuntimeError, match="another event loop"):
+            asyncio.run(access(manager))
+        assert manager._async_driver is first
+
+    def test_new_loop_allowed_after_close(self, manager, owner_loop):
+        """Test closing on the owning loop frees the manager for a new loop."""
+        owner_loop.run_until_complete(access(manager))
+        owner_loop.run_until_complete(manager.close_async())
+
+        async def access_and_close():
+            driver = manager.async_driver
+            await manager.close_async()
+            return driver
+
+        assert asyncio.run(access_and_close()) is not None
+        assert manager._async_driver is None
@@ -0,0 +1,248 @@
+"""
+Unit tests for Cypher query helpers.
+"""
+
+import pytest
+
+from app.db import queries
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestBuildBatchRelationships:
+    """Test cases for the relationship batch payload builder."""
+
+    def test_splits_into_parallel_lists(self):
+        """Test each tuple field lands at the same index of its own list."""
+        batch = queries.build_batch_relationships([
+            ("H-001", "SG-001", "MITIGATED_BY", {"rationale": "primary"}),
+            ("H-002", "SC-001", "OCCURS_IN", None),
+        ])
+
+        assert batch == {
+            "sources": ["H-001", "H-002"],
+            "targets": ["SG-001", "SC-001"],
+            "rel_types": ["MITIGATED_BY", "OCCURS_IN"],
+            "properties": [{"rationale": "primary"}, {}],
+        }
+
+    def test_empty_batch(self):
+        """Test an empty batch yields empty lists."""
+        batch = queries.build_batch_relationships([])
+
+        assert all(values == [] for values in batch.values())
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestBatchCreateRelationshipsQuery:
+    """Test cases for the static relationship batch query builder."""
+
+    def test_known_type_is_written_into_query(self):
+        """Test a whitelisted type becomes a literal CREATE."""
+        query = queries.batch_create_relationships_query("MITIGATED_BY")
+
+        assert "CREATE (a)-[r:MITIGATED_BY]->(b)" in query
+        assert "apoc" not in query
+
+    def test_endpoints_matched_by_label(self):
+        """Test endpoints are looked up through their labels' id indexes."""
+        query = queries.batch_create_relationships_query("MITIGATED_BY")
+
+        assert "MATCH (a:Hazard {id: $sources[i]})" in query
+        assert "MATCH (b:SafetyGoal {id: $targets[i]})" in query
+
+    def test_unknown_type_rejected(self):
+        """Test types outside the whitelist are never spliced into Cypher."""
+        with pytest.raises(ValueError):
+            queries.batch_create_relationships_query("X]->(b) DETACH DELETE b //")
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestBuildFulltextQuery:
+    """Test cases for the full-text search query builder."""
+
+    def test_words_become_prefix_terms(self):
+        """Test every word must match, by prefix."""
+        assert queries.build_fulltext_query("Unintended accel") == "unintended* AND accel*"
+
+    def test_lucene_operators_escaped(self):
+        """Test user text cannot inject Lucene syntax."""
+        assert queries.build_fulltext_query("H-001 (x)") == r"h\-001* AND \(x\)*"
+
+    def test_blank_text(self):
+        """Test whitespace-only text yields an empty query."""
+        assert queries.build_fulltext_query("   ") == ""
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestConcurrentBulkQueries:
+    """Test cases for the CALL ... IN CONCURRENT TRANSACTIONS builders."""
+
+    def test_node_query_merges_on_id(self):
+        """Test the node query merges by id inside concurrent transactions."""
+        query = queries.concurrent_bulk_create_nodes_query("Hazard")
+
+        assert "MERGE (n:Hazard {id: row.id})" in query
+        assert "IN CONCURRENT TRANSACTIONS OF $batch_size ROWS" in query
+
+    def test_counts_only_created_rows(self):
+        """Test matched nodes and edges are not counted as created."""
+        for query in (
+            queries.concurrent_bulk_create_nodes_query("Hazard"),
+            queries.concurrent_bulk_create_relationships_query("MITIGATED_BY"),
+        ):
+            assert "__import_created = true" in query
+            assert "REMOVE" in query
+            assert "count(CASE WHEN created THEN 1 END) AS created_count" in query
+
+    def test_explicit_concurrency(self):
+        """Test a configured concurrency is written into the clause."""
+        query = queries.concurrent_bulk_create_relationships_query("MITIGATED_BY", 4)
+
+        assert "MERGE (a)-[r:MITIGATED_BY]->(b)" in query
+        assert "IN 4 CONCURRENT TRANSACTIONS" in query
+
+    def test_rejects_unknown_names(self):
+        """Test labels and types outside the safe lists are refused."""
+        with pytest.raises(ValueError):
+            queries.concurrent_bulk_create_nodes_query("Hazard) DETACH DELETE (n")
+        with pytest.raises(ValueError):
+            queries.concurrent_bulk_create_relationships_query("NOT_A_TYPE")
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestColumnarNodes:
+    """Test cases for the struct-of-arrays node batch."""
+
+    def test_transposes_rows_with_missing_keys(self):
+        """Test each property becomes one column, None where a row lacks it."""
+        keys, columns = queries.build_node_columns([
+            {"id": "H-001", "asil": "D"},
+            {"id": "H-002", "severity": 3},
+        ])
+
+        assert keys == ["id", "asil", "severity"]
+        assert columns == [["H-001", "H-002"], ["D", None], [None, 3]]
+
+    def test_query_sets_each_column(self):
+        """Test the query assigns properties by column index."""
+        query = queries.columnar_create_nodes_query("Hazard", ["id", "asil"])
+
+        assert "CREATE (n:Hazard)" in query
+        assert "n.id = $columns[0][i]" in query
+        assert "n.asil = $columns[1][i]" in query
+
+    def test_query_built_once_per_key_set(self):
+        """Test the same label and keys return the same cached statement."""
+        query = queries.columnar_create_nodes_query("Hazard", ["id", "asil"])
+
+        assert queries.columnar_create_nodes_query("Hazard", ["id", "asil"]) is query
+
+    def test_rejects_unsafe_property_names(self):
+        """Test keys that are not plain identifiers are refused."""
+        with pytest.raises(ValueError):
+            queries.columnar_create_nodes_query("Hazard", ["id", "x = 1 DETACH DELETE n //"])
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestCreateRelationshipQuery:
+    """Test cases for the per-type single relationship query."""
+
+    def test_known_type_is_literal_and_cached(self):
+        """Test a known type is written into the query and built once."""
+        query = queries.create_relationship_query("MITIGATED_BY")
+
+        assert "CREATE (a)-[r:MITIGATED_BY]->(b)" in query
+        assert "MATCH (a:Hazard {id: $source_id})" in query
+        assert queries.create_relationship_query("MITIGATED_BY") is query
+
+    def test_unknown_type_uses_apoc(self):
+        """Test an unknown type is passed as a parameter, never as Cypher text."""
+        query = queries.create_relationship_query("X]->(b) DETACH DELETE a //")
+
+        assert query is queries.CREATE_RELATIONSHIP_APOC
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestBatchCreateRelationshipPairsQuery:
+    """Test cases for the pair-list relationship batch."""
+
+    def test_reads_endpoints_from_pairs(self):
+        """Test endpoints are taken by position from each pair."""
+        query = queries.batch_create_relationship_pairs_query("OCCURS_IN")
+
+        assert "UNWIND $pairs AS pair" in query
+        assert "MATCH (a:Hazard {id: pair[0]})" in query
+        assert "MATCH (b:Scenario {id: pair[1]})" in query
+        assert "MERGE (a)-[r:OCCURS_IN]->(b)" in query
+        assert queries.batch_create_relationship_pairs_query("OCCURS_IN") is query
+
+    def test_mixed_endpoints_use_label_disjunction(self):
+        """Test a type linking several labels matches any of them."""
+        query = queries.batch_create_relationship_pairs_query("REFINED_TO")
+
+        assert "MATCH (a:SafetyGoal|FunctionalSafetyRequirement {id: pair[0]})" in query
+
+    def test_unmapped_type_matches_without_label(self):
+        """Test a type with no listed endpoints keeps the unlabelled match."""
+        query = queries.batch_create_relationship_pairs_query("CAN_LEAD_TO")
+
+        assert "MATCH (a {id: pair[0]})" in query
+
+    def test_rejects_unknown_type(self):
+        """Test unknown types are refused."""
+        with pytest.raises(ValueError):
+            queries.batch_create_relationship_pairs_query("NOT_A_TYPE")
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestIndexDDL:
+    """Test cases for the index statements bulk imports depend on."""
+
+    def test_bulk_labels_have_id_index(self):
+        """Test every bulk-imported or id-looked-up label has an id index."""
+        for label in queries.ID_INDEXED_LABELS:
+            assert any(
+                f"(n:{label})" in statement and "n.id" in statement
+                for statement in queries.INDEX_DDL
+            ), label
+
+    def test_merged_labels_have_unique_constraint(self):
+        """Test labels written with MERGE batches are backed by a uniqueness constraint."""
+        for label in ("Component", "TestCase"):
+            assert any(
+                f"(n:{label}) REQUIRE n.id IS UNIQUE" in statement
+                for statement in queries.INDEX_DDL
+            ), label
+
+    def test_relationship_endpoints_are_indexed(self):
+        """Test relationship endpoint labels all have an id index."""
+        for rel_type, (sources, targets) in queries.RELATIONSHIP_ENDPOINTS.items():
+            assert rel_type in queries.RELATIONSHIP_TYPES
+            assert set(sources + targets) <= queries.ID_INDEXED_LABELS, rel_type
+
+
+@pytest.mark.unit
+@pytest.mark.db
+class TestLabelledLookupQueries:
+    """Test cases for the label-scoped id lookups."""
+
+    def test_existing_ids_match_on_label(self):
+        """Test the existence check matches through the label."""
+        assert "MATCH (n:Component {id: node_id})" in queries.existing_node_ids_query("Component")
+
+    def test_get_node_matches_on_label(self):
+        """Test the node lookup matches through the label."""
+        assert "MATCH (n:Function {id: $id})" in queries.get_node_query("Function")
+
+    def test_rejects_unknown_label(self):
+        """Test labels without an id index are never spliced into Cypher."""
+        with pytest.raises(ValueError):
+            queries.existing_node_ids_query("Hazard) DETACH DELETE (n")
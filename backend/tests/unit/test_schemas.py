@@ -0,0 +1,98 @@
+"""
+Unit tests for API schemas.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.schemas import (
+    FMEAImportRequest,
+    HARAImportRequest,
+    HazardCoverageSummary,
+)
+
+
+@pytest.mark.unit
+class TestHazardCoverageSummary:
+    """Test cases for the hazard coverage summary."""
+
+    def test_counters_exposed_as_properties(self):
+        """Test counters are readable by name."""
+        summary = HazardCoverageSummary(
+            total=15,
+            full_coverage=10,
+            partial_coverage=3,
+            no_coverage=2
+        )
+
+        assert summary.total == 15
+        assert summary.full_coverage == 10
+        assert summary.partial_coverage == 3
+        assert summary.no_coverage == 2
+
+    def test_serializes_to_named_fields(self):
+        """Test serialization keeps the public field names."""
+        summary = HazardCoverageSummary(
+            total=15,
+            full_coverage=10,
+            partial_coverage=3,
+            no_coverage=2
+        )
+
+        assert summary.model_dump() == {
+            "total": 15,
+            "full_coverage": 10,
+            "partial_coverage": 3,
+            "no_coverage": 2,
+        }
+
+    def test_rejects_negative_counts(self):
+        """Test counters cannot be negative."""
+        with pytest.raises(ValidationError):
+            HazardCoverageSummary(
+                total=1,
+                full_coverage=-1,
+                partial_coverage=0,
+                no_coverage=0
+            )
+
+    def test_json_schema_documents_counters(self):
+        """Test the published schema lists all four counters."""
+        schema = HazardCoverageSummary.model_json_schema()
+
+        assert set(schema["properties"]) == {
+            "total", "full_coverage", "partial_coverage", "no_coverage"
+        }
+        assert schema["properties"]["total"]["minimum"] == 0
+
+
+@pytest.mark.unit
+class TestImportRequestValidation:
+    """Test cases for import payloads rejected before reaching the database."""
+
+    def test_hara_rejects_invalid_hazard(self):
+        """Test a malformed hazard ID and unknown ASIL fail validation."""
+        with pytest.raises(ValidationError) as exc_info:
+            HARAImportRequest.model_validate({
+                "hazards": [{"id": "INVALID_ID", "description": "Test", "asil": "Z"}],
+                "scenarios": [],
+                "safety_goals": [],
+                "relationships": {}
+            })
+
+        locations = {error["loc"] for error in exc_info.value.errors()}
+        assert ("hazards", 0, "id") in locations
+        assert ("hazards", 0, "asil") in locations
+
+    def test_fmea_rejects_rpn_above_limit(self):
+        """Test an RPN above 1000 fails validation."""
+        with pytest.raises(ValidationError) as exc_info:
+            FMEAImportRequest.model_validate({
+                "components": [],
+                "failure_modes": [],
+                "fmea_entries": [{"id": "FMEA-TEST-001", "rpn": 1500}],
+                "relationships": {}
+            })
+
+        locations = {error["loc"] for error in exc_info.value.errors()}
+        assert ("fmea_entries", 0, "rpn") in locations